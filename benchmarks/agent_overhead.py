@@ -0,0 +1,113 @@
+"""Micro-benchmark: per-step framework overhead of the agent loop with FakeLLM.
+
+Times runs without an event sink (the no-op tracer fast path) and runs with a sink that
+discards events (full event construction). Both measure the code on `PYTHONPATH`; to
+compare two revisions, save a run of one and pass it as the baseline of the other:
+
+    git worktree add /tmp/agent-base <revision>
+    PYTHONPATH=/tmp/agent-base/src python benchmarks/agent_overhead.py --save base.json
+    PYTHONPATH=src python benchmarks/agent_overhead.py --baseline base.json
+
+Usage:
+
+    python benchmarks/agent_overhead.py [--runs 2000] [--tool-steps 4]
+        [--save PATH] [--baseline PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import AgentEvent, EventSink
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools.builtin.math_tool import MathAddTool
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+def _discard(event: AgentEvent) -> None:
+    return None
+
+
+def _build_agent(tool_steps: int) -> Agent:
+    tool_call = ToolCallOutput(
+        type="tool_call", tool_name="math.add", args={"a": 1, "b": 2}
+    ).model_dump_json()
+    final = FinalOutput(type="final", content="done").model_dump_json()
+    tools = ToolRegistry()
+    tools.register(MathAddTool())
+    llm = FakeLLM([tool_call] * tool_steps + [final])
+    return Agent(llm=llm, tools=tools, memory=InMemoryMemory(), max_steps=tool_steps + 1)
+
+
+def _per_step_us(elapsed: float, runs: int, tool_steps: int) -> float:
+    return elapsed / (runs * (tool_steps + 1)) * 1e6
+
+
+def _time_sync(runs: int, tool_steps: int, sink: EventSink | None) -> float:
+    agents = [_build_agent(tool_steps) for _ in range(runs)]
+    start = time.perf_counter()
+    for agent in agents:
+        agent.run("go", event_sink=sink)
+    return _per_step_us(time.perf_counter() - start, runs, tool_steps)
+
+
+def _time_async(runs: int, tool_steps: int, sink: EventSink | None) -> float:
+    agents = [_build_agent(tool_steps) for _ in range(runs)]
+
+    async def _run_all() -> float:
+        start = time.perf_counter()
+        for agent in agents:
+            await agent.run_async("go", event_sink=sink)
+        return time.perf_counter() - start
+
+    return _per_step_us(asyncio.run(_run_all()), runs, tool_steps)
+
+
+def _bench(
+    label: str,
+    runs: int,
+    tool_steps: int,
+    sink: EventSink | None,
+    baseline: dict[str, float] | None,
+) -> dict[str, float]:
+    timings = {
+        "run": _time_sync(runs, tool_steps, sink),
+        "run_async": _time_async(runs, tool_steps, sink),
+    }
+    columns = []
+    for name, us in timings.items():
+        column = f"{name}: {us:8.1f} us/step"
+        if baseline is not None and name in baseline:
+            column += f" (baseline {baseline[name]:8.1f}, {baseline[name] / us:4.2f}x)"
+        columns.append(column)
+    print(f"{label:<24} " + "   ".join(columns))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--tool-steps", type=int, default=4)
+    parser.add_argument("--save", type=Path, help="write the timings to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="JSON file from an earlier --save")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {}
+    results = {
+        label: _bench(label, args.runs, args.tool_steps, sink, baseline.get(label))
+        for label, sink in (("event_sink=None", None), ("event_sink=<discard>", _discard))
+    }
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Micro-benchmark: building LM Studio request bodies for long conversations.
+
+Each step appends a tool call and its result to the conversation and builds the
+request body, the way an agent run does. Compares re-encoding the whole payload with
+`json.dumps` against the client's caching `MessagesEncoder`. Usage:
+
+    python benchmarks/lmstudio_payload.py [--steps 50] [--messages 1000 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from ai_agent_orchestrator.protocol.messages import Message
+from task_runner_app.llm import MessagesEncoder, _message_to_dict
+
+
+def _conversation(size: int) -> list[Message]:
+    messages = [Message(role="system", content="You are a task runner assistant. " * 20)]
+    for index in range(1, size):
+        role = "user" if index % 2 else "assistant"
+        messages.append(Message(role=role, content=f"message {index}: " + "lorem ipsum " * 20))
+    return messages
+
+
+def _full_dump(conversation: list[Message]) -> bytes:
+    payload = {"model": "m", "messages": [_message_to_dict(msg) for msg in conversation]}
+    return json.dumps(payload).encode("utf-8")
+
+
+def _incremental(encoder: MessagesEncoder) -> Callable[[list[Message]], bytes]:
+    def _build(conversation: list[Message]) -> bytes:
+        return f'{{"model":"m","messages":{encoder.encode(conversation)}}}'.encode("utf-8")
+
+    return _build
+
+
+def _per_step_ms(build: Callable[[list[Message]], bytes], size: int, steps: int) -> float:
+    conversation = _conversation(size)
+    build(conversation)
+    start = time.perf_counter()
+    for step in range(steps):
+        conversation.append(
+            Message(role="assistant", content=f'{{"type":"tool_call","tool_name":"t{step}"}}')
+        )
+        conversation.append(Message(role="tool", content=f"result {step}", name=f"t{step}"))
+        build(conversation)
+    return (time.perf_counter() - start) / steps * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--messages", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    for size in args.messages:
+        full = _per_step_ms(_full_dump, size, args.steps)
+        incremental = _per_step_ms(_incremental(MessagesEncoder()), size, args.steps)
+        print(
+            f"messages={size:<6} full={full:8.3f} ms/step  incremental={incremental:8.3f} ms/step"
+        )
+
+
+if __name__ == "__main__":
+    main()
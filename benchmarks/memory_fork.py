@@ -0,0 +1,68 @@
+"""Benchmark: speculative branches of one long conversation, forked versus copied.
+
+Builds a session of `--messages` messages, then creates `--branches` branches that each
+add `--added` messages, either with `InMemoryMemory.fork()` or by copying the whole
+conversation into a new memory. Reports time and memory retained by the branches. Usage:
+
+    python benchmarks/memory_fork.py [--messages 10000] [--branches 2000] [--added 4]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List
+
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+
+
+def _copy(memory: InMemoryMemory) -> InMemoryMemory:
+    copied = InMemoryMemory()
+    for message in memory.snapshot():
+        copied.add(message)
+    return copied
+
+
+Brancher = Callable[[InMemoryMemory], InMemoryMemory]
+
+
+def _measure(
+    base: InMemoryMemory, branch: Brancher, args: argparse.Namespace
+) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    branches: List[InMemoryMemory] = []
+    for index in range(args.branches):
+        memory = branch(base)
+        for step in range(args.added):
+            memory.add(Message(role="assistant", content=f"branch {index} step {step}"))
+        memory.snapshot()
+        branches.append(memory)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--branches", type=int, default=2_000)
+    parser.add_argument("--added", type=int, default=4)
+    args = parser.parse_args()
+
+    base = InMemoryMemory()
+    for index in range(args.messages):
+        base.add(Message(role="user" if index % 2 else "tool", content=f"message {index}"))
+
+    for name, branch in (("copy", _copy), ("fork", InMemoryMemory.fork)):
+        elapsed, retained = _measure(base, branch, args)
+        print(
+            f"{name}  {args.branches} branches  {elapsed * 1e6 / args.branches:10.1f} us/branch"
+            f"  {retained:8.1f} MiB retained"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: RetrievalMemory indexing and per-step retrieval with many stored messages.
+
+Fills a memory with `--messages` synthetic tool results, then measures embedding the
+whole backlog once, then the cost of one agent step (add a tool result and select the
+conversation) and of one new user turn, whose query is scored against every older
+message. Requires NumPy. Usage:
+
+    python benchmarks/retrieval_memory.py [--messages 100000] [--steps 200] [--top-k 4]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from ai_agent_orchestrator.memory.retrieval import RetrievalMemory
+from ai_agent_orchestrator.protocol.messages import Message
+
+WORDS = (
+    "config deploy build cache index query table user token error retry timeout file path "
+    "schema commit branch merge test report metric latency queue worker session blob"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) + str(rng.randrange(500)) for _ in range(words))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    memory = RetrievalMemory(top_k=args.top_k)
+    memory.add(Message(role="system", content="You are a helpful agent."))
+    for _ in range(args.messages):
+        memory.add(Message(role="tool", content=_text(rng, 30), name="search"))
+    memory.add(Message(role="user", content=_text(rng, 8)))
+
+    start = time.perf_counter()
+    memory.snapshot()
+    elapsed = time.perf_counter() - start
+    print(
+        f"index  {memory.indexed:>7} messages {elapsed:8.2f} s "
+        f"({memory.indexed / elapsed:,.0f} msgs/s)"
+    )
+
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        memory.add(Message(role="tool", content=_text(rng, 30), name="search"))
+        conversation = memory.snapshot()
+    per_step = (time.perf_counter() - start) / args.steps * 1000
+    print(f"step   {len(conversation):>7} sent     {per_step:8.2f} ms/step")
+
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        memory.add(Message(role="user", content=_text(rng, 8)))
+        memory.snapshot()
+    per_turn = (time.perf_counter() - start) / args.steps * 1000
+    print(f"turn   {memory.indexed:>7} scored   {per_turn:8.2f} ms/turn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Throughput benchmark: SQLiteMemory with many concurrent sessions.
+
+Each session runs `--steps` agent-like steps from a thread pool: read the conversation,
+then add an assistant message and a tool result. Compares committing every `add`
+(`batch_size=1`) with the default group commit (one transaction per step). Usage:
+
+    python benchmarks/sqlite_memory.py [--sessions 200] [--steps 10] [--threads 8]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ai_agent_orchestrator.memory.sqlite import SQLiteMemoryStore
+from ai_agent_orchestrator.protocol.messages import Message
+
+TOOL_RESULT = "result line\n" * 40
+
+
+def _run_session(store: SQLiteMemoryStore, session_id: str, steps: int, batch_size: int) -> None:
+    memory = store.memory(session_id, batch_size=batch_size)
+    memory.add(Message(role="user", content=f"instruction for {session_id}"))
+    for step in range(steps):
+        memory.snapshot()
+        memory.add(
+            Message(role="assistant", content=f'{{"type":"tool_call","tool_name":"t{step}"}}')
+        )
+        memory.add(Message(role="tool", content=TOOL_RESULT, name=f"t{step}"))
+    memory.flush()
+
+
+def _measure(sessions: int, steps: int, threads: int, batch_size: int) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteMemoryStore(Path(directory) / "memory.db")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [
+                pool.submit(_run_session, store, f"session-{index}", steps, batch_size)
+                for index in range(sessions)
+            ]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - start
+        commits = store.commits
+        store.close()
+    messages = sessions * (1 + 2 * steps)
+    return messages / elapsed, commits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    for label, batch_size in (("commit per add", 1), ("group commit", 64)):
+        rate, commits = _measure(args.sessions, args.steps, args.threads, batch_size)
+        print(f"{label:<15} {rate:10.0f} messages/s ({commits} commits)")
+
+
+if __name__ == "__main__":
+    main()
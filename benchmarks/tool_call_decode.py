@@ -0,0 +1,81 @@
+"""Micro-benchmark: per-step cost of decoding tool calls with large argument payloads.
+
+Each step decodes one `tool_call` whose `args` carry `--items` records, validates them
+into the tool's input model and runs a trivial tool. Runs attach a discarding event sink
+so output classification (`agent.output.parsed`) is included. Usage:
+
+    python benchmarks/tool_call_decode.py [--runs 200] [--items 10 1000 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import AgentEvent
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+TOOL_STEPS = 4
+
+
+class Record(ToolInput):
+    id: int
+    label: str
+    score: float
+
+
+class IngestInput(ToolInput):
+    records: list[Record]
+
+
+class IngestTool(Tool[IngestInput]):
+    name = "ingest"
+    description = "Counts records."
+    input_model = IngestInput
+
+    def run(self, validated_input: IngestInput) -> str:
+        return str(len(validated_input.records))
+
+
+def _discard(event: AgentEvent) -> None:
+    return None
+
+
+def _build_agent(items: int) -> Agent:
+    records = [{"id": i, "label": f"item-{i}", "score": i / 7} for i in range(items)]
+    tool_call = ToolCallOutput(
+        type="tool_call", tool_name="ingest", args={"records": records}
+    ).model_dump_json()
+    final = FinalOutput(type="final", content="done").model_dump_json()
+    tools = ToolRegistry()
+    tools.register(IngestTool())
+    llm = FakeLLM([tool_call] * TOOL_STEPS + [final])
+    return Agent(llm=llm, tools=tools, memory=InMemoryMemory(), max_steps=TOOL_STEPS + 1)
+
+
+def _per_step_us(runs: int, items: int) -> float:
+    agents = [_build_agent(items) for _ in range(runs)]
+    start = time.perf_counter()
+    for agent in agents:
+        agent.run("go", event_sink=_discard)
+    return (time.perf_counter() - start) / (runs * (TOOL_STEPS + 1)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 1000, 10000])
+    args = parser.parse_args()
+
+    for items in args.items:
+        # Scale the run count down for large payloads to keep wall time similar.
+        runs = max(3, args.runs * 100 // max(items, 100))
+        print(f"items={items:<6} {_per_step_us(runs, items):10.1f} us/step ({runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,31 +2,59 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import json
+import time
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, AsyncIterator, Iterable, List, Mapping, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    cast,
+)
 
+from ai_agent_orchestrator.batch import BatchReport, BatchRun, MemoryFactory, Timer
+from ai_agent_orchestrator.executors import ExecutorLane, QueueStats
 from ai_agent_orchestrator.llm import (
     LLMClientProtocol,
     SupportsAsyncGenerate,
     SupportsAsyncStream,
     SupportsSyncGenerate,
+    aclose_stream,
     async_generate_via_thread,
 )
-from ai_agent_orchestrator.memory.base import Memory
+from ai_agent_orchestrator.memory.base import Memory, _as_async_memory
+from ai_agent_orchestrator.memory.compaction import ConversationCompactor, _supports_compaction
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
 from ai_agent_orchestrator.observability.clock import Clock, system_clock_ms
-from ai_agent_orchestrator.observability.events import EventSink, build_event, emit_event
+from ai_agent_orchestrator.observability.events import EventSink
 from ai_agent_orchestrator.observability.ids import (
     RunIdFactory,
     SpanIdFactory,
     default_run_id,
     default_span_id,
 )
+from ai_agent_orchestrator.observability.tracing import Tracer, create_tracer
 from ai_agent_orchestrator.protocol.messages import Message
-from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput, parse_output
-from ai_agent_orchestrator.streaming import StreamChunk
-from ai_agent_orchestrator.tools.registry import ToolRegistry
+from ai_agent_orchestrator.protocol.outputs import (
+    DecodedResponse,
+    OutputType,
+    ToolCall,
+    ToolCallOutput,
+    ToolCallsOutput,
+    decode_output,
+)
+from ai_agent_orchestrator.streaming import FinalContentDecoder, StreamChunk, StreamMode
+from ai_agent_orchestrator.tools.registry import ToolExecution, ToolRegistry
+from ai_agent_orchestrator.utils.errors import AgentTimeoutError, ToolTimeoutError
+
+_MAX_STEPS_REPLY = "Max steps reached without final response."
 
 
 class AgentEventType(str, Enum):
@@ -61,11 +89,104 @@ class Agent:
         tools: ToolRegistry,
         memory: Memory,
         max_steps: int = 5,
+        max_tool_concurrency: int = 4,
+        run_timeout_s: float | None = None,
+        llm_executor: Executor | None = None,
+        compactor: ConversationCompactor | None = None,
     ) -> None:
+        if max_tool_concurrency < 1:
+            raise ValueError("max_tool_concurrency must be a positive integer.")
+        if run_timeout_s is not None and run_timeout_s <= 0:
+            raise ValueError("run_timeout_s must be positive or None.")
         self.llm = llm
         self.tools = tools
         self.memory = memory
         self.max_steps = max_steps
+        self.max_tool_concurrency = max_tool_concurrency
+        # Wall-clock budget per run, enforced by the async entrypoints.
+        self.run_timeout_s = run_timeout_s
+        # Sync LLM clients called from async paths; None uses the loop's default executor.
+        self.llm_lane = None if llm_executor is None else ExecutorLane(llm_executor)
+        # Summarizes old tool turns in the background of async runs; see `_compact_later`.
+        self.compactor = compactor
+        self._compaction: asyncio.Task[bool] | None = None
+
+    def with_memory(self, memory: Memory) -> Agent:
+        """Return an agent with the same configuration bound to another memory."""
+        agent = Agent(
+            llm=self.llm,
+            tools=self.tools,
+            memory=memory,
+            max_steps=self.max_steps,
+            max_tool_concurrency=self.max_tool_concurrency,
+            run_timeout_s=self.run_timeout_s,
+            compactor=self.compactor,
+        )
+        # Share the lane so queue depth covers every agent using the executor.
+        agent.llm_lane = self.llm_lane
+        return agent
+
+    def run_batch_async(
+        self,
+        inputs: Iterable[str],
+        memory_factory: MemoryFactory = InMemoryMemory,
+        max_concurrency: int = 8,
+        event_sink: EventSink | None = None,
+        clock: Clock = system_clock_ms,
+        run_id_factory: RunIdFactory = default_run_id,
+        span_id_factory: SpanIdFactory = default_span_id,
+        timer: Timer = time.perf_counter,
+    ) -> BatchRun:
+        """Run independent inputs concurrently, each with its own memory.
+
+        Iterate the returned `BatchRun` to receive results as runs complete. The agent's
+        own memory is not touched.
+        """
+
+        async def _run_one(user_input: str, memory: Memory) -> AgentResponse:
+            agent = self.with_memory(memory)
+            try:
+                return await agent.run_async(
+                    user_input,
+                    event_sink=event_sink,
+                    clock=clock,
+                    run_id_factory=run_id_factory,
+                    span_id_factory=span_id_factory,
+                )
+            finally:
+                await agent.wait_for_compaction()
+
+        return BatchRun(
+            inputs,
+            _run_one,
+            memory_factory=memory_factory,
+            max_concurrency=max_concurrency,
+            timer=timer,
+        )
+
+    def run_many(
+        self,
+        inputs: Iterable[str],
+        memory_factory: MemoryFactory = InMemoryMemory,
+        max_concurrency: int = 8,
+        event_sink: EventSink | None = None,
+        clock: Clock = system_clock_ms,
+        run_id_factory: RunIdFactory = default_run_id,
+        span_id_factory: SpanIdFactory = default_span_id,
+        timer: Timer = time.perf_counter,
+    ) -> BatchReport:
+        """Synchronous wrapper for `run_batch_async`; results are in input order."""
+        batch = self.run_batch_async(
+            inputs,
+            memory_factory=memory_factory,
+            max_concurrency=max_concurrency,
+            event_sink=event_sink,
+            clock=clock,
+            run_id_factory=run_id_factory,
+            span_id_factory=span_id_factory,
+            timer=timer,
+        )
+        return asyncio.run(batch.collect())
 
     def run(
         self,
@@ -77,298 +198,57 @@ class Agent:
     ) -> AgentResponse:
         self.memory.add(Message(role="user", content=user_input))
         events: List[AgentEvent] = []
-        run_id = run_id_factory()
-        run_span_id = span_id_factory()
-        tool_count = len(list(self.tools.iter_tools()))
+        tracer = create_tracer(event_sink, clock, run_id_factory, span_id_factory)
+        run_span_id = tracer.new_span()
         step_span_id = run_span_id
         current_step = 0
         step_finished_emitted = False
 
-        emit_event(
-            event_sink,
-            build_event(
-                name="agent.run.started",
-                time_ms=clock(),
-                run_id=run_id,
-                step=0,
-                span_id=run_span_id,
-                parent_span_id=None,
-                data={"max_steps": self.max_steps},
-            ),
-        )
+        tracer.emit("agent.run.started", 0, run_span_id, None, {"max_steps": self.max_steps})
 
         try:
             for step in range(1, self.max_steps + 1):
                 current_step = step
                 step_finished_emitted = False
-                step_span_id = span_id_factory()
-                conversation = self.memory.get_conversation()
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.step.started",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=step_span_id,
-                        parent_span_id=run_span_id,
-                        data={"input_messages_count": len(conversation)},
-                    ),
-                )
-                model_span_id = span_id_factory()
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.model.requested",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "message_count": len(conversation),
-                            "tool_count": tool_count,
-                        },
-                    ),
+                step_span_id = tracer.new_span()
+                conversation = self.memory.snapshot()
+                model_span_id = self._emit_model_requested(
+                    tracer, step, step_span_id, run_span_id, conversation
                 )
                 sync_llm = cast(SupportsSyncGenerate, self.llm)
                 raw_output = sync_llm.generate(conversation)
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.model.responded",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "response_type": "text",
-                            "raw_length": len(raw_output),
-                        },
-                    ),
-                )
-                events.append(
-                    AgentEvent(
-                        type=AgentEventType.LLM_RESPONSE, content=raw_output, step=step
-                    )
-                )
-                try:
-                    parsed = parse_output(raw_output)
-                except Exception:
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.output.parsed",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=model_span_id,
-                            parent_span_id=step_span_id,
-                            data={
-                                "parsed_type": "invalid",
-                                "is_valid": False,
-                            },
-                        ),
-                    )
-                    raise
-                parsed_type, is_valid, output_metadata = _classify_output(
-                    raw_output, parsed
-                )
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.output.parsed",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "parsed_type": parsed_type,
-                            "is_valid": is_valid,
-                            **output_metadata,
-                        },
-                    ),
+                parsed = self._handle_model_output(
+                    tracer, events, step, model_span_id, step_span_id, raw_output, None
                 )
 
-                if isinstance(parsed, ToolCallOutput):
-                    tool_span_id = span_id_factory()
-                    args_keys = sorted(parsed.args.keys())
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.TOOL_CALL,
-                            content=None,
-                            tool_name=parsed.tool_name,
-                            args=parsed.args,
-                            step=step,
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.tool.started",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=tool_span_id,
-                            parent_span_id=step_span_id,
-                            data={
-                                "tool_name": parsed.tool_name,
-                                "args_keys": args_keys,
-                                "args_count": len(args_keys),
-                            },
-                        ),
-                    )
-                    tool_status = "ok"
-                    error_type = None
-                    try:
-                        tool_result = self.tools.run(parsed.tool_name, parsed.args)
-                    except Exception as exc:
-                        tool_status = "error"
-                        error_type = exc.__class__.__name__
-                        raise
-                    finally:
-                        emit_event(
-                            event_sink,
-                            build_event(
-                                name="agent.tool.finished",
-                                time_ms=clock(),
-                                run_id=run_id,
-                                step=step,
-                                span_id=tool_span_id,
-                                parent_span_id=step_span_id,
-                                data={
-                                    "tool_name": parsed.tool_name,
-                                    "status": tool_status,
-                                    "error_type": error_type,
-                                },
-                            ),
-                        )
-                    self.memory.add(
-                        Message(role="tool", content=tool_result, name=parsed.tool_name)
+                if isinstance(parsed, (ToolCallOutput, ToolCallsOutput)):
+                    self._execute_tool_calls(
+                        _tool_calls_of(parsed), tracer, events, step, step_span_id
                     )
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.TOOL_RESULT,
-                            content=tool_result,
-                            tool_name=parsed.tool_name,
-                            step=step,
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.step.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=step_span_id,
-                            parent_span_id=run_span_id,
-                            data={"outcome": "tool_call"},
-                        ),
+                    tracer.emit(
+                        "agent.step.finished",
+                        step,
+                        step_span_id,
+                        run_span_id,
+                        {"outcome": parsed.type},
                     )
                     step_finished_emitted = True
                     continue
 
-                if isinstance(parsed, FinalOutput):
-                    self.memory.add(Message(role="assistant", content=parsed.content))
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.FINAL, content=parsed.content, step=step
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.step.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=step_span_id,
-                            parent_span_id=run_span_id,
-                            data={"outcome": "final"},
-                        ),
-                    )
-                    step_finished_emitted = True
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.run.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=run_span_id,
-                            parent_span_id=None,
-                            data={"steps_used": step, "outcome": "final"},
-                        ),
-                    )
-                    return AgentResponse(
-                        content=parsed.content, events=events, steps_used=step
-                    )
+                self._store([_assistant(parsed.content)], flush=True)
+                self._finish(tracer, events, step, step_span_id, run_span_id, parsed.content)
+                step_finished_emitted = True
+                return AgentResponse(content=parsed.content, events=events, steps_used=step)
 
-            fallback = "Max steps reached without final response."
-            self.memory.add(Message(role="assistant", content=fallback))
-            events.append(
-                AgentEvent(
-                    type=AgentEventType.FINAL,
-                    content=fallback,
-                    step=self.max_steps,
-                )
-            )
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.step.finished",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=self.max_steps,
-                    span_id=step_span_id,
-                    parent_span_id=run_span_id,
-                    data={"outcome": "max_steps"},
-                ),
-            )
+            self._store([_assistant(_MAX_STEPS_REPLY)], flush=True)
+            fallback = self._finish_max_steps(tracer, events, step_span_id, run_span_id)
             step_finished_emitted = True
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.run.finished",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=self.max_steps,
-                    span_id=run_span_id,
-                    parent_span_id=None,
-                    data={"steps_used": self.max_steps, "outcome": "max_steps"},
-                ),
-            )
             return AgentResponse(
                 content=fallback, events=events, steps_used=self.max_steps
             )
         except Exception as exc:
-            if current_step and not step_finished_emitted:
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.step.finished",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=current_step,
-                        span_id=step_span_id,
-                        parent_span_id=run_span_id,
-                        data={"outcome": "error"},
-                    ),
-                )
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.run.failed",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=current_step,
-                    span_id=run_span_id,
-                    parent_span_id=None,
-                    data={"error_type": exc.__class__.__name__},
-                ),
+            _emit_run_failed(
+                tracer, exc, current_step, step_finished_emitted, step_span_id, run_span_id
             )
             raise
 
@@ -380,310 +260,60 @@ class Agent:
         run_id_factory: RunIdFactory = default_run_id,
         span_id_factory: SpanIdFactory = default_span_id,
     ) -> AgentResponse:
-        self.memory.add(Message(role="user", content=user_input))
+        await self._store_async([Message(role="user", content=user_input)])
         events: List[AgentEvent] = []
-        run_id = run_id_factory()
-        run_span_id = span_id_factory()
-        tool_count = len(list(self.tools.iter_tools()))
+        tracer = create_tracer(event_sink, clock, run_id_factory, span_id_factory)
+        deadline = _deadline_after(self.run_timeout_s)
+        run_span_id = tracer.new_span()
         step_span_id = run_span_id
         current_step = 0
         step_finished_emitted = False
 
-        emit_event(
-            event_sink,
-            build_event(
-                name="agent.run.started",
-                time_ms=clock(),
-                run_id=run_id,
-                step=0,
-                span_id=run_span_id,
-                parent_span_id=None,
-                data={"max_steps": self.max_steps},
-            ),
-        )
+        tracer.emit("agent.run.started", 0, run_span_id, None, {"max_steps": self.max_steps})
 
         try:
             for step in range(1, self.max_steps + 1):
                 current_step = step
                 step_finished_emitted = False
-                step_span_id = span_id_factory()
-                conversation = self.memory.get_conversation()
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.step.started",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=step_span_id,
-                        parent_span_id=run_span_id,
-                        data={"input_messages_count": len(conversation)},
-                    ),
-                )
-                model_span_id = span_id_factory()
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.model.requested",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "message_count": len(conversation),
-                            "tool_count": tool_count,
-                        },
-                    ),
-                )
-                async_llm = cast(SupportsAsyncGenerate, self.llm)
-                if inspect.iscoroutinefunction(async_llm.generate):
-                    raw_output = await async_llm.generate(conversation)
-                else:
-                    sync_llm = cast(SupportsSyncGenerate, self.llm)
-                    raw_output = await async_generate_via_thread(
-                        sync_llm, conversation
-                    )
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.model.responded",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "response_type": "text",
-                            "raw_length": len(raw_output),
-                        },
-                    ),
-                )
-                events.append(
-                    AgentEvent(
-                        type=AgentEventType.LLM_RESPONSE, content=raw_output, step=step
-                    )
-                )
-                try:
-                    parsed = parse_output(raw_output)
-                except Exception:
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.output.parsed",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=model_span_id,
-                            parent_span_id=step_span_id,
-                            data={
-                                "parsed_type": "invalid",
-                                "is_valid": False,
-                            },
-                        ),
-                    )
-                    raise
-                parsed_type, is_valid, output_metadata = _classify_output(
-                    raw_output, parsed
+                step_span_id = tracer.new_span()
+                conversation = await self._snapshot_async()
+                model_span_id = self._emit_model_requested(
+                    tracer, step, step_span_id, run_span_id, conversation
                 )
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.output.parsed",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "parsed_type": parsed_type,
-                            "is_valid": is_valid,
-                            **output_metadata,
-                        },
-                    ),
+                async with _within_deadline(deadline, self.run_timeout_s):
+                    raw_output, queued = await self._generate_async(conversation)
+                parsed = self._handle_model_output(
+                    tracer, events, step, model_span_id, step_span_id, raw_output, queued
                 )
 
-                if isinstance(parsed, ToolCallOutput):
-                    tool_span_id = span_id_factory()
-                    args_keys = sorted(parsed.args.keys())
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.TOOL_CALL,
-                            content=None,
-                            tool_name=parsed.tool_name,
-                            args=parsed.args,
-                            step=step,
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.tool.started",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=tool_span_id,
-                            parent_span_id=step_span_id,
-                            data={
-                                "tool_name": parsed.tool_name,
-                                "args_keys": args_keys,
-                                "args_count": len(args_keys),
-                            },
-                        ),
-                    )
-                    tool_status = "ok"
-                    error_type = None
-                    try:
-                        tool_result = await asyncio.to_thread(
-                            self.tools.run, parsed.tool_name, parsed.args
-                        )
-                    except Exception as exc:
-                        tool_status = "error"
-                        error_type = exc.__class__.__name__
-                        raise
-                    finally:
-                        emit_event(
-                            event_sink,
-                            build_event(
-                                name="agent.tool.finished",
-                                time_ms=clock(),
-                                run_id=run_id,
-                                step=step,
-                                span_id=tool_span_id,
-                                parent_span_id=step_span_id,
-                                data={
-                                    "tool_name": parsed.tool_name,
-                                    "status": tool_status,
-                                    "error_type": error_type,
-                                },
-                            ),
-                        )
-                    self.memory.add(
-                        Message(
-                            role="tool", content=tool_result, name=parsed.tool_name
-                        )
-                    )
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.TOOL_RESULT,
-                            content=tool_result,
-                            tool_name=parsed.tool_name,
-                            step=step,
-                        )
+                if isinstance(parsed, (ToolCallOutput, ToolCallsOutput)):
+                    await self._execute_tool_calls_async(
+                        _tool_calls_of(parsed), tracer, events, step, step_span_id, deadline
                     )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.step.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=step_span_id,
-                            parent_span_id=run_span_id,
-                            data={"outcome": "tool_call"},
-                        ),
+                    tracer.emit(
+                        "agent.step.finished",
+                        step,
+                        step_span_id,
+                        run_span_id,
+                        {"outcome": parsed.type},
                     )
                     step_finished_emitted = True
                     continue
 
-                if isinstance(parsed, FinalOutput):
-                    self.memory.add(Message(role="assistant", content=parsed.content))
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.FINAL, content=parsed.content, step=step
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.step.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=step_span_id,
-                            parent_span_id=run_span_id,
-                            data={"outcome": "final"},
-                        ),
-                    )
-                    step_finished_emitted = True
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.run.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=run_span_id,
-                            parent_span_id=None,
-                            data={"steps_used": step, "outcome": "final"},
-                        ),
-                    )
-                    return AgentResponse(
-                        content=parsed.content, events=events, steps_used=step
-                    )
+                await self._store_async([_assistant(parsed.content)], flush=True)
+                self._finish(tracer, events, step, step_span_id, run_span_id, parsed.content)
+                step_finished_emitted = True
+                return AgentResponse(content=parsed.content, events=events, steps_used=step)
 
-            fallback = "Max steps reached without final response."
-            self.memory.add(Message(role="assistant", content=fallback))
-            events.append(
-                AgentEvent(
-                    type=AgentEventType.FINAL,
-                    content=fallback,
-                    step=self.max_steps,
-                )
-            )
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.step.finished",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=self.max_steps,
-                    span_id=step_span_id,
-                    parent_span_id=run_span_id,
-                    data={"outcome": "max_steps"},
-                ),
-            )
+            await self._store_async([_assistant(_MAX_STEPS_REPLY)], flush=True)
+            fallback = self._finish_max_steps(tracer, events, step_span_id, run_span_id)
             step_finished_emitted = True
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.run.finished",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=self.max_steps,
-                    span_id=run_span_id,
-                    parent_span_id=None,
-                    data={"steps_used": self.max_steps, "outcome": "max_steps"},
-                ),
-            )
             return AgentResponse(
                 content=fallback, events=events, steps_used=self.max_steps
             )
         except Exception as exc:
-            if current_step and not step_finished_emitted:
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.step.finished",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=current_step,
-                        span_id=step_span_id,
-                        parent_span_id=run_span_id,
-                        data={"outcome": "error"},
-                    ),
-                )
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.run.failed",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=current_step,
-                    span_id=run_span_id,
-                    parent_span_id=None,
-                    data={"error_type": exc.__class__.__name__},
-                ),
+            _emit_run_failed(
+                tracer, exc, current_step, step_finished_emitted, step_span_id, run_span_id
             )
             raise
 
@@ -694,346 +324,606 @@ class Agent:
         clock: Clock = system_clock_ms,
         run_id_factory: RunIdFactory = default_run_id,
         span_id_factory: SpanIdFactory = default_span_id,
+        stream_mode: StreamMode = "buffered",
     ) -> AsyncIterator[StreamChunk]:
-        self.memory.add(Message(role="user", content=user_input))
+        if stream_mode not in ("buffered", "incremental"):
+            raise ValueError("stream_mode must be 'buffered' or 'incremental'.")
+        await self._store_async([Message(role="user", content=user_input)])
         events: List[AgentEvent] = []
-        run_id = run_id_factory()
-        run_span_id = span_id_factory()
-        tool_count = len(list(self.tools.iter_tools()))
+        tracer = create_tracer(event_sink, clock, run_id_factory, span_id_factory)
+        deadline = _deadline_after(self.run_timeout_s)
+        run_span_id = tracer.new_span()
         stream_chunk_size = 64
         step_span_id = run_span_id
         current_step = 0
         step_finished_emitted = False
 
-        emit_event(
-            event_sink,
-            build_event(
-                name="agent.run.started",
-                time_ms=clock(),
-                run_id=run_id,
-                step=0,
-                span_id=run_span_id,
-                parent_span_id=None,
-                data={"max_steps": self.max_steps},
-            ),
-        )
+        tracer.emit("agent.run.started", 0, run_span_id, None, {"max_steps": self.max_steps})
 
         try:
             for step in range(1, self.max_steps + 1):
                 current_step = step
                 step_finished_emitted = False
-                step_span_id = span_id_factory()
-                conversation = self.memory.get_conversation()
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.step.started",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=step_span_id,
-                        parent_span_id=run_span_id,
-                        data={"input_messages_count": len(conversation)},
-                    ),
-                )
-                model_span_id = span_id_factory()
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.model.requested",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "message_count": len(conversation),
-                            "tool_count": tool_count,
-                        },
-                    ),
+                step_span_id = tracer.new_span()
+                conversation = await self._snapshot_async()
+                model_span_id = self._emit_model_requested(
+                    tracer, step, step_span_id, run_span_id, conversation
                 )
 
                 raw_output = ""
+                queued: QueueStats | None = None
+                streamed_parts: list[str] = []
                 if isinstance(self.llm, SupportsAsyncStream):
                     stream_response = self.llm.stream(conversation)
                     if not hasattr(stream_response, "__aiter__"):
                         raise TypeError(
                             "Streaming requires an async iterator from the LLM stream method."
                         )
+                    decoder = (
+                        FinalContentDecoder() if stream_mode == "incremental" else None
+                    )
                     stream_chunks: list[Any] = []
                     stream_texts: list[str] = []
-                    async for chunk in stream_response:
-                        chunk_text = _read_chunk_text(chunk)
-                        stream_chunks.append(chunk)
-                        stream_texts.append(chunk_text)
+                    stream_iterator = aiter(stream_response)
+                    try:
+                        while True:
+                            # The deadline bounds each read, never the consumer's time
+                            # between chunks.
+                            async with _within_deadline(deadline, self.run_timeout_s):
+                                chunk = await anext(stream_iterator, _STREAM_END)
+                            if chunk is _STREAM_END:
+                                break
+                            chunk_text = _read_chunk_text(chunk)
+                            stream_chunks.append(chunk)
+                            stream_texts.append(chunk_text)
+                            if decoder is not None and decoder.active:
+                                decoded = decoder.feed(chunk_text)
+                                if decoded:
+                                    streamed_parts.append(decoded)
+                                    yield StreamChunk(text=decoded, step=step)
+                    finally:
+                        # Release the provider's connection on timeout, error or an
+                        # abandoned stream instead of waiting for garbage collection.
+                        await aclose_stream(stream_response)
                     raw_output = "".join(stream_texts)
                     if stream_chunks:
                         last_chunk = stream_chunks[-1]
                         last_text = stream_texts[-1]
-                        if (
-                            getattr(last_chunk, "is_final", False)
-                            and last_text
-                            and _is_protocol_compliant(last_text)
-                        ):
-                            raw_output = last_text
+                        if getattr(last_chunk, "is_final", False) and last_text:
+                            decoded_last = decode_output(last_text)
+                            if decoded_last.is_valid:
+                                raw_output = DecodedResponse(last_text, decoded_last)
                 else:
-                    async_llm = cast(SupportsAsyncGenerate, self.llm)
-                    if inspect.iscoroutinefunction(async_llm.generate):
-                        raw_output = await async_llm.generate(conversation)
-                    else:
-                        raw_output = await async_generate_via_thread(
-                            cast(SupportsSyncGenerate, self.llm), conversation
-                        )
+                    async with _within_deadline(deadline, self.run_timeout_s):
+                        raw_output, queued = await self._generate_async(conversation)
 
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.model.responded",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "response_type": "text",
-                            "raw_length": len(raw_output),
-                        },
-                    ),
-                )
-                events.append(
-                    AgentEvent(
-                        type=AgentEventType.LLM_RESPONSE, content=raw_output, step=step
-                    )
-                )
-                try:
-                    parsed = parse_output(raw_output)
-                except Exception:
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.output.parsed",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=model_span_id,
-                            parent_span_id=step_span_id,
-                            data={
-                                "parsed_type": "invalid",
-                                "is_valid": False,
-                            },
-                        ),
-                    )
-                    raise
-                parsed_type, is_valid, output_metadata = _classify_output(
-                    raw_output, parsed
-                )
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.output.parsed",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=step,
-                        span_id=model_span_id,
-                        parent_span_id=step_span_id,
-                        data={
-                            "parsed_type": parsed_type,
-                            "is_valid": is_valid,
-                            **output_metadata,
-                        },
-                    ),
+                parsed = self._handle_model_output(
+                    tracer, events, step, model_span_id, step_span_id, raw_output, queued
                 )
 
-                if isinstance(parsed, ToolCallOutput):
-                    tool_span_id = span_id_factory()
-                    args_keys = sorted(parsed.args.keys())
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.TOOL_CALL,
-                            content=None,
-                            tool_name=parsed.tool_name,
-                            args=parsed.args,
-                            step=step,
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.tool.started",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=tool_span_id,
-                            parent_span_id=step_span_id,
-                            data={
-                                "tool_name": parsed.tool_name,
-                                "args_keys": args_keys,
-                                "args_count": len(args_keys),
-                            },
-                        ),
-                    )
-                    tool_status = "ok"
-                    error_type = None
-                    try:
-                        tool_result = await asyncio.to_thread(
-                            self.tools.run, parsed.tool_name, parsed.args
-                        )
-                    except Exception as exc:
-                        tool_status = "error"
-                        error_type = exc.__class__.__name__
-                        raise
-                    finally:
-                        emit_event(
-                            event_sink,
-                            build_event(
-                                name="agent.tool.finished",
-                                time_ms=clock(),
-                                run_id=run_id,
-                                step=step,
-                                span_id=tool_span_id,
-                                parent_span_id=step_span_id,
-                                data={
-                                    "tool_name": parsed.tool_name,
-                                    "status": tool_status,
-                                    "error_type": error_type,
-                                },
-                            ),
-                        )
-                    self.memory.add(
-                        Message(
-                            role="tool", content=tool_result, name=parsed.tool_name
-                        )
-                    )
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.TOOL_RESULT,
-                            content=tool_result,
-                            tool_name=parsed.tool_name,
-                            step=step,
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.step.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=step_span_id,
-                            parent_span_id=run_span_id,
-                            data={"outcome": "tool_call"},
-                        ),
+                streamed_text = "".join(streamed_parts)
+                if isinstance(parsed, (ToolCallOutput, ToolCallsOutput)):
+                    if streamed_text:
+                        # The reply looked like a final answer but parsed as a tool call;
+                        # tell the consumer to drop what it was sent for this step.
+                        yield StreamChunk(text="", step=step, reset=True)
+                    await self._execute_tool_calls_async(
+                        _tool_calls_of(parsed), tracer, events, step, step_span_id, deadline
+                    )
+                    tracer.emit(
+                        "agent.step.finished",
+                        step,
+                        step_span_id,
+                        run_span_id,
+                        {"outcome": parsed.type},
                     )
                     step_finished_emitted = True
                     continue
 
-                if isinstance(parsed, FinalOutput):
-                    self.memory.add(Message(role="assistant", content=parsed.content))
-                    events.append(
-                        AgentEvent(
-                            type=AgentEventType.FINAL,
-                            content=parsed.content,
-                            step=step,
-                        )
-                    )
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.step.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=step_span_id,
-                            parent_span_id=run_span_id,
-                            data={"outcome": "final"},
-                        ),
-                    )
-                    step_finished_emitted = True
-                    emit_event(
-                        event_sink,
-                        build_event(
-                            name="agent.run.finished",
-                            time_ms=clock(),
-                            run_id=run_id,
-                            step=step,
-                            span_id=run_span_id,
-                            parent_span_id=None,
-                            data={"steps_used": step, "outcome": "final"},
-                        ),
-                    )
-                    chunks = list(_chunk_text(parsed.content, stream_chunk_size))
-                    for index, chunk_text in enumerate(chunks):
-                        is_final = index == len(chunks) - 1
+                await self._store_async([_assistant(parsed.content)], flush=True)
+                self._finish(tracer, events, step, step_span_id, run_span_id, parsed.content)
+                step_finished_emitted = True
+                if streamed_text:
+                    if parsed.content.startswith(streamed_text):
+                        # Content already forwarded incrementally; only the unsent
+                        # remainder (normally empty) closes the stream.
+                        remainder = parsed.content[len(streamed_text) :]
+                        yield StreamChunk(text=remainder, step=step, is_final=True)
+                    else:
+                        # What was forwarded is not the parsed response (e.g. truncated
+                        # or trailing text); replace it with the content that was stored.
                         yield StreamChunk(
-                            text=chunk_text, step=step, is_final=is_final
+                            text=parsed.content, step=step, is_final=True, reset=True
                         )
                     return
-
-            fallback = "Max steps reached without final response."
-            self.memory.add(Message(role="assistant", content=fallback))
-            events.append(
-                AgentEvent(
-                    type=AgentEventType.FINAL,
-                    content=fallback,
-                    step=self.max_steps,
-                )
-            )
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.step.finished",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=self.max_steps,
-                    span_id=step_span_id,
-                    parent_span_id=run_span_id,
-                    data={"outcome": "max_steps"},
-                ),
-            )
+                chunks = list(_chunk_text(parsed.content, stream_chunk_size))
+                for index, chunk_text in enumerate(chunks):
+                    is_final = index == len(chunks) - 1
+                    yield StreamChunk(text=chunk_text, step=step, is_final=is_final)
+                return
+
+            await self._store_async([_assistant(_MAX_STEPS_REPLY)], flush=True)
+            fallback = self._finish_max_steps(tracer, events, step_span_id, run_span_id)
             step_finished_emitted = True
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.run.finished",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=self.max_steps,
-                    span_id=run_span_id,
-                    parent_span_id=None,
-                    data={"steps_used": self.max_steps, "outcome": "max_steps"},
-                ),
-            )
             chunks = list(_chunk_text(fallback, stream_chunk_size))
             for index, chunk_text in enumerate(chunks):
                 is_final = index == len(chunks) - 1
                 yield StreamChunk(text=chunk_text, step=self.max_steps, is_final=is_final)
         except Exception as exc:
-            if current_step and not step_finished_emitted:
-                emit_event(
-                    event_sink,
-                    build_event(
-                        name="agent.step.finished",
-                        time_ms=clock(),
-                        run_id=run_id,
-                        step=current_step,
-                        span_id=step_span_id,
-                        parent_span_id=run_span_id,
-                        data={"outcome": "error"},
-                    ),
+            _emit_run_failed(
+                tracer, exc, current_step, step_finished_emitted, step_span_id, run_span_id
+            )
+            raise
+
+    async def _generate_async(
+        self, conversation: Sequence[Message]
+    ) -> tuple[str, QueueStats | None]:
+        async_llm = cast(SupportsAsyncGenerate, self.llm)
+        if inspect.iscoroutinefunction(async_llm.generate):
+            return await async_llm.generate(conversation), None
+        sync_llm = cast(SupportsSyncGenerate, self.llm)
+        if self.llm_lane is None:
+            return await async_generate_via_thread(sync_llm, conversation), None
+        text, queued = await self.llm_lane.run(sync_llm.generate, conversation)
+        return text, queued
+
+    def _emit_model_requested(
+        self,
+        tracer: Tracer,
+        step: int,
+        step_span_id: str,
+        run_span_id: str,
+        conversation: Sequence[Message],
+    ) -> str:
+        if not tracer.enabled:
+            return ""
+        tracer.emit(
+            "agent.step.started",
+            step,
+            step_span_id,
+            run_span_id,
+            {"input_messages_count": len(conversation)},
+        )
+        model_span_id = tracer.new_span()
+        tracer.emit(
+            "agent.model.requested",
+            step,
+            model_span_id,
+            step_span_id,
+            {
+                "message_count": len(conversation),
+                "tool_count": len(self.tools),
+            },
+        )
+        return model_span_id
+
+    def _handle_model_output(
+        self,
+        tracer: Tracer,
+        events: List[AgentEvent],
+        step: int,
+        model_span_id: str,
+        step_span_id: str,
+        raw_output: str,
+        queued: QueueStats | None,
+    ) -> OutputType:
+        if tracer.enabled:
+            tracer.emit(
+                "agent.model.responded",
+                step,
+                model_span_id,
+                step_span_id,
+                {
+                    "response_type": "text",
+                    "raw_length": len(raw_output),
+                    **_queue_data(queued),
+                },
+            )
+        events.append(
+            AgentEvent(type=AgentEventType.LLM_RESPONSE, content=raw_output, step=step)
+        )
+        try:
+            decoded = decode_output(raw_output)
+        except Exception:
+            tracer.emit(
+                "agent.output.parsed",
+                step,
+                model_span_id,
+                step_span_id,
+                {"parsed_type": "invalid", "is_valid": False},
+            )
+            raise
+        if tracer.enabled:
+            tracer.emit(
+                "agent.output.parsed",
+                step,
+                model_span_id,
+                step_span_id,
+                {
+                    "parsed_type": decoded.parsed_type,
+                    "is_valid": decoded.is_valid,
+                    **decoded.metadata,
+                },
+            )
+        return decoded.output
+
+    def _finish(
+        self,
+        tracer: Tracer,
+        events: List[AgentEvent],
+        step: int,
+        step_span_id: str,
+        run_span_id: str,
+        content: str,
+    ) -> None:
+        events.append(AgentEvent(type=AgentEventType.FINAL, content=content, step=step))
+        tracer.emit("agent.step.finished", step, step_span_id, run_span_id, {"outcome": "final"})
+        tracer.emit(
+            "agent.run.finished",
+            step,
+            run_span_id,
+            None,
+            {"steps_used": step, "outcome": "final"},
+        )
+
+    def _finish_max_steps(
+        self,
+        tracer: Tracer,
+        events: List[AgentEvent],
+        step_span_id: str,
+        run_span_id: str,
+    ) -> str:
+        events.append(
+            AgentEvent(type=AgentEventType.FINAL, content=_MAX_STEPS_REPLY, step=self.max_steps)
+        )
+        tracer.emit(
+            "agent.step.finished",
+            self.max_steps,
+            step_span_id,
+            run_span_id,
+            {"outcome": "max_steps"},
+        )
+        tracer.emit(
+            "agent.run.finished",
+            self.max_steps,
+            run_span_id,
+            None,
+            {"steps_used": self.max_steps, "outcome": "max_steps"},
+        )
+        return _MAX_STEPS_REPLY
+
+    def _execute_tool_calls(
+        self,
+        calls: Sequence[ToolCall],
+        tracer: Tracer,
+        events: List[AgentEvent],
+        step: int,
+        step_span_id: str,
+    ) -> None:
+        tool_span_ids = [tracer.new_span() for _ in calls]
+        _record_tool_calls(events, calls, step)
+        results: list[str] = []
+        for call, tool_span_id in zip(calls, tool_span_ids, strict=True):
+            _emit_tool_started(tracer, step, tool_span_id, step_span_id, call)
+            execution: ToolExecution | None = None
+            error_type = None
+            try:
+                execution = self.tools.execute(call.tool_name, call.args)
+                results.append(execution.content)
+            except Exception as exc:
+                error_type = exc.__class__.__name__
+                raise
+            finally:
+                _emit_tool_finished(
+                    tracer, step, tool_span_id, step_span_id, call, execution, error_type
+                )
+        self._store(self._record_tool_results(events, calls, results, step))
+
+    async def _execute_tool_calls_async(
+        self,
+        calls: Sequence[ToolCall],
+        tracer: Tracer,
+        events: List[AgentEvent],
+        step: int,
+        step_span_id: str,
+        deadline: float | None = None,
+    ) -> None:
+        tool_span_ids = [tracer.new_span() for _ in calls]
+        _record_tool_calls(events, calls, step)
+        semaphore = asyncio.Semaphore(self.max_tool_concurrency)
+
+        async def _run_call(call: ToolCall, tool_span_id: str) -> str:
+            async with semaphore:
+                _emit_tool_started(tracer, step, tool_span_id, step_span_id, call)
+                timeout_s = self.tools.timeout_for(call.tool_name)
+                execution: ToolExecution | None = None
+                error_type = None
+                timed_out = False
+                try:
+                    # Async tools are cancelled on timeout. Sync tools keep running in
+                    # their worker thread; the run stops waiting and discards the result.
+                    async with asyncio.timeout(timeout_s):
+                        execution = await self.tools.execute_async(call.tool_name, call.args)
+                    return execution.content
+                except TimeoutError as exc:
+                    timed_out = True
+                    error_type = ToolTimeoutError.__name__
+                    raise ToolTimeoutError(
+                        f"Tool '{call.tool_name}' timed out after {timeout_s}s"
+                    ) from exc
+                except asyncio.CancelledError:
+                    timed_out = _deadline_passed(deadline)
+                    error_type = (
+                        AgentTimeoutError.__name__ if timed_out else "CancelledError"
+                    )
+                    raise
+                except Exception as exc:
+                    error_type = exc.__class__.__name__
+                    raise
+                finally:
+                    _emit_tool_finished(
+                        tracer,
+                        step,
+                        tool_span_id,
+                        step_span_id,
+                        call,
+                        execution,
+                        error_type,
+                        timed_out,
+                    )
+
+        async with _within_deadline(deadline, self.run_timeout_s):
+            results = await _gather_tool_calls(_run_call, calls, tool_span_ids)
+        await self._store_async(self._record_tool_results(events, calls, results, step))
+        self._compact_later()
+
+    async def wait_for_compaction(self) -> None:
+        """Wait for the background compaction pass started by the last run, if any.
+
+        Call this before saving or discarding the memory so a late summary is not lost.
+        A failed pass is ignored, as it is when left to run in the background.
+        """
+        task, self._compaction = self._compaction, None
+        if task is not None:
+            await asyncio.wait([task])
+
+    def _compact_later(self) -> None:
+        """Start one background compaction pass unless one is already running.
+
+        The pass overlaps the next model call. It never blocks the run, and a failed or
+        superseded pass leaves the conversation unchanged.
+        """
+        if self.compactor is None or not _supports_compaction(self.memory):
+            return
+        if self._compaction is not None and not self._compaction.done():
+            return
+        self._compaction = asyncio.create_task(self.compactor.compact_async(self.memory))
+        self._compaction.add_done_callback(_discard_task_result)
+
+    def _record_tool_results(
+        self,
+        events: List[AgentEvent],
+        calls: Sequence[ToolCall],
+        results: Sequence[str],
+        step: int,
+    ) -> List[Message]:
+        """Record tool result events and return the tool messages for memory."""
+        messages: List[Message] = []
+        for call, tool_result in zip(calls, results, strict=True):
+            messages.append(Message(role="tool", content=tool_result, name=call.tool_name))
+            events.append(
+                AgentEvent(
+                    type=AgentEventType.TOOL_RESULT,
+                    content=tool_result,
+                    tool_name=call.tool_name,
+                    step=step,
                 )
-            emit_event(
-                event_sink,
-                build_event(
-                    name="agent.run.failed",
-                    time_ms=clock(),
-                    run_id=run_id,
-                    step=current_step,
-                    span_id=run_span_id,
-                    parent_span_id=None,
-                    data={"error_type": exc.__class__.__name__},
-                ),
             )
+        return messages
+
+    def _store(self, messages: Sequence[Message], flush: bool = False) -> None:
+        for message in messages:
+            self.memory.add(message)
+        if flush:
+            self.memory.flush()
+
+    async def _store_async(self, messages: Sequence[Message], flush: bool = False) -> None:
+        # Memories that do I/O provide async methods so they never block the loop.
+        memory = _as_async_memory(self.memory)
+        if memory is None:
+            self._store(messages, flush)
+            return
+        await memory.extend_async(messages)
+        if flush:
+            await memory.flush_async()
+
+    async def _snapshot_async(self) -> Sequence[Message]:
+        memory = _as_async_memory(self.memory)
+        if memory is None:
+            return self.memory.snapshot()
+        return await memory.get_conversation_async()
+
+
+def _assistant(content: str) -> Message:
+    return Message(role="assistant", content=content)
+
+
+def _discard_task_result(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _tool_calls_of(parsed: ToolCallOutput | ToolCallsOutput) -> list[ToolCall]:
+    if isinstance(parsed, ToolCallsOutput):
+        return parsed.calls
+    return [ToolCall(tool_name=parsed.tool_name, args=parsed.args)]
+
+
+async def _gather_tool_calls(
+    run_call: Callable[[ToolCall, str], Awaitable[str]],
+    calls: Sequence[ToolCall],
+    tool_span_ids: Sequence[str],
+) -> list[str]:
+    if len(calls) == 1:
+        return [await run_call(calls[0], tool_span_ids[0])]
+    # Wait for every call before failing so no tool is left running unobserved;
+    # the first error in call order wins.
+    outcomes = await asyncio.gather(
+        *(
+            run_call(call, tool_span_id)
+            for call, tool_span_id in zip(calls, tool_span_ids, strict=True)
+        ),
+        return_exceptions=True,
+    )
+    results = []
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+        results.append(outcome)
+    return results
+
+
+def _record_tool_calls(
+    events: List[AgentEvent], calls: Sequence[ToolCall], step: int
+) -> None:
+    for call in calls:
+        events.append(
+            AgentEvent(
+                type=AgentEventType.TOOL_CALL,
+                content=None,
+                tool_name=call.tool_name,
+                args=call.args,
+                step=step,
+            )
+        )
+
+
+def _emit_tool_started(
+    tracer: Tracer, step: int, tool_span_id: str, step_span_id: str, call: ToolCall
+) -> None:
+    if not tracer.enabled:
+        return
+    args_keys = sorted(call.args.keys())
+    tracer.emit(
+        "agent.tool.started",
+        step,
+        tool_span_id,
+        step_span_id,
+        {
+            "tool_name": call.tool_name,
+            "args_keys": args_keys,
+            "args_count": len(args_keys),
+        },
+    )
+
+
+def _emit_tool_finished(
+    tracer: Tracer,
+    step: int,
+    tool_span_id: str,
+    step_span_id: str,
+    call: ToolCall,
+    execution: ToolExecution | None,
+    error_type: str | None,
+    timed_out: bool = False,
+) -> None:
+    if not tracer.enabled:
+        return
+    if execution is not None:
+        status = "ok"
+    else:
+        status = "timeout" if timed_out else "error"
+    tracer.emit(
+        "agent.tool.finished",
+        step,
+        tool_span_id,
+        step_span_id,
+        {
+            "tool_name": call.tool_name,
+            "status": status,
+            "error_type": error_type,
+            **_execution_data(execution),
+        },
+    )
+
+
+def _execution_data(execution: ToolExecution | None) -> dict[str, Any]:
+    if execution is None:
+        return {"cached": False}
+    data = {
+        "cached": execution.cached,
+        "raw_chars": execution.raw_chars,
+        "output_chars": len(execution.content),
+        **_queue_data(execution.queued),
+    }
+    if execution.blob_id is not None:
+        data["blob_id"] = execution.blob_id
+    return data
+
+
+def _queue_data(queued: QueueStats | None) -> dict[str, Any]:
+    if queued is None:
+        return {}
+    return {"queue_wait_ms": queued.wait_ms, "queue_depth": queued.depth}
+
+
+def _emit_run_failed(
+    tracer: Tracer,
+    exc: Exception,
+    current_step: int,
+    step_finished_emitted: bool,
+    step_span_id: str,
+    run_span_id: str,
+) -> None:
+    if current_step and not step_finished_emitted:
+        tracer.emit(
+            "agent.step.finished",
+            current_step,
+            step_span_id,
+            run_span_id,
+            {"outcome": "error"},
+        )
+    tracer.emit(
+        "agent.run.failed",
+        current_step,
+        run_span_id,
+        None,
+        {
+            "error_type": exc.__class__.__name__,
+            "status": "timeout" if isinstance(exc, TimeoutError) else "error",
+        },
+    )
+
+
+_STREAM_END = object()
+
+
+def _deadline_after(timeout_s: float | None) -> float | None:
+    if timeout_s is None:
+        return None
+    return asyncio.get_running_loop().time() + timeout_s
+
+
+def _deadline_passed(deadline: float | None) -> bool:
+    return deadline is not None and asyncio.get_running_loop().time() >= deadline
+
+
+@asynccontextmanager
+async def _within_deadline(
+    deadline: float | None, timeout_s: float | None
+) -> AsyncIterator[None]:
+    """Cancel the enclosed await at `deadline` and surface it as `AgentTimeoutError`."""
+    if deadline is None:
+        yield
+        return
+    scope = asyncio.timeout_at(deadline)
+    try:
+        async with scope:
+            yield
+    except TimeoutError as exc:
+        if not scope.expired():
             raise
+        raise AgentTimeoutError(f"Run exceeded its {timeout_s}s time budget") from exc
 
 
 def _read_chunk_text(chunk: Any) -> str:
@@ -1046,60 +936,9 @@ def _read_chunk_text(chunk: Any) -> str:
     return str(chunk)
 
 
-def _is_protocol_compliant(raw: str) -> bool:
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return False
-
-    if not isinstance(data, dict):
-        return False
-
-    message_type = data.get("type")
-    if message_type == "tool_call":
-        tool_name = data.get("tool_name")
-        args = data.get("args", {})
-        return isinstance(tool_name, str) and isinstance(args, dict)
-    if message_type == "final":
-        return "content" in data
-
-    return False
-
-
 def _chunk_text(text: str, chunk_size: int) -> Iterable[str]:
     if text == "":
         yield ""
         return
     for start in range(0, len(text), chunk_size):
         yield text[start : start + chunk_size]
-
-
-def _classify_output(
-    raw: str, parsed: FinalOutput | ToolCallOutput
-) -> tuple[str, bool, dict[str, Any]]:
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return "invalid", False, {}
-
-    if not isinstance(data, dict):
-        return "invalid", False, {}
-
-    output_type = data.get("type")
-    if output_type == "tool_call":
-        if isinstance(parsed, ToolCallOutput):
-            return (
-                "tool_call",
-                True,
-                {
-                    "tool_name": parsed.tool_name,
-                    "args_keys": sorted(parsed.args.keys()),
-                },
-            )
-        return "invalid", False, {}
-    if output_type == "final":
-        if "content" in data and isinstance(parsed, FinalOutput):
-            return "final", True, {}
-        return "invalid", False, {}
-
-    return "invalid", False, {}
@@ -0,0 +1,170 @@
+"""Batch execution of independent prompts over isolated agent sessions."""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable, List, Sequence
+
+from ai_agent_orchestrator.memory.base import Memory
+
+if TYPE_CHECKING:
+    from ai_agent_orchestrator.agent import AgentResponse
+
+Timer = Callable[[], float]
+MemoryFactory = Callable[[], Memory]
+BatchRunner = Callable[[str, Memory], Awaitable["AgentResponse"]]
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Outcome of one input in a batch; exactly one of response/error is set."""
+
+    index: int
+    user_input: str
+    response: AgentResponse | None
+    error: Exception | None
+    latency_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """Aggregate throughput and latency for a batch."""
+
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_ms: float
+    throughput_per_s: float
+    latency_mean_ms: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_max_ms: float
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """Results in input order plus the batch summary."""
+
+    results: List[BatchItemResult] = field(default_factory=list)
+    summary: BatchSummary | None = None
+
+
+class BatchRun:
+    """Async iterable that runs inputs under a concurrency cap.
+
+    Results are yielded as each run completes (not in input order); `summary()`
+    reports aggregate throughput and latency for the runs completed so far.
+    """
+
+    def __init__(
+        self,
+        inputs: Iterable[str],
+        runner: BatchRunner,
+        memory_factory: MemoryFactory,
+        max_concurrency: int = 8,
+        timer: Timer = time.perf_counter,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self._inputs = list(inputs)
+        self._runner = runner
+        self._memory_factory = memory_factory
+        self._max_concurrency = max_concurrency
+        self._timer = timer
+        self._results: list[BatchItemResult] = []
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    @property
+    def results(self) -> Sequence[BatchItemResult]:
+        """Completed results in completion order."""
+        return tuple(self._results)
+
+    async def __aiter__(self) -> AsyncIterator[BatchItemResult]:
+        if self._started_at is not None:
+            raise RuntimeError("A BatchRun can only be iterated once.")
+        self._started_at = self._timer()
+        queue: asyncio.Queue[BatchItemResult] = asyncio.Queue()
+        pending = iter(enumerate(self._inputs))
+
+        async def _worker() -> None:
+            # The shared iterator is only advanced between awaits, so workers never
+            # pick up the same input.
+            for index, user_input in pending:
+                await queue.put(await self._run_item(index, user_input))
+
+        worker_count = min(self._max_concurrency, len(self._inputs))
+        workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+        try:
+            for _ in range(len(self._inputs)):
+                result = await queue.get()
+                self._results.append(result)
+                yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._finished_at = self._timer()
+
+    async def collect(self) -> BatchReport:
+        """Run the whole batch and return results in input order."""
+        async for _ in self:
+            pass
+        ordered = sorted(self._results, key=lambda result: result.index)
+        return BatchReport(results=ordered, summary=self.summary())
+
+    def summary(self) -> BatchSummary:
+        if self._started_at is None:
+            elapsed_ms = 0.0
+        else:
+            end = self._finished_at if self._finished_at is not None else self._timer()
+            elapsed_ms = (end - self._started_at) * 1000
+        return summarize_batch(self._results, elapsed_ms)
+
+    async def _run_item(self, index: int, user_input: str) -> BatchItemResult:
+        started = self._timer()
+        response: AgentResponse | None = None
+        error: Exception | None = None
+        try:
+            response = await self._runner(user_input, self._memory_factory())
+        except Exception as exc:  # noqa: BLE001 - failures are reported per item
+            error = exc
+        return BatchItemResult(
+            index=index,
+            user_input=user_input,
+            response=response,
+            error=error,
+            latency_ms=(self._timer() - started) * 1000,
+        )
+
+
+def summarize_batch(
+    results: Sequence[BatchItemResult], elapsed_ms: float
+) -> BatchSummary:
+    latencies = sorted(result.latency_ms for result in results)
+    failed = sum(1 for result in results if not result.ok)
+    total = len(results)
+    return BatchSummary(
+        total=total,
+        succeeded=total - failed,
+        failed=failed,
+        elapsed_ms=elapsed_ms,
+        throughput_per_s=total / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0,
+        latency_mean_ms=sum(latencies) / total if total else 0.0,
+        latency_p50_ms=_percentile(latencies, 50),
+        latency_p95_ms=_percentile(latencies, 95),
+        latency_max_ms=latencies[-1] if latencies else 0.0,
+    )
+
+
+def _percentile(sorted_values: Sequence[float], percent: int) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
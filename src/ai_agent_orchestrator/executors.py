@@ -0,0 +1,112 @@
+"""Dedicated executors and concurrency limits for blocking work driven from async code."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+import weakref
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """How long a call waited before it started and how many calls were ahead of it."""
+
+    wait_ms: float = 0.0
+    depth: int = 0
+
+    def __add__(self, other: QueueStats) -> QueueStats:
+        return QueueStats(wait_ms=self.wait_ms + other.wait_ms, depth=self.depth + other.depth)
+
+
+class ExecutorLane:
+    """Runs blocking callables on a dedicated executor and measures their queueing.
+
+    Give model calls and tools separate lanes so a burst of one cannot starve the other.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self.executor = executor
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls submitted to this lane that have not started yet."""
+        return self._queued
+
+    async def run(self, func: Callable[..., T], *args: object) -> tuple[T, QueueStats]:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        enqueued = time.perf_counter()
+        started: list[float] = []
+        with self._lock:
+            depth = self._queued
+            self._queued += 1
+
+        def _dequeue() -> None:
+            with self._lock:
+                if not started:
+                    started.append(time.perf_counter())
+                    self._queued -= 1
+
+        def _call() -> T:
+            _dequeue()
+            return context.run(func, *args)
+
+        try:
+            result = await loop.run_in_executor(self.executor, _call)
+        finally:
+            # A call cancelled before a worker picked it up never runs `_call`.
+            _dequeue()
+        return result, QueueStats(wait_ms=(started[0] - enqueued) * 1000, depth=depth)
+
+
+@dataclass
+class _LoopSlots:
+    semaphore: asyncio.Semaphore
+    waiting: int = 0
+
+
+class ConcurrencyLimit:
+    """Bounds concurrent calls per event loop and reports how long callers waited."""
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be a positive integer.")
+        self.limit = limit
+        self._slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSlots] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[QueueStats]:
+        slots = self._loop_slots()
+        depth = slots.waiting
+        enqueued = time.perf_counter()
+        slots.waiting += 1
+        try:
+            await slots.semaphore.acquire()
+        finally:
+            slots.waiting -= 1
+        try:
+            yield QueueStats(wait_ms=(time.perf_counter() - enqueued) * 1000, depth=depth)
+        finally:
+            slots.semaphore.release()
+
+    def _loop_slots(self) -> _LoopSlots:
+        # asyncio semaphores bind to one loop; keep one per loop using this limit.
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._slots.get(loop)
+            if slots is None:
+                slots = _LoopSlots(semaphore=asyncio.Semaphore(self.limit))
+                self._slots[loop] = slots
+            return slots
@@ -4,7 +4,7 @@ import asyncio
 from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass
-from typing import AsyncIterator, Deque, Protocol, Sequence, TypeAlias, runtime_checkable
+from typing import Any, AsyncIterator, Deque, Protocol, Sequence, TypeAlias, runtime_checkable
 
 from ai_agent_orchestrator.protocol.messages import Message
 from ai_agent_orchestrator.protocol.outputs import FinalOutput
@@ -66,6 +66,13 @@ async def async_generate_via_thread(
     return await asyncio.to_thread(llm.generate, conversation)
 
 
+async def aclose_stream(stream: AsyncIterator[Any]) -> None:
+    """Close a provider stream early (e.g. its HTTP response) if it supports `aclose`."""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 class FakeLLM(LLMClient):
     """Deterministic LLM for offline demos and tests."""
 
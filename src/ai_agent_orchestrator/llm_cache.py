@@ -0,0 +1,252 @@
+"""Content-addressed caching of LLM responses (in-memory LRU plus optional SQLite)."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Mapping, Sequence
+
+from ai_agent_orchestrator.llm import (
+    LLMClient,
+    LLMStreamChunk,
+    SupportsAsyncGenerate,
+    SupportsAsyncStream,
+    SupportsSyncGenerate,
+    aclose_stream,
+)
+from ai_agent_orchestrator.protocol.messages import Message
+
+
+@dataclass(frozen=True)
+class LLMCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+
+def conversation_key(
+    conversation: Sequence[Message], model_config: Mapping[str, Any] | None = None
+) -> str:
+    """Stable SHA-256 of the message sequence and model configuration."""
+    payload = {
+        "config": dict(model_config or {}),
+        "messages": [[msg.role, msg.content, msg.name] for msg in conversation],
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Thread-safe response store: an in-memory LRU backed by an optional SQLite file."""
+
+    def __init__(self, max_entries: int = 1024, path: Path | str | None = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_ms INTEGER NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def stats(self) -> LLMCacheStats:
+        with self._lock:
+            return LLMCacheStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                writes=self._writes,
+            )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value = str(row[0])
+                    self._remember(key, value)
+                    self._hits += 1
+                    self._disk_hits += 1
+                    return value
+            self._misses += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            self._remember(key, response)
+            self._writes += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_ms) "
+                    "VALUES (?, ?, ?)",
+                    (key, response, int(time.time() * 1000)),
+                )
+                self._db.commit()
+
+    @property
+    def persistent(self) -> bool:
+        """True if entries are also stored in SQLite, so `get`/`put` may block on disk."""
+        return self._db is not None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, response: str) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Public client attributes that identify the model behind it; part of every cache key.
+_IDENTITY_ATTRIBUTES = ("model", "base_url")
+
+
+def _client_identity(llm: Any) -> dict[str, Any]:
+    identity: dict[str, Any] = {"client": type(llm).__qualname__}
+    for name in _IDENTITY_ATTRIBUTES:
+        value = getattr(llm, name, None)
+        if isinstance(value, (str, int, float)):
+            identity[name] = value
+    return identity
+
+
+class _CachingBase:
+    def __init__(
+        self,
+        llm: Any,
+        cache: LLMResponseCache,
+        model_config: Mapping[str, Any] | None = None,
+        replay_chunk_size: int = 64,
+    ) -> None:
+        if replay_chunk_size < 1:
+            raise ValueError("replay_chunk_size must be a positive integer.")
+        self.llm = llm
+        self.cache = cache
+        self._model_config = {**_client_identity(llm), **(model_config or {})}
+        self._replay_chunk_size = replay_chunk_size
+
+    def cache_key(self, conversation: Sequence[Message]) -> str:
+        return conversation_key(conversation, self._model_config)
+
+    async def _get_async(self, key: str) -> str | None:
+        # SQLite lookups run in a worker thread so they never block the event loop.
+        if self.cache.persistent:
+            return await asyncio.to_thread(self.cache.get, key)
+        return self.cache.get(key)
+
+    async def _put_async(self, key: str, response: str) -> None:
+        if self.cache.persistent:
+            await asyncio.to_thread(self.cache.put, key, response)
+        else:
+            self.cache.put(key, response)
+
+    async def stream(
+        self, conversation: Sequence[Message]
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Replay a cached response as chunks, or stream through and cache the result."""
+        key = self.cache_key(conversation)
+        cached = await self._get_async(key)
+        if cached is not None:
+            size = self._replay_chunk_size
+            for offset in range(0, len(cached), size):
+                yield LLMStreamChunk(content=cached[offset : offset + size])
+            # A non-empty final chunk would be taken for the whole response.
+            yield LLMStreamChunk(content="", is_final=True)
+            return
+        if not isinstance(self.llm, SupportsAsyncStream):
+            response = await self._generate_uncached(conversation)
+            await self._put_async(key, response)
+            yield LLMStreamChunk(content=response, is_final=True)
+            return
+        parts: list[str] = []
+        inner = self.llm.stream(conversation)
+        try:
+            async for chunk in inner:
+                parts.append(chunk.content)
+                yield chunk
+        finally:
+            await aclose_stream(inner)
+        # Only completed streams are cached; an abandoned stream never reaches here.
+        await self._put_async(key, "".join(parts))
+
+    async def _generate_uncached(self, conversation: Sequence[Message]) -> str:
+        generate = self.llm.generate
+        if inspect.iscoroutinefunction(generate):
+            return str(await generate(conversation))
+        return str(await asyncio.to_thread(generate, conversation))
+
+
+class CachingLLM(_CachingBase, LLMClient):
+    """Caches a synchronous LLM client's responses, keyed by conversation content."""
+
+    def __init__(
+        self,
+        llm: SupportsSyncGenerate,
+        cache: LLMResponseCache,
+        model_config: Mapping[str, Any] | None = None,
+        replay_chunk_size: int = 64,
+    ) -> None:
+        super().__init__(llm, cache, model_config, replay_chunk_size)
+
+    def generate(self, conversation: Sequence[Message]) -> str:
+        """Cached or fresh response text, always a plain `str`."""
+        key = self.cache_key(conversation)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = str(self.llm.generate(conversation))
+        self.cache.put(key, response)
+        return response
+
+
+class AsyncCachingLLM(_CachingBase):
+    """Caches an async LLM client's responses, keyed by conversation content."""
+
+    def __init__(
+        self,
+        llm: SupportsAsyncGenerate,
+        cache: LLMResponseCache,
+        model_config: Mapping[str, Any] | None = None,
+        replay_chunk_size: int = 64,
+    ) -> None:
+        super().__init__(llm, cache, model_config, replay_chunk_size)
+
+    async def generate(self, conversation: Sequence[Message]) -> str:
+        """Cached or fresh response text, always a plain `str`."""
+        key = self.cache_key(conversation)
+        cached = await self._get_async(key)
+        if cached is not None:
+            return cached
+        response = str(await self.llm.generate(conversation))
+        await self._put_async(key, response)
+        return response
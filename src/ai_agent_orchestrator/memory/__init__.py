@@ -1,4 +1,17 @@
-from ai_agent_orchestrator.memory.base import Memory
+from ai_agent_orchestrator.memory.base import (
+    ConversationView,
+    Memory,
+    PrefixedView,
+    SharedPrefix,
+)
 from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.memory.window import SlidingWindowMemory
 
-__all__ = ["Memory", "InMemoryMemory"]
+__all__ = [
+    "ConversationView",
+    "Memory",
+    "InMemoryMemory",
+    "PrefixedView",
+    "SharedPrefix",
+    "SlidingWindowMemory",
+]
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import List
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain, islice
+from typing import (
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    List,
+    Protocol,
+    Sequence,
+    cast,
+    overload,
+    runtime_checkable,
+)
 
 from ai_agent_orchestrator.protocol.messages import Message
 
 
 class Memory(ABC):
-    """Conversation memory interface."""
+    """Conversation memory interface.
+
+    Only `add` and `get_conversation` are required. The read-only accessors below have
+    copying defaults; memories override them to avoid the copy.
+    """
 
     @abstractmethod
     def add(self, message: Message) -> None:
@@ -16,3 +36,268 @@ class Memory(ABC):
     @abstractmethod
     def get_conversation(self) -> List[Message]:
         raise NotImplementedError
+
+    def flush(self) -> None:
+        """Persist buffered messages; the agent calls this when a run finishes."""
+        return None
+
+    def snapshot(self) -> Sequence[Message]:
+        """Immutable view of the conversation as it is now."""
+        return tuple(self.get_conversation())
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter that advances with every added message."""
+        return len(self.get_conversation())
+
+    def messages_since(self, version: int) -> Sequence[Message]:
+        """Messages added after `version` was read, oldest first.
+
+        Memories that rewrite earlier messages (see `SupportsCompaction`) return the whole
+        conversation for versions older than the last rewrite.
+        """
+        _check_version(version, self.version)
+        return tuple(self.get_conversation()[version:])
+
+    def fork(self) -> Memory:
+        """Independent memory that starts with this conversation; the two then diverge.
+
+        A fork has the same type and configuration as its parent. Memories that cannot
+        fork raise `NotImplementedError`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement fork.")
+
+    def __len__(self) -> int:
+        return len(self.get_conversation())
+
+
+@runtime_checkable
+class SupportsAsyncMemory(Protocol):
+    """Optional protocol for memories whose I/O should not run on the event loop.
+
+    The async agent paths use these methods instead of `add`, `snapshot` and `flush`
+    when a memory provides them. `ExecutorMemory` adds them to any sync memory.
+    """
+
+    async def add_async(self, message: Message) -> None: ...
+
+    async def extend_async(self, messages: Sequence[Message]) -> None:
+        """Add `messages` in order, as one batch where the backend supports it."""
+        ...
+
+    async def get_conversation_async(self) -> Sequence[Message]: ...
+
+    async def flush_async(self) -> None: ...
+
+
+# A message list shared with other memories and how many of its messages are included.
+Segment = tuple[Sequence[Message], int]
+
+
+@runtime_checkable
+class SupportsCompaction(Protocol):
+    """Optional protocol for memories whose messages can be rewritten in place."""
+
+    def replace_span(
+        self, start: int, expected: Sequence[Message], replacement: Sequence[Message]
+    ) -> bool:
+        """Atomically swap `expected`, found at `start`, for `replacement`.
+
+        Returns False, changing nothing, if those messages are no longer there.
+        """
+        ...
+
+
+class ConversationView(Sequence[Message]):
+    """Read-only window `[start, stop)` over an append-only message list.
+
+    Creating a view copies nothing, and messages appended to the list later are not
+    visible through it.
+    """
+
+    __slots__ = ("_messages", "_start", "_stop")
+
+    def __init__(self, messages: List[Message], start: int = 0, stop: int | None = None) -> None:
+        self._messages = messages
+        self._start = start
+        self._stop = len(messages) if stop is None else stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Message]: ...
+
+    def __getitem__(self, index: int | slice) -> Message | Sequence[Message]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return ConversationView(
+                    self._messages, self._start + start, self._start + max(start, stop)
+                )
+            return tuple(self._messages[self._start + i] for i in range(start, stop, step))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("conversation index out of range")
+        return self._messages[self._start + index]
+
+    def __iter__(self) -> Iterator[Message]:
+        return islice(self._messages, self._start, self._stop)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (ConversationView, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ConversationView({list(self)!r})"
+
+
+class SharedPrefix(Sequence[Message]):
+    """Immutable messages, such as a system prompt, that many memories reference.
+
+    The messages are validated once and stored once however many conversations start
+    with them; treat them as read-only. `SharedPrefix.system` interns prefixes by
+    content, so equal prompts resolve to the same object. `encoded` lets a serializer
+    encode each message of the prefix a single time.
+    """
+
+    __slots__ = ("_messages", "_encoded", "_lock", "__weakref__")
+
+    _interned: ClassVar[weakref.WeakValueDictionary[str, SharedPrefix]] = (
+        weakref.WeakValueDictionary()
+    )
+    _intern_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, messages: Iterable[Message]) -> None:
+        self._messages = tuple(messages)
+        self._encoded: dict[Callable[[Message], str], tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def system(cls, content: str) -> SharedPrefix:
+        """The interned prefix holding one system message with `content`."""
+        with cls._intern_lock:
+            prefix = cls._interned.get(content)
+            if prefix is None:
+                prefix = cls([Message(role="system", content=content)])
+                cls._interned[content] = prefix
+            return prefix
+
+    def encoded(self, encode: Callable[[Message], str]) -> tuple[str, ...]:
+        """Each message encoded with `encode`, computed on the first call per function."""
+        fragments = self._encoded.get(encode)
+        if fragments is None:
+            with self._lock:
+                fragments = self._encoded.get(encode)
+                if fragments is None:
+                    fragments = tuple(encode(message) for message in self._messages)
+                    self._encoded[encode] = fragments
+        return fragments
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Message]: ...
+
+    def __getitem__(self, index: int | slice) -> Message | Sequence[Message]:
+        return self._messages[index]
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages)
+
+    def __repr__(self) -> str:
+        return f"SharedPrefix({list(self._messages)!r})"
+
+
+class PrefixedView(ConversationView):
+    """Shared prefix `segments` followed by the first `stop` messages of `messages`.
+
+    `ends` holds the cumulative length of the segments. Indexing into the prefix costs
+    O(log len(segments)); slices that fall inside `messages` are plain views.
+    """
+
+    __slots__ = ("_segments", "_ends")
+
+    def __init__(
+        self,
+        segments: Sequence[Segment],
+        ends: Sequence[int],
+        messages: List[Message],
+        stop: int | None = None,
+    ) -> None:
+        super().__init__(messages, 0, stop)
+        self._segments = segments
+        self._ends = ends
+
+    @property
+    def shared_prefix(self) -> SharedPrefix | None:
+        """The `SharedPrefix` this conversation starts with, if any."""
+        head = self._segments[0][0]
+        return head if isinstance(head, SharedPrefix) else None
+
+    def __len__(self) -> int:
+        return self._ends[-1] + self._stop
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Message]: ...
+
+    def __getitem__(self, index: int | slice) -> Message | Sequence[Message]:
+        shared = self._ends[-1]
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and start >= shared:
+                return ConversationView(
+                    self._messages, start - shared, max(start, stop) - shared
+                )
+            return tuple(self[i] for i in range(start, stop, step))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("conversation index out of range")
+        if index >= shared:
+            return self._messages[index - shared]
+        segment = bisect_right(self._ends, index)
+        offset = self._ends[segment - 1] if segment else 0
+        return self._segments[segment][0][index - offset]
+
+    def __iter__(self) -> Iterator[Message]:
+        return chain(
+            *(islice(messages, stop) for messages, stop in self._segments),
+            islice(self._messages, self._stop),
+        )
+
+    def __repr__(self) -> str:
+        return f"PrefixedView({list(self)!r})"
+
+
+def _check_version(version: int, current: int) -> None:
+    if not 0 <= version <= current:
+        raise ValueError(f"version must be between 0 and the current version {current}.")
+
+
+def _as_async_memory(memory: Memory) -> SupportsAsyncMemory | None:
+    """`memory` as a `SupportsAsyncMemory`, or None if it has no async methods."""
+    return cast(SupportsAsyncMemory, memory) if _has_async_methods(type(memory)) else None
+
+
+# Protocol checks cost tens of microseconds per call; memories define the async methods
+# on their class, so the answer is cached per type (bounded, as types can be made at will).
+@lru_cache(maxsize=256)
+def _has_async_methods(memory_type: type) -> bool:
+    return issubclass(memory_type, SupportsAsyncMemory)
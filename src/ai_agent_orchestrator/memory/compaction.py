@@ -0,0 +1,126 @@
+"""Summarize old tool/assistant turns off the critical path and archive the originals."""
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Callable, List, Sequence
+
+from ai_agent_orchestrator.memory.base import Memory, SupportsCompaction
+from ai_agent_orchestrator.memory.executor import ExecutorMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.tools.encoding import truncate
+
+SUMMARY_NAME = "summary"
+DEFAULT_SUMMARY_PROMPT = (
+    "Summarize the following agent conversation excerpt of tool calls and tool results. "
+    "Keep facts, file paths, identifiers, numbers and decisions needed to continue the "
+    "task; drop verbatim file contents and repeated output. Reply with the summary only."
+)
+
+Archive = Callable[[Sequence[Message]], None]
+
+
+class ConversationCompactor:
+    """Replaces spans of old `tool`/`assistant` messages with an LLM-written summary.
+
+    The newest `keep_recent` messages are never touched, and a span must have at least
+    `min_span` messages to be worth a summarizer call. The summarizer is any LLM client
+    with a sync or async `generate`; a smaller model than the agent's is usually enough.
+    It sees the span's messages, each truncated to `max_chars_per_message`. The summary
+    is swapped in with `replace_span`, which fails safely if the span changed in the
+    meantime, so compaction can run while the agent keeps appending. The original
+    messages go to `archive` (by default the `archived` list) once the swap succeeds.
+    """
+
+    def __init__(
+        self,
+        summarizer: Any,
+        keep_recent: int = 8,
+        min_span: int = 4,
+        roles: Sequence[str] = ("tool", "assistant"),
+        archive: Archive | None = None,
+        prompt: str = DEFAULT_SUMMARY_PROMPT,
+        max_chars_per_message: int = 4000,
+    ) -> None:
+        if keep_recent < 0:
+            raise ValueError("keep_recent must be non-negative.")
+        if min_span < 1:
+            raise ValueError("min_span must be a positive integer.")
+        self.summarizer = summarizer
+        self.keep_recent = keep_recent
+        self.min_span = min_span
+        self.roles = frozenset(roles)
+        self.prompt = prompt
+        self.max_chars_per_message = max_chars_per_message
+        self.archived: List[Message] = []
+        self._archive = archive if archive is not None else self.archived.extend
+        self.compactions = 0
+
+    def select(self, conversation: Sequence[Message]) -> tuple[int, Sequence[Message]] | None:
+        """The oldest compactable span as `(start, messages)`, or None."""
+        stop = max(0, len(conversation) - self.keep_recent)
+        start = None
+        for index in range(stop + 1):
+            eligible = index < stop and _compactable(conversation[index], self.roles)
+            if eligible and start is None:
+                start = index
+            elif not eligible and start is not None:
+                if index - start >= self.min_span:
+                    return start, conversation[start:index]
+                start = None
+        return None
+
+    async def compact_async(self, memory: Memory) -> bool:
+        """Summarize one span of `memory`; returns True if a summary was swapped in."""
+        if not isinstance(memory, SupportsCompaction) or not _supports_compaction(memory):
+            raise TypeError(f"{type(memory).__name__} does not support replace_span")
+        selected = self.select(memory.snapshot())
+        if selected is None:
+            return False
+        start, span = selected
+        summary = await self._summarize(span)
+        replacement = Message(
+            role="system",
+            name=SUMMARY_NAME,
+            content=f"Summary of {len(span)} earlier messages:\n{summary}",
+        )
+        replace_async = getattr(memory, "replace_span_async", None)
+        if replace_async is not None:
+            replaced = await replace_async(start, span, [replacement])
+        else:
+            replaced = memory.replace_span(start, span, [replacement])
+        if not replaced:
+            return False
+        self._archive(span)
+        self.compactions += 1
+        return True
+
+    def compact(self, memory: Memory) -> bool:
+        """Blocking `compact_async`, for use between runs outside an event loop."""
+        return asyncio.run(self.compact_async(memory))
+
+    async def _summarize(self, span: Sequence[Message]) -> str:
+        excerpt = "\n\n".join(
+            f"[{message.role}{f' {message.name}' if message.name else ''}]\n"
+            f"{truncate(message.content, self.max_chars_per_message)}"
+            for message in span
+        )
+        conversation = [
+            Message(role="system", content=self.prompt),
+            Message(role="user", content=excerpt),
+        ]
+        generate = self.summarizer.generate
+        if inspect.iscoroutinefunction(generate):
+            return str(await generate(conversation)).strip()
+        return str(await asyncio.to_thread(generate, conversation)).strip()
+
+
+def _supports_compaction(memory: Memory) -> bool:
+    # `ExecutorMemory` always has `replace_span`; it works only if the wrapped memory's does.
+    if isinstance(memory, ExecutorMemory):
+        memory = memory.memory
+    return isinstance(memory, SupportsCompaction)
+
+
+def _compactable(message: Message, roles: frozenset[str]) -> bool:
+    return message.role in roles and message.name != SUMMARY_NAME
@@ -0,0 +1,101 @@
+"""Async access to sync memories by running their calls on an executor."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor
+from typing import Callable, List, Sequence, TypeVar
+
+from ai_agent_orchestrator.executors import ExecutorLane
+from ai_agent_orchestrator.memory.base import Memory, SupportsCompaction
+from ai_agent_orchestrator.protocol.messages import Message
+
+T = TypeVar("T")
+
+
+class ExecutorMemory(Memory):
+    """Wraps a sync memory so async agents never block the event loop on its I/O.
+
+    The async methods run the wrapped memory's calls on `executor`, or on the loop's
+    default executor when it is None; give disk or database backends their own
+    executor so they cannot starve model calls. `extend_async` adds a batch in one
+    executor call. The sync methods call the wrapped memory directly. Every call into
+    the wrapped memory, from any thread, holds one lock, so it need not be thread-safe.
+    `replace_span` forwards to wrapped memories that implement `SupportsCompaction`.
+    """
+
+    def __init__(self, memory: Memory, executor: Executor | None = None) -> None:
+        self.memory = memory
+        self.lane = None if executor is None else ExecutorLane(executor)
+        self._lock = threading.RLock()
+
+    def add(self, message: Message) -> None:
+        with self._lock:
+            self.memory.add(message)
+
+    def get_conversation(self) -> List[Message]:
+        with self._lock:
+            return self.memory.get_conversation()
+
+    def flush(self) -> None:
+        with self._lock:
+            self.memory.flush()
+
+    def snapshot(self) -> Sequence[Message]:
+        with self._lock:
+            return self.memory.snapshot()
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self.memory.version
+
+    def messages_since(self, version: int) -> Sequence[Message]:
+        with self._lock:
+            return self.memory.messages_since(version)
+
+    def replace_span(
+        self, start: int, expected: Sequence[Message], replacement: Sequence[Message]
+    ) -> bool:
+        if not isinstance(self.memory, SupportsCompaction):
+            raise TypeError(f"{type(self.memory).__name__} does not support replace_span")
+        with self._lock:
+            return self.memory.replace_span(start, expected, replacement)
+
+    def fork(self) -> ExecutorMemory:
+        with self._lock:
+            forked = ExecutorMemory(self.memory.fork())
+        forked.lane = self.lane
+        return forked
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.memory)
+
+    async def add_async(self, message: Message) -> None:
+        await self._run(self.add, message)
+
+    async def extend_async(self, messages: Sequence[Message]) -> None:
+        await self._run(self._extend, tuple(messages))
+
+    async def get_conversation_async(self) -> Sequence[Message]:
+        return await self._run(self.snapshot)
+
+    async def flush_async(self) -> None:
+        await self._run(self.flush)
+
+    async def replace_span_async(
+        self, start: int, expected: Sequence[Message], replacement: Sequence[Message]
+    ) -> bool:
+        return await self._run(self.replace_span, start, tuple(expected), tuple(replacement))
+
+    def _extend(self, messages: Sequence[Message]) -> None:
+        with self._lock:
+            for message in messages:
+                self.memory.add(message)
+
+    async def _run(self, func: Callable[..., T], *args: object) -> T:
+        if self.lane is None:
+            return await asyncio.to_thread(func, *args)
+        result, _ = await self.lane.run(func, *args)
+        return result
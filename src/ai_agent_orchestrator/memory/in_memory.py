@@ -1,19 +1,109 @@
 from __future__ import annotations
 
-from typing import List
+import threading
+from typing import List, Sequence
 
-from ai_agent_orchestrator.memory.base import Memory
+from ai_agent_orchestrator.memory.base import (
+    ConversationView,
+    Memory,
+    PrefixedView,
+    Segment,
+    SharedPrefix,
+    _check_version,
+)
 from ai_agent_orchestrator.protocol.messages import Message
 
 
 class InMemoryMemory(Memory):
-    """Simple in-memory conversation store."""
+    """Simple in-memory conversation store.
 
-    def __init__(self) -> None:
+    Messages are appended to a list, so `snapshot` and `messages_since` return views over
+    it instead of copying it. `replace_span` builds a new list instead of editing the old
+    one, so views handed out earlier never change. `fork` shares those lists with the new
+    memory as a read-only prefix, so forking costs the same for any conversation length
+    and each branch stores only the messages added to it. A `prefix` (typically the
+    system prompt) starts the conversation the same way, stored once for all memories.
+    """
+
+    def __init__(self, prefix: SharedPrefix | None = None) -> None:
         self._messages: List[Message] = []
+        # Prefix shared with other memories, and the cumulative end of each segment.
+        self._segments: tuple[Segment, ...] = ()
+        self._ends: tuple[int, ...] = ()
+        if prefix:
+            self._segments, self._ends = ((prefix, len(prefix)),), (len(prefix),)
+        self._version = len(self)
+        # Version right after the last `replace_span`.
+        self._rewritten_at = 0
+        self._lock = threading.Lock()
 
     def add(self, message: Message) -> None:
-        self._messages.append(message)
+        with self._lock:
+            self._messages.append(message)
+            self._version += 1
+
+    def fork(self) -> InMemoryMemory:
+        with self._lock:
+            forked = InMemoryMemory()
+            forked._segments, forked._ends = self._segments, self._ends
+            if self._messages:
+                # Our list keeps growing, but the fork only ever reads its current length.
+                forked._segments += ((self._messages, len(self._messages)),)
+                forked._ends += (self._shared_length() + len(self._messages),)
+            forked._version = self._version
+            forked._rewritten_at = self._rewritten_at
+        return forked
+
+    def replace_span(
+        self, start: int, expected: Sequence[Message], replacement: Sequence[Message]
+    ) -> bool:
+        with self._lock:
+            offset = start - self._shared_length()
+            # A span reaching into the shared prefix needs a private copy of it.
+            unshare = offset < 0
+            messages = list(self._view()) if unshare else self._messages
+            if unshare:
+                offset = start
+            stop = offset + len(expected)
+            current = messages[offset:stop]
+            if len(current) != len(expected) or any(
+                mine is not theirs for mine, theirs in zip(current, expected, strict=True)
+            ):
+                return False
+            self._messages = [*messages[:offset], *replacement, *messages[stop:]]
+            if unshare:
+                self._segments, self._ends = (), ()
+            self._version += 1
+            self._rewritten_at = self._version
+            return True
 
     def get_conversation(self) -> List[Message]:
-        return list(self._messages)
+        return list(self.snapshot())
+
+    def snapshot(self) -> ConversationView:
+        with self._lock:
+            return self._view()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def messages_since(self, version: int) -> Sequence[Message]:
+        with self._lock:
+            view, current = self._view(), self._version
+        _check_version(version, current)
+        if version < self._rewritten_at:
+            return view
+        # Every version since the last rewrite is one appended message.
+        return view[len(view) - (current - version) :]
+
+    def __len__(self) -> int:
+        return self._shared_length() + len(self._messages)
+
+    def _shared_length(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def _view(self) -> ConversationView:
+        if not self._segments:
+            return ConversationView(self._messages)
+        return PrefixedView(self._segments, self._ends, self._messages)
@@ -0,0 +1,336 @@
+"""Append-only JSONL message log with mmap reads and compaction (experimental)."""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
+
+from ai_agent_orchestrator.memory.base import ConversationView, Memory, _check_version
+from ai_agent_orchestrator.protocol.messages import Message
+
+_SEQ_MARKER = b'","q":'
+_string = json.encoder.encode_basestring_ascii
+
+
+@dataclass
+class _SessionLog:
+    # Seq of the oldest retained message; earlier ones were compacted away.
+    first_seq: int = 0
+    # (offset, length) of each retained message's line in the log file.
+    spans: List[tuple[int, int]] = field(default_factory=list)
+    # Decoded messages; None until first read for messages loaded from disk.
+    messages: List[Optional[Message]] = field(default_factory=list)
+
+
+class JsonlLogStore:
+    """Append-only log file holding the messages of many sessions, one JSON line each.
+
+    Appends are buffered writes to the end of the file. Opening the store scans the file
+    once to build an offset index per session, reading only each line's session id and
+    sequence number; messages are decoded from an mmap of the file when first read. A
+    torn last line left by a crash is truncated on open. `compact` rewrites the file
+    without dropped sessions and, when `retain_messages` is set, without each session's
+    messages beyond its newest `retain_messages`.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        retain_messages: int | None = None,
+        fsync: bool = False,
+    ) -> None:
+        if retain_messages is not None and retain_messages < 1:
+            raise ValueError("retain_messages must be a positive integer or None.")
+        self.path = Path(path)
+        self.retain_messages = retain_messages
+        self.fsync = fsync
+        self.recovered_bytes = 0
+        self._lock = threading.RLock()
+        self._sessions: Dict[str, _SessionLog] = {}
+        self._map: mmap.mmap | None = None
+        self.path.touch(exist_ok=True)
+        self._load_index()
+        self._file: BinaryIO = open(self.path, "ab")
+        self._written = self._file.tell()
+        self._flushed = self._written
+        self._compactor: threading.Thread | None = None
+        self._compact_lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def memory(self, session_id: str) -> JsonlMemory:
+        return JsonlMemory(self, session_id)
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            return [sid for sid, log in self._sessions.items() if log.spans]
+
+    def drop_session(self, session_id: str) -> None:
+        """Forget a session now; its lines stay in the file until the next `compact`."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._flushed = self._written
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            self.flush()
+            self._file.close()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def start_compaction(self, interval_s: float) -> None:
+        """Run `compact` on a daemon thread every `interval_s` seconds until `close`."""
+        if self._compactor is not None:
+            raise RuntimeError("Compaction is already running.")
+
+        def _loop() -> None:
+            while not self._closed.wait(interval_s):
+                self.compact()
+
+        self._compactor = threading.Thread(target=_loop, daemon=True)
+        self._compactor.start()
+
+    def compact(self) -> int:
+        """Rewrite the log without dropped or expired messages; returns bytes reclaimed.
+
+        The retained lines are copied to a new file without holding the store lock, so
+        appends and reads carry on meanwhile; lines appended during the copy are added
+        to the new file before it replaces the log.
+        """
+        with self._compact_lock:
+            with self._lock:
+                self.flush()
+                before = self._written
+                snapshot = [(log, len(log.spans)) for log in self._sessions.values()]
+                kept: List[tuple[int, int, int]] = []
+                for number, (log, count) in enumerate(snapshot):
+                    start = 0
+                    if self.retain_messages is not None:
+                        start = max(0, count - self.retain_messages)
+                    kept.extend((*log.spans[index], number) for index in range(start, count))
+            kept.sort()
+            partial = self.path.with_name(self.path.name + ".compact")
+            new_spans: List[List[tuple[int, int]]] = [[] for _ in snapshot]
+            position = 0
+            with open(partial, "wb") as out:
+                if before:
+                    with open(self.path, "rb") as handle:
+                        data = mmap.mmap(handle.fileno(), before, access=mmap.ACCESS_READ)
+                    with data:
+                        for offset, length, number in kept:
+                            out.write(data[offset : offset + length])
+                            new_spans[number].append((position, length))
+                            position += length
+                with self._lock:
+                    self.flush()
+                    after = self._written
+                    # Lines appended since the snapshot move over as they are.
+                    out.write(self._mapped(after)[before:after])
+                    out.flush()
+                    os.fsync(out.fileno())
+                    self._replace_log(partial, snapshot, new_spans, before, position)
+                    return after - self._written
+
+    def _replace_log(
+        self,
+        partial: Path,
+        snapshot: List[tuple[_SessionLog, int]],
+        new_spans: List[List[tuple[int, int]]],
+        before: int,
+        position: int,
+    ) -> None:
+        self._file.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        os.replace(partial, self.path)
+        shift = position - before
+        # `snapshot` keeps its logs alive, so their ids stay unique here.
+        retained = {
+            id(log): (count, spans)
+            for (log, count), spans in zip(snapshot, new_spans, strict=True)
+        }
+        for log in self._sessions.values():
+            count, spans = retained.get(id(log), (0, []))
+            tail = [(offset + shift, length) for offset, length in log.spans[count:]]
+            dropped = count - len(spans)
+            log.first_seq += dropped
+            log.spans = spans + tail
+            # A new list, so views handed out before compaction stay valid.
+            log.messages = log.messages[dropped:]
+        self._file = open(self.path, "ab")
+        self._written = self._flushed = self._file.tell()
+
+    def _append(self, session_id: str, message: Message) -> int:
+        with self._lock:
+            log = self._sessions.get(session_id)
+            if log is None:
+                log = self._sessions[session_id] = _SessionLog()
+            seq = log.first_seq + len(log.spans)
+            line = _encode_line(session_id, seq, message)
+            self._file.write(line)
+            log.spans.append((self._written, len(line)))
+            log.messages.append(message)
+            self._written += len(line)
+            return seq
+
+    def _log(self, session_id: str) -> _SessionLog:
+        with self._lock:
+            log = self._sessions.get(session_id)
+            if log is None:
+                log = self._sessions[session_id] = _SessionLog()
+            return log
+
+    def _decode_missing(self, log: _SessionLog) -> List[Message]:
+        """Decode the session's not-yet-read messages and return its message list."""
+        with self._lock:
+            messages = log.messages
+            if None in messages:
+                data = self._mapped(self._written)
+                for index, cached in enumerate(messages):
+                    if cached is None:
+                        offset, length = log.spans[index]
+                        messages[index] = _decode_line(data[offset : offset + length])
+            return messages  # type: ignore[return-value]
+
+    def _mapped(self, size: int) -> mmap.mmap | bytes:
+        if size == 0:
+            return b""
+        if size > self._flushed:
+            self.flush()
+        if self._map is None or len(self._map) < size:
+            if self._map is not None:
+                self._map.close()
+            with open(self.path, "rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _load_index(self) -> None:
+        size = self.path.stat().st_size
+        if size == 0:
+            return
+        with open(self.path, "r+b") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            position = 0
+            try:
+                while position < size:
+                    end = data.find(b"\n", position) + 1
+                    if end == 0 or (end == size and not _parses(data[position:end])):
+                        break
+                    session_id, seq = _line_key(data[position:end])
+                    log = self._sessions.setdefault(session_id, _SessionLog(first_seq=seq))
+                    log.spans.append((position, end - position))
+                    log.messages.append(None)
+                    position = end
+            finally:
+                data.close()
+            good = position
+            if good < size:
+                # The last write was cut short; drop the partial line.
+                handle.truncate(good)
+                self.recovered_bytes = size - good
+
+
+class JsonlMemory(Memory):
+    """Conversation memory of one session in a `JsonlLogStore`.
+
+    Appending writes one line to the log. Messages loaded from an existing log are
+    decoded on first read, and `snapshot` returns a view over the decoded list.
+    """
+
+    def __init__(self, store: JsonlLogStore, session_id: str) -> None:
+        self.store = store
+        self.session_id = session_id
+
+    def add(self, message: Message) -> None:
+        self.store._append(self.session_id, message)
+
+    def flush(self) -> None:
+        self.store.flush()
+
+    def fork(self, session_id: str | None = None) -> JsonlMemory:
+        """Copy the retained messages into a new session of the same store.
+
+        The new session is `session_id`, which must not have messages yet, or a fresh id.
+        """
+        if session_id is None:
+            session_id = f"{self.session_id}/{uuid.uuid4().hex}"
+        store = self.store
+        with store._lock:
+            if store._log(session_id).spans:
+                raise ValueError(f"Session '{session_id}' already has messages.")
+            for message in self.snapshot():
+                store._append(session_id, message)
+        return JsonlMemory(store, session_id)
+
+    def get_conversation(self) -> List[Message]:
+        return list(self.snapshot())
+
+    def snapshot(self) -> ConversationView:
+        return ConversationView(self.store._decode_missing(self.store._log(self.session_id)))
+
+    @property
+    def version(self) -> int:
+        log = self.store._log(self.session_id)
+        return log.first_seq + len(log.spans)
+
+    def messages_since(self, version: int) -> ConversationView:
+        log = self.store._log(self.session_id)
+        _check_version(version, log.first_seq + len(log.spans))
+        messages = self.store._decode_missing(log)
+        # Messages compacted away are gone; return what is still retained.
+        return ConversationView(messages, start=max(0, version - log.first_seq))
+
+    def __len__(self) -> int:
+        return len(self.store._log(self.session_id).spans)
+
+
+def _encode_line(session_id: str, seq: int, message: Message) -> bytes:
+    # Session id and seq lead every line so the index can be rebuilt without decoding
+    # message content. Strings go through the C string encoder directly, skipping the
+    # generic json.dumps dispatch on this hot path. It escapes everything outside ASCII,
+    # so text with lone surrogates round-trips instead of failing to encode.
+    name = "null" if message.name is None else _string(message.name)
+    return (
+        f'{{"s":{_string(session_id)},"q":{seq},'
+        f'"m":[{_string(message.role)},{_string(message.content)},{name}]}}\n'
+    ).encode("ascii")
+
+
+def _line_key(raw: bytes) -> tuple[str, int]:
+    marker = raw.find(_SEQ_MARKER, 6)
+    encoded_id = raw[5 : marker + 1]
+    session_id = (
+        json.loads(encoded_id) if b"\\" in encoded_id else encoded_id[1:-1].decode("utf-8")
+    )
+    seq_start = marker + len(_SEQ_MARKER)
+    seq_end = raw.index(b",", seq_start)
+    return session_id, int(raw[seq_start:seq_end])
+
+
+def _decode_line(line: bytes) -> Message:
+    role, content, name = json.loads(line)["m"]
+    return Message(role=role, content=content, name=name)
+
+
+def _parses(line: bytes) -> bool:
+    # Only the last line can be torn by a crash, so it alone is fully parsed on open.
+    try:
+        json.loads(line)
+    except ValueError:
+        return False
+    return True
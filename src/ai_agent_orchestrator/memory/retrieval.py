@@ -0,0 +1,270 @@
+"""Retrieval memory: recent messages plus the most relevant older ones (requires NumPy)."""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import re
+from typing import Any, Callable, List, Sequence
+
+from ai_agent_orchestrator.memory.base import Memory, _check_version
+from ai_agent_orchestrator.protocol.messages import Message
+
+# Maps texts to a `(len(texts), dim)` float array with L2-normalized rows.
+Embedder = Callable[[Sequence[str]], Any]
+
+_WORD = re.compile(r"\w+")
+
+
+def _numpy() -> Any:
+    if importlib.util.find_spec("numpy") is None:
+        raise RuntimeError(
+            "numpy is required for retrieval memory. Install with: pip install .[retrieval]"
+        )
+    return importlib.import_module("numpy")
+
+
+class HashedNgramEmbedder:
+    """Offline embedder: signed feature hashing of character n-grams of the words.
+
+    Texts are lowercased and reduced to their words, and every n-gram of bytes (word
+    boundaries included) is hashed into one of `dim` buckets, all in vectorized NumPy.
+    Needs no model or network access and is deterministic across processes. Only the
+    first `max_chars` characters of each text are embedded.
+    """
+
+    def __init__(self, dim: int = 256, ngram: int = 3, max_chars: int = 4000) -> None:
+        if dim < 1 or max_chars < 1:
+            raise ValueError("dim and max_chars must be positive integers.")
+        if not 1 <= ngram <= 8:
+            raise ValueError("ngram must be between 1 and 8.")
+        self.dim = dim
+        self.ngram = ngram
+        self.max_chars = max_chars
+        self._np = _numpy()
+
+    def __call__(self, texts: Sequence[str]) -> Any:
+        np = self._np
+        encoded = [
+            f" {' '.join(_WORD.findall(text[: self.max_chars].lower()))} ".encode()
+            for text in texts
+        ]
+        # One buffer for the whole batch; NUL separators mark n-grams spanning two texts.
+        data = np.frombuffer(b"\0".join(encoded) + b"\0", dtype=np.uint8)
+        rows = np.repeat(np.arange(len(texts)), [len(item) + 1 for item in encoded])
+        starts = len(data) - self.ngram + 1
+        codes = np.zeros(max(starts, 0), dtype=np.uint64)
+        valid = np.ones(len(codes), dtype=bool)
+        for offset in range(self.ngram):
+            window = data[offset : offset + len(codes)]
+            codes |= window.astype(np.uint64) << np.uint64(8 * offset)
+            valid &= window != 0
+        # Fibonacci hashing; bit 31 picks the sign so collisions tend to cancel out.
+        hashed = (codes[valid] * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(32)
+        signs = np.where(hashed & np.uint64(0x80000000), -1.0, 1.0)
+        flat = rows[: len(codes)][valid] * self.dim + (hashed % np.uint64(self.dim)).astype(
+            np.int64
+        )
+        counts = np.bincount(flat, weights=signs, minlength=len(texts) * self.dim)
+        vectors = counts.reshape(len(texts), self.dim).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class RetrievalMemory(Memory):
+    """Sends pinned system messages, the recent tail and the top-k relevant older messages.
+
+    Every message is stored, but `get_conversation` returns only the system messages, the
+    latest user message, the newest `recent_messages` messages and up to `top_k` older
+    messages whose cosine similarity to that user message is above `min_score`, in their
+    original order.
+    Older messages are embedded in batches the first time they fall out of the tail, into
+    a matrix that grows by doubling, so each message is embedded once. The embedder
+    defaults to `HashedNgramEmbedder`; any callable returning L2-normalized rows works.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        recent_messages: int = 8,
+        top_k: int = 4,
+        min_score: float = 0.0,
+        embed_batch_size: int = 256,
+    ) -> None:
+        if recent_messages < 0 or top_k < 0:
+            raise ValueError("recent_messages and top_k must be non-negative.")
+        if embed_batch_size < 1:
+            raise ValueError("embed_batch_size must be a positive integer.")
+        self._np = _numpy()
+        self.embedder = embedder if embedder is not None else HashedNgramEmbedder()
+        self.recent_messages = recent_messages
+        self.top_k = top_k
+        self.min_score = min_score
+        self.embed_batch_size = embed_batch_size
+        self._messages: List[Message] = []
+        self._system: List[int] = []
+        # Positions of non-system messages in `_messages`; the first `_indexed` are embedded
+        # into the same rows of `_vectors`.
+        self._candidates: List[int] = []
+        self._vectors: Any = None
+        self._indexed = 0
+        self._snapshot: tuple[Message, ...] | None = None
+        # (query, rows scored, top-k hits) from the previous selection.
+        self._top: tuple[str, int, List[tuple[int, float]]] | None = None
+
+    @property
+    def indexed(self) -> int:
+        """Number of older messages embedded so far."""
+        return self._indexed
+
+    def add(self, message: Message) -> None:
+        position = len(self._messages)
+        self._messages.append(message)
+        if message.role == "system":
+            self._system.append(position)
+        else:
+            self._candidates.append(position)
+        self._snapshot = None
+
+    def fork(self) -> RetrievalMemory:
+        """Copy with the same settings and embedder; embeddings are copied, not recomputed."""
+        forked = RetrievalMemory(
+            self.embedder,
+            recent_messages=self.recent_messages,
+            top_k=self.top_k,
+            min_score=self.min_score,
+            embed_batch_size=self.embed_batch_size,
+        )
+        forked._messages = list(self._messages)
+        forked._system = list(self._system)
+        forked._candidates = list(self._candidates)
+        if self._vectors is not None:
+            forked._vectors = self._vectors[: self._indexed].copy()
+        forked._indexed = self._indexed
+        forked._snapshot = self._snapshot
+        forked._top = self._top
+        return forked
+
+    def get_conversation(self) -> List[Message]:
+        return list(self.snapshot())
+
+    def snapshot(self) -> tuple[Message, ...]:
+        if self._snapshot is None:
+            self._snapshot = self._select()
+        return self._snapshot
+
+    def search(self, query: str, top_k: int | None = None) -> List[tuple[Message, float]]:
+        """Older messages most similar to `query`, best first, with their scores."""
+        return self.search_many([query], top_k)[0]
+
+    def search_many(
+        self, queries: Sequence[str], top_k: int | None = None
+    ) -> List[List[tuple[Message, float]]]:
+        """`search` for several queries, scored in one matrix product."""
+        return [
+            [(self._messages[self._candidates[row]], score) for row, score in hits]
+            for hits in self._search_rows(queries, self.top_k if top_k is None else top_k)
+        ]
+
+    @property
+    def version(self) -> int:
+        return len(self._messages)
+
+    def messages_since(self, version: int) -> tuple[Message, ...]:
+        """Every message added after `version`, whether or not it is currently selected."""
+        _check_version(version, len(self._messages))
+        return tuple(self._messages[version:])
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def _select(self) -> tuple[Message, ...]:
+        tail = self._candidates[len(self._candidates) - self._tail_size() :]
+        selected = set(self._system)
+        selected.update(tail)
+        query = self._query()
+        if query is not None:
+            # The latest user message is the query; it is always sent and never a hit.
+            position, content = query
+            selected.add(position)
+            if self.top_k:
+                hits = [self._candidates[row] for row, _ in self._top_rows(content)]
+                selected.update([hit for hit in hits if hit != position][: self.top_k])
+        return tuple(self._messages[position] for position in sorted(selected))
+
+    def _tail_size(self) -> int:
+        return min(self.recent_messages, len(self._candidates))
+
+    def _query(self) -> tuple[int, str] | None:
+        for position in reversed(self._candidates):
+            message = self._messages[position]
+            if message.role == "user":
+                return position, message.content
+        return None
+
+    def _top_rows(self, query: str) -> List[tuple[int, float]]:
+        # Agent steps within one run share a query, so only rows that left the tail since
+        # the previous step are scored and merged into the previous top-k.
+        older = self._index_older()
+        cached = self._top
+        # One extra hit in case the query message itself has left the tail.
+        k = self.top_k + 1
+        if cached is None or cached[0] != query:
+            hits = self._search_rows([query], k)[0]
+        elif cached[1] < older:
+            fresh = self._search_rows([query], k, start=cached[1])[0]
+            hits = sorted(cached[2] + fresh, key=lambda hit: -hit[1])[:k]
+        else:
+            hits = cached[2]
+        self._top = (query, older, hits)
+        return hits
+
+    def _search_rows(
+        self, queries: Sequence[str], k: int, start: int = 0
+    ) -> List[List[tuple[int, float]]]:
+        older = self._index_older()
+        if k == 0 or older <= start or not queries:
+            return [[] for _ in queries]
+        np = self._np
+        # (rows, queries) cosine scores; rows are already L2-normalized.
+        embedded = np.asarray(self.embedder(queries), dtype=np.float32)
+        scores = self._vectors[start:older] @ embedded.T
+        k = min(k, older - start)
+        top = np.argpartition(-scores, k - 1, axis=0)[:k]
+        hits: List[List[tuple[int, float]]] = []
+        for column in range(len(queries)):
+            rows = top[:, column]
+            rows = rows[np.argsort(-scores[rows, column], kind="stable")]
+            hits.append(
+                [
+                    (start + row, score)
+                    for row, score in zip(rows.tolist(), scores[rows, column].tolist(), strict=True)
+                    if score > self.min_score
+                ]
+            )
+        return hits
+
+    def _index_older(self) -> int:
+        """Embed candidates that have left the tail; returns how many are searchable."""
+        older = len(self._candidates) - self._tail_size()
+        while self._indexed < older:
+            stop = min(older, self._indexed + self.embed_batch_size)
+            texts = [
+                self._messages[position].content
+                for position in self._candidates[self._indexed : stop]
+            ]
+            self._append_vectors(self.embedder(texts))
+        return older
+
+    def _append_vectors(self, vectors: Any) -> None:
+        np = self._np
+        vectors = np.asarray(vectors, dtype=np.float32)
+        needed = self._indexed + len(vectors)
+        if self._vectors is None or needed > len(self._vectors):
+            capacity = max(needed, 2 * (0 if self._vectors is None else len(self._vectors)), 64)
+            grown = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+            if self._vectors is not None:
+                grown[: self._indexed] = self._vectors[: self._indexed]
+            self._vectors = grown
+        self._vectors[self._indexed : needed] = vectors
+        self._indexed = needed
@@ -0,0 +1,289 @@
+"""SQLite-backed conversation memory (experimental persistence adapter)."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import uuid
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Deque, Iterable, List, Sequence
+
+from ai_agent_orchestrator.memory.base import Memory, _check_version
+from ai_agent_orchestrator.protocol.messages import Message
+
+_Row = tuple[str, int, str, str, "str | None"]
+
+_SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class SQLiteMemoryStore:
+    """One SQLite database in WAL mode holding the messages of many sessions.
+
+    Every memory opened from the store shares its connection, guarded by a lock, so
+    sessions can live on any thread. Messages are keyed by `(session_id, seq)`, and a
+    session has at most one open memory. `flush()` commits the buffered messages of every
+    open memory in a single transaction. If the transaction fails it is rolled back and
+    each session is retried in a transaction of its own, so only the failing sessions'
+    messages stay buffered for the next flush.
+    """
+
+    def __init__(self, path: Path | str, synchronous: str = "NORMAL") -> None:
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS:
+            raise ValueError(f"synchronous must be one of {', '.join(_SYNCHRONOUS)}.")
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable across application crashes in WAL mode; FULL also survives
+        # power loss at the cost of an fsync per commit.
+        self._db.execute(f"PRAGMA synchronous={synchronous}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "session_id TEXT NOT NULL, seq INTEGER NOT NULL, role TEXT NOT NULL, "
+            "content TEXT NOT NULL, name TEXT, PRIMARY KEY (session_id, seq)"
+            ") WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS messages_system "
+            "ON messages (session_id, seq) WHERE role = 'system'"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+        # Memories with uncommitted messages, held until flushed so none are lost.
+        self._dirty: set[SQLiteMemory] = set()
+        self._dirty_lock = threading.Lock()
+        # Open memories by session id, so a session is never opened twice.
+        self._open: weakref.WeakValueDictionary[str, SQLiteMemory] = (
+            weakref.WeakValueDictionary()
+        )
+        self._open_lock = threading.Lock()
+        self.commits = 0
+
+    def memory(
+        self, session_id: str, tail_messages: int | None = 200, batch_size: int = 64
+    ) -> SQLiteMemory:
+        """Open the memory of `session_id`, loading its system messages and recent tail.
+
+        A session that is already open returns the same memory, whose settings are kept.
+        """
+        with self._open_lock:
+            memory = self._open.get(session_id)
+            if memory is None:
+                memory = SQLiteMemory(self, session_id, tail_messages, batch_size)
+                self._open[session_id] = memory
+            return memory
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            rows = self._db.execute("SELECT DISTINCT session_id FROM messages").fetchall()
+        return [str(row[0]) for row in rows]
+
+    def delete_session(self, session_id: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._db.commit()
+
+    def flush(self) -> None:
+        """Commit the pending messages of all open memories in one transaction."""
+        with self._dirty_lock:
+            dirty = list(self._dirty)
+        self._flush(dirty)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._db.close()
+
+    def _flush(self, memories: Sequence[SQLiteMemory]) -> None:
+        # Holding the lock throughout keeps concurrent flushes from writing a row twice.
+        with self._lock:
+            batches = [(memory, memory._pending_rows()) for memory in memories]
+            batches = [(memory, pending) for memory, pending in batches if pending]
+            if not batches:
+                return
+            try:
+                self._insert([row for _, pending in batches for row in pending])
+            except sqlite3.Error:
+                if len(batches) == 1:
+                    raise
+                self._flush_each(batches)
+                return
+            # Rows leave the buffers only once they are committed.
+            for memory, pending in batches:
+                memory._drop_pending(len(pending))
+
+    def _flush_each(self, batches: Sequence[tuple[SQLiteMemory, List[_Row]]]) -> None:
+        # One session's bad rows must not hold back the others; the first error is raised.
+        error: sqlite3.Error | None = None
+        for memory, pending in batches:
+            try:
+                self._insert(pending)
+            except sqlite3.Error as exc:
+                error = error or exc
+                continue
+            memory._drop_pending(len(pending))
+        if error is not None:
+            raise error
+
+    def _insert(self, rows: Sequence[_Row]) -> None:
+        # Commits on success and rolls back on error; either way nothing is half-written.
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO messages (session_id, seq, role, content, name) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        self.commits += 1
+
+    def _query(self, sql: str, params: Sequence[object]) -> List[tuple[int, Message]]:
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [
+            (int(seq), Message(role=role, content=content, name=name))
+            for seq, role, content, name in rows
+        ]
+
+
+class SQLiteMemory(Memory):
+    """Conversation memory of one session in a `SQLiteMemoryStore`.
+
+    Only the session's system messages and its most recent `tail_messages` other
+    messages are kept in RAM; `history` reads older ones on demand. Added messages are
+    buffered and committed together: when `batch_size` are pending, when the
+    conversation is read (the agent reads it once per step), and on `flush`.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteMemoryStore,
+        session_id: str,
+        tail_messages: int | None = 200,
+        batch_size: int = 64,
+    ) -> None:
+        if tail_messages is not None and tail_messages < 1:
+            raise ValueError("tail_messages must be a positive integer or None.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        self.store = store
+        self.session_id = session_id
+        self.batch_size = batch_size
+        self._pending: List[_Row] = []
+        # Guards `_pending` against a concurrent `SQLiteMemoryStore.flush`.
+        self._pending_lock = threading.Lock()
+        self._snapshot: tuple[Message, ...] | None = None
+        self._pinned = store._query(
+            "SELECT seq, role, content, name FROM messages "
+            "WHERE session_id = ? AND role = 'system' ORDER BY seq",
+            (session_id,),
+        )
+        recent = store._query(
+            "SELECT seq, role, content, name FROM messages "
+            "WHERE session_id = ? AND role != 'system' ORDER BY seq DESC LIMIT ?",
+            (session_id, -1 if tail_messages is None else tail_messages),
+        )
+        recent.reverse()
+        self._tail: Deque[tuple[int, Message]] = deque(recent, maxlen=tail_messages)
+        last = max(
+            (entries[-1][0] for entries in (self._pinned, recent) if entries), default=-1
+        )
+        self._next_seq = last + 1
+
+    def add(self, message: Message) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        if message.role == "system":
+            self._pinned.append((seq, message))
+        else:
+            self._tail.append((seq, message))
+        row = (self.session_id, seq, message.role, message.content, message.name)
+        with self._pending_lock:
+            if not self._pending:
+                with self.store._dirty_lock:
+                    self.store._dirty.add(self)
+            self._pending.append(row)
+            full = len(self._pending) >= self.batch_size
+        self._snapshot = None
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        self.store._flush([self])
+
+    def fork(self, session_id: str | None = None) -> SQLiteMemory:
+        """Copy every stored message into a new session of the same store and open it.
+
+        The new session is `session_id`, which must not be open or have messages yet, or
+        a fresh id.
+        """
+        if session_id is None:
+            session_id = f"{self.session_id}/{uuid.uuid4().hex}"
+        self.flush()
+        store = self.store
+        with store._lock:
+            if session_id in store._open or store._db.execute(
+                "SELECT 1 FROM messages WHERE session_id = ? LIMIT 1", (session_id,)
+            ).fetchone():
+                raise ValueError(f"Session '{session_id}' already has messages.")
+            with store._db:
+                store._db.execute(
+                    "INSERT INTO messages (session_id, seq, role, content, name) "
+                    "SELECT ?, seq, role, content, name FROM messages WHERE session_id = ?",
+                    (session_id, self.session_id),
+                )
+            store.commits += 1
+        return store.memory(session_id, self._tail.maxlen, self.batch_size)
+
+    def get_conversation(self) -> List[Message]:
+        return list(self.snapshot())
+
+    def snapshot(self) -> tuple[Message, ...]:
+        """System messages plus the recent tail; commits pending messages first."""
+        self.flush()
+        if self._snapshot is None:
+            self._snapshot = tuple(
+                message for _, message in _by_seq(self._pinned, self._tail)
+            )
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._next_seq
+
+    def messages_since(self, version: int) -> tuple[Message, ...]:
+        _check_version(version, self._next_seq)
+        if not self._tail or version >= self._tail[0][0]:
+            recent = [entry for entry in self._tail if entry[0] >= version]
+            pinned = [entry for entry in self._pinned if entry[0] >= version]
+            return tuple(message for _, message in _by_seq(pinned, recent))
+        return tuple(self.history(version))
+
+    def history(self, start: int = 0, stop: int | None = None) -> List[Message]:
+        """Stored messages with `start <= seq < stop`, read from the database."""
+        self.flush()
+        rows = self.store._query(
+            "SELECT seq, role, content, name FROM messages "
+            "WHERE session_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+            (self.session_id, start, self._next_seq if stop is None else stop),
+        )
+        return [message for _, message in rows]
+
+    def __len__(self) -> int:
+        # Counts the messages `snapshot` returns; `version` counts every stored message.
+        return len(self._pinned) + len(self._tail)
+
+    def _pending_rows(self) -> List[_Row]:
+        with self._pending_lock:
+            return list(self._pending)
+
+    def _drop_pending(self, count: int) -> None:
+        with self._pending_lock:
+            del self._pending[:count]
+            if not self._pending:
+                with self.store._dirty_lock:
+                    self.store._dirty.discard(self)
+
+
+def _by_seq(
+    pinned: Iterable[tuple[int, Message]], recent: Iterable[tuple[int, Message]]
+) -> List[tuple[int, Message]]:
+    return sorted([*pinned, *recent], key=lambda entry: entry[0])
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections import deque
+from heapq import merge
+from typing import Callable, Deque, List, NamedTuple, Sequence
+
+from ai_agent_orchestrator.memory.base import Memory, _check_version
+from ai_agent_orchestrator.protocol.messages import Message
+
+MessageSizer = Callable[[Message], int]
+EvictionCallback = Callable[[Sequence[Message]], None]
+
+
+def message_chars(message: Message) -> int:
+    """Default size of a message: its content length in characters."""
+    return len(message.content)
+
+
+class _Entry(NamedTuple):
+    seq: int
+    message: Message
+    size: int
+
+
+class SlidingWindowMemory(Memory):
+    """Keeps pinned system messages plus the most recent messages that fit a budget.
+
+    Sizes come from `size_fn` (content characters by default; pass a tokenizer-based
+    function to budget tokens) and are summed as messages are added. Once the total
+    exceeds `max_size`, the oldest unpinned messages are evicted until it fits again.
+    The newest message is always kept, even if it alone is over budget. Each batch of
+    evicted messages is passed to `on_evict`, e.g. to archive or summarize it.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        size_fn: MessageSizer = message_chars,
+        pin_system: bool = True,
+        on_evict: EvictionCallback | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        self.max_size = max_size
+        self.size_fn = size_fn
+        self.pin_system = pin_system
+        self.on_evict = on_evict
+        self._pinned: List[_Entry] = []
+        self._recent: Deque[_Entry] = deque()
+        self._size = 0
+        self._added = 0
+        self._snapshot: tuple[Message, ...] | None = None
+
+    @property
+    def size(self) -> int:
+        """Total size of the retained messages."""
+        return self._size
+
+    def add(self, message: Message) -> None:
+        entry = _Entry(self._added, message, self.size_fn(message))
+        self._added += 1
+        self._size += entry.size
+        self._snapshot = None
+        if self.pin_system and message.role == "system":
+            self._pinned.append(entry)
+            return
+        self._recent.append(entry)
+        evicted: List[Message] = []
+        while self._size > self.max_size and len(self._recent) > 1:
+            oldest = self._recent.popleft()
+            self._size -= oldest.size
+            evicted.append(oldest.message)
+        if evicted and self.on_evict is not None:
+            self.on_evict(evicted)
+
+    def fork(self) -> SlidingWindowMemory:
+        forked = SlidingWindowMemory(self.max_size, self.size_fn, self.pin_system, self.on_evict)
+        forked._pinned = list(self._pinned)
+        forked._recent = deque(self._recent)
+        forked._size = self._size
+        forked._added = self._added
+        forked._snapshot = self._snapshot
+        return forked
+
+    def get_conversation(self) -> List[Message]:
+        return list(self.snapshot())
+
+    def snapshot(self) -> tuple[Message, ...]:
+        if self._snapshot is None:
+            self._snapshot = tuple(entry.message for entry in self._pinned) + tuple(
+                entry.message for entry in self._recent
+            )
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._added
+
+    def messages_since(self, version: int) -> tuple[Message, ...]:
+        """Retained messages added after `version`, in the order they were added."""
+        _check_version(version, self._added)
+        pinned = (entry for entry in self._pinned if entry.seq >= version)
+        recent = _newer_than(self._recent, version)
+        return tuple(entry.message for entry in merge(pinned, recent))
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._recent)
+
+
+def _newer_than(entries: Deque[_Entry], version: int) -> List[_Entry]:
+    # Walk back from the newest entry so the cost is proportional to the result.
+    newer: List[_Entry] = []
+    for entry in reversed(entries):
+        if entry.seq < version:
+            break
+        newer.append(entry)
+    newer.reverse()
+    return newer
@@ -0,0 +1,103 @@
+"""Per-run event emission with a no-op fast path when nothing is listening."""
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+from ai_agent_orchestrator.observability.clock import Clock
+from ai_agent_orchestrator.observability.events import EventSink, build_event, emit_event
+from ai_agent_orchestrator.observability.ids import RunIdFactory, SpanIdFactory
+
+
+class Tracer(Protocol):
+    """Emits the structured events of a single agent run."""
+
+    enabled: bool
+    run_id: str
+
+    def new_span(self) -> str: ...
+
+    def emit(
+        self,
+        name: str,
+        step: int,
+        span_id: str,
+        parent_span_id: str | None,
+        data: dict[str, Any] | None = None,
+    ) -> None: ...
+
+
+class RunTracer:
+    """Builds and emits events to a sink, stamping them with the run id and clock."""
+
+    enabled = True
+
+    def __init__(
+        self,
+        sink: EventSink,
+        clock: Clock,
+        run_id: str,
+        span_id_factory: SpanIdFactory,
+    ) -> None:
+        self._sink = sink
+        self._clock = clock
+        self.run_id = run_id
+        self._span_id_factory = span_id_factory
+
+    def new_span(self) -> str:
+        return self._span_id_factory()
+
+    def emit(
+        self,
+        name: str,
+        step: int,
+        span_id: str,
+        parent_span_id: str | None,
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        emit_event(
+            self._sink,
+            build_event(
+                name=name,
+                time_ms=self._clock(),
+                run_id=self.run_id,
+                step=step,
+                span_id=span_id,
+                parent_span_id=parent_span_id,
+                data=data,
+            ),
+        )
+
+
+class NullTracer:
+    """Tracer used when no sink is attached: no clock reads, ids or allocations."""
+
+    enabled = False
+    run_id = ""
+
+    def new_span(self) -> str:
+        return ""
+
+    def emit(
+        self,
+        name: str,
+        step: int,
+        span_id: str,
+        parent_span_id: str | None,
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        return None
+
+
+NULL_TRACER = NullTracer()
+
+
+def create_tracer(
+    sink: EventSink | None,
+    clock: Clock,
+    run_id_factory: RunIdFactory,
+    span_id_factory: SpanIdFactory,
+) -> Tracer:
+    """Return a `RunTracer` for `sink`, or the shared `NULL_TRACER` when it is None."""
+    if sink is None:
+        return NULL_TRACER
+    return RunTracer(sink, clock, run_id_factory(), span_id_factory)
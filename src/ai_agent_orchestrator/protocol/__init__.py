@@ -1,4 +1,23 @@
 from ai_agent_orchestrator.protocol.messages import Message
-from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput, parse_output
+from ai_agent_orchestrator.protocol.outputs import (
+    DecodedOutput,
+    DecodedResponse,
+    FinalOutput,
+    ToolCall,
+    ToolCallOutput,
+    ToolCallsOutput,
+    decode_output,
+    parse_output,
+)
 
-__all__ = ["Message", "FinalOutput", "ToolCallOutput", "parse_output"]
+__all__ = [
+    "Message",
+    "FinalOutput",
+    "ToolCall",
+    "ToolCallOutput",
+    "ToolCallsOutput",
+    "DecodedOutput",
+    "DecodedResponse",
+    "decode_output",
+    "parse_output",
+]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from typing import Any, Literal, Union
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
 
 class ToolCallOutput(BaseModel):
@@ -12,12 +14,22 @@ class ToolCallOutput(BaseModel):
     args: dict[str, Any] = Field(default_factory=dict)
 
 
+class ToolCall(BaseModel):
+    tool_name: str
+    args: dict[str, Any] = Field(default_factory=dict)
+
+
+class ToolCallsOutput(BaseModel):
+    type: Literal["tool_calls"]
+    calls: list[ToolCall] = Field(min_length=1)
+
+
 class FinalOutput(BaseModel):
     type: Literal["final"]
     content: str
 
 
-OutputType = Union[ToolCallOutput, FinalOutput]
+OutputType = Union[ToolCallOutput, ToolCallsOutput, FinalOutput]
 
 
 def _serialize_content(content: dict[str, Any] | list[Any]) -> str:
@@ -32,49 +44,137 @@ def _serialize_content(content: dict[str, Any] | list[Any]) -> str:
         return str(content)
 
 
-def parse_output(raw: str) -> OutputType:
+@dataclass(frozen=True)
+class DecodedOutput:
+    """A model response decoded once, with the classification reported in events.
+
+    `parsed_type` is "invalid" (and `is_valid` False) whenever the response did not follow
+    the protocol; `output` is then the raw text wrapped in a `FinalOutput`.
+    """
+
+    output: OutputType
+    parsed_type: str
+    is_valid: bool
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        output = self.output
+        if not self.is_valid:
+            return {}
+        if isinstance(output, ToolCallOutput):
+            return {"tool_name": output.tool_name, "args_keys": sorted(output.args.keys())}
+        if isinstance(output, ToolCallsOutput):
+            return {
+                "tool_names": [call.tool_name for call in output.calls],
+                "calls_count": len(output.calls),
+            }
+        return {}
+
+
+class DecodedResponse(str):
+    """Response text that carries its `DecodedOutput`, so it is never decoded twice.
+
+    Clients that already decoded a response (e.g. to check protocol compliance) return
+    this instead of a plain `str`; `decode_output` then reuses the attached result.
+    """
+
+    decoded: DecodedOutput
+
+    def __new__(cls, text: str, decoded: DecodedOutput) -> DecodedResponse:
+        instance = super().__new__(cls, text)
+        instance.decoded = decoded
+        return instance
+
+
+def _parse_tool_calls(calls: Any) -> list[ToolCall] | None:
+    if not isinstance(calls, list) or not calls:
+        return None
+    parsed: list[ToolCall] = []
+    for call in calls:
+        if not isinstance(call, dict):
+            return None
+        tool_name = call.get("tool_name")
+        if not isinstance(tool_name, str) or not tool_name.strip():
+            return None
+        args = call.get("args", {})
+        if args is None:
+            args = {}
+        if not isinstance(args, dict):
+            return None
+        # Fields were checked above; skip re-validating (and copying) large args.
+        parsed.append(ToolCall.model_construct(tool_name=tool_name, args=args))
+    return parsed
+
+
+def _invalid(raw: str) -> DecodedOutput:
+    return DecodedOutput(
+        output=FinalOutput(type="final", content=raw), parsed_type="invalid", is_valid=False
+    )
+
+
+def decode_output(raw: str) -> DecodedOutput:
+    """Decode a model response with a single JSON parse."""
+    if isinstance(raw, DecodedResponse):
+        return raw.decoded
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return FinalOutput(type="final", content=raw)
+        # pydantic-core's parser builds the same Python objects about twice as fast as
+        # `json.loads`, which matters for large tool arguments.
+        data = from_json(raw)
+    except ValueError:
+        try:
+            # Slow path for inputs only the stdlib accepts, e.g. lone surrogate escapes.
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return _invalid(raw)
 
     if not isinstance(data, dict) or "type" not in data:
-        return FinalOutput(type="final", content=raw)
+        return _invalid(raw)
+
+    output_type = data.get("type")
+    if output_type == "tool_call":
+        tool_name = data.get("tool_name")
+        if not isinstance(tool_name, str) or not tool_name.strip():
+            return _invalid(raw)
+
+        args = data.get("args", {})
+        if args is None:
+            args = {}
+        if not isinstance(args, dict):
+            return _invalid(raw)
+
+        return DecodedOutput(
+            output=ToolCallOutput.model_construct(
+                type="tool_call", tool_name=tool_name, args=args
+            ),
+            parsed_type="tool_call",
+            is_valid=True,
+        )
+    if output_type == "tool_calls":
+        calls = _parse_tool_calls(data.get("calls"))
+        if calls is None:
+            return _invalid(raw)
+        return DecodedOutput(
+            output=ToolCallsOutput.model_construct(type="tool_calls", calls=calls),
+            parsed_type="tool_calls",
+            is_valid=True,
+        )
+    if output_type == "final":
+        if "content" not in data:
+            return _invalid(raw)
+
+        content = data.get("content")
+        if isinstance(content, str):
+            text = content
+        elif isinstance(content, (dict, list)):
+            text = _serialize_content(content)
+        else:
+            text = str(content)
+        return DecodedOutput(
+            output=FinalOutput(type="final", content=text), parsed_type="final", is_valid=True
+        )
+
+    return _invalid(raw)
 
-    try:
-        if data.get("type") == "tool_call":
-            tool_name = data.get("tool_name")
-            if not isinstance(tool_name, str) or not tool_name.strip():
-                return FinalOutput(type="final", content=raw)
-
-            args = data.get("args", {})
-            if args is None:
-                args = {}
-            if not isinstance(args, dict):
-                return FinalOutput(type="final", content=raw)
-
-            return ToolCallOutput.model_validate(
-                {"type": "tool_call", "tool_name": tool_name, "args": args}
-            )
-        if data.get("type") == "final":
-            if "content" not in data:
-                return FinalOutput(type="final", content=raw)
-
-            content = data.get("content")
-            if isinstance(content, str):
-                return FinalOutput(type="final", content=content)
-
-            if isinstance(content, (bool, int, float)) or content is None:
-                return FinalOutput(type="final", content=str(content))
-
-            if isinstance(content, (dict, list)):
-                return FinalOutput(
-                    type="final",
-                    content=_serialize_content(content),
-                )
-
-            return FinalOutput(type="final", content=str(content))
-    except ValidationError:
-        return FinalOutput(type="final", content=raw)
-
-    return FinalOutput(type="final", content=raw)
+
+def parse_output(raw: str) -> OutputType:
+    return decode_output(raw).output
@@ -0,0 +1,387 @@
+"""Multi-session conversation management with LRU eviction to a backing store."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from ai_agent_orchestrator.agent import Agent, AgentResponse
+from ai_agent_orchestrator.memory.base import Memory, _as_async_memory
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+
+
+class SessionStore(ABC):
+    """Backing store for conversations evicted from a `SessionManager`."""
+
+    @abstractmethod
+    def load(self, session_id: str) -> List[Message] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, session_id: str, messages: Sequence[Message]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        raise NotImplementedError
+
+
+class InMemorySessionStore(SessionStore):
+    """Keeps evicted sessions as compact JSON bytes in process memory."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def load(self, session_id: str) -> List[Message] | None:
+        with self._lock:
+            payload = self._sessions.get(session_id)
+        if payload is None:
+            return None
+        return _decode_messages(payload)
+
+    def save(self, session_id: str, messages: Sequence[Message]) -> None:
+        payload = _encode_messages(messages)
+        with self._lock:
+            self._sessions[session_id] = payload
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+
+class JsonDirectorySessionStore(SessionStore):
+    """Stores one JSON file per evicted session in a directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, session_id: str) -> List[Message] | None:
+        path = self._path(session_id)
+        if not path.exists():
+            return None
+        return _decode_messages(path.read_bytes())
+
+    def save(self, session_id: str, messages: Sequence[Message]) -> None:
+        path = self._path(session_id)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(_encode_messages(messages))
+        tmp_path.replace(path)
+
+    def delete(self, session_id: str) -> None:
+        self._path(session_id).unlink(missing_ok=True)
+
+    def _path(self, session_id: str) -> Path:
+        # Session ids are caller-controlled; hash them into safe file names.
+        digest = hashlib.sha256(session_id.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.json"
+
+
+@dataclass
+class _Session:
+    memory: Memory
+    # Memory version and length `size_bytes` was measured at, for incremental updates.
+    size_bytes: int = 0
+    size_version: int = 0
+    size_count: int = 0
+    in_use: int = 0
+    # False until the stored conversation has been loaded into `memory`.
+    loaded: bool = False
+    # Excludes other turns and loads of this session, from any thread or event loop.
+    turn_lock: threading.Lock = field(default_factory=threading.Lock)
+    # Orders saves of this session; `pending_saves` counts evictions not yet saved.
+    save_lock: threading.Lock = field(default_factory=threading.Lock)
+    pending_saves: int = 0
+    deleted: bool = False
+
+
+_Evicted = List[tuple[str, _Session]]
+
+
+class SessionManager:
+    """Maps session ids to conversation memories that share one agent configuration.
+
+    The template agent's LLM client and `ToolRegistry` are shared by every session. At
+    most `max_sessions` conversations (and, when set, `max_bytes` of message content)
+    stay resident; the least recently used idle sessions are saved to `store` and
+    rehydrated on their next message. Store reads and writes happen outside the
+    manager's lock, and `run_async` runs them in a worker thread.
+    """
+
+    def __init__(
+        self,
+        agent: Agent,
+        store: SessionStore | None = None,
+        memory_factory: Callable[[], Memory] = InMemoryMemory,
+        initial_messages: Sequence[Message] = (),
+        max_sessions: int = 128,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be a positive integer.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer or None.")
+        self.agent = agent
+        self.store = store if store is not None else InMemorySessionStore()
+        self._memory_factory = memory_factory
+        self._initial_messages = tuple(initial_messages)
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        # Evicted sessions whose save may still be running; reused if they come back.
+        self._evicting: Dict[str, _Session] = {}
+        self._lock = threading.RLock()
+        self.evictions = 0
+        self.rehydrations = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    @property
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(session.size_bytes for session in self._sessions.values())
+
+    def memory(self, session_id: str) -> Memory:
+        """Return the resident memory for a session, loading or creating it.
+
+        The budget is not enforced here, so the session stays resident at least until the
+        next turn of any session finishes.
+        """
+        with self._lock:
+            session = self._acquire(session_id)
+        try:
+            if not session.loaded:
+                with session.turn_lock:
+                    self._ensure_loaded(session_id, session)
+        finally:
+            with self._lock:
+                session.in_use -= 1
+        return session.memory
+
+    def run(self, session_id: str, user_input: str, **run_kwargs: Any) -> AgentResponse:
+        with self._lock:
+            session = self._acquire(session_id)
+        try:
+            # Excludes other turns of the same session, sync or async.
+            with session.turn_lock:
+                self._ensure_loaded(session_id, session)
+                try:
+                    return self.agent.with_memory(session.memory).run(user_input, **run_kwargs)
+                finally:
+                    self._measure(session)
+        finally:
+            self._save(self._release(session))
+
+    async def run_async(
+        self, session_id: str, user_input: str, **run_kwargs: Any
+    ) -> AgentResponse:
+        with self._lock:
+            session = self._acquire(session_id)
+        try:
+            # Turns of one session are serialized; different sessions run concurrently.
+            await _acquire_thread_lock(session.turn_lock)
+            try:
+                if not session.loaded:
+                    await asyncio.to_thread(self._ensure_loaded, session_id, session)
+                agent = self.agent.with_memory(session.memory)
+                try:
+                    return await agent.run_async(user_input, **run_kwargs)
+                finally:
+                    # The session may be saved and evicted as soon as it is released.
+                    await agent.wait_for_compaction()
+                    if _as_async_memory(session.memory) is None:
+                        self._measure(session)
+                    else:
+                        # Memories with async methods do I/O; keep it off the loop.
+                        await asyncio.to_thread(self._measure, session)
+            finally:
+                session.turn_lock.release()
+        finally:
+            evicted = self._release(session)
+            if evicted:
+                await asyncio.to_thread(self._save, evicted)
+
+    def evict(self, session_id: str) -> bool:
+        """Save an idle resident session to the store and drop it from memory."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.in_use:
+                return False
+            evicted = self._evict(session_id, session)
+        self._save(evicted)
+        return True
+
+    def flush(self) -> None:
+        """Save every idle resident session to the store (they stay resident)."""
+        with self._lock:
+            idle = [
+                (session_id, session)
+                for session_id, session in self._sessions.items()
+                if session.loaded and not session.in_use
+            ]
+        for session_id, session in idle:
+            with session.save_lock:
+                self.store.save(session_id, session.memory.snapshot())
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                session = self._evicting.pop(session_id, None)
+            if session is not None:
+                session.deleted = True
+        if session is None:
+            self.store.delete(session_id)
+            return
+        # Waits for a save already in progress, so it cannot restore the session.
+        with session.save_lock:
+            self.store.delete(session_id)
+
+    def _acquire(self, session_id: str) -> _Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            # A session evicted moments ago is reused, even if its save is still running.
+            session = self._evicting.pop(session_id, None)
+            if session is None:
+                session = _Session(memory=self._memory_factory())
+            self._sessions[session_id] = session
+        else:
+            self._sessions.move_to_end(session_id)
+        session.in_use += 1
+        return session
+
+    def _release(self, session: _Session) -> _Evicted:
+        """End a turn and return the sessions evicted to stay within budget."""
+        with self._lock:
+            session.in_use -= 1
+            return self._enforce_budget()
+
+    def _measure(self, session: _Session) -> None:
+        """Update the session's size after a turn; runs while the turn lock is held."""
+        if not session.loaded:
+            return
+        memory = session.memory
+        version, count = memory.version, len(memory)
+        added = version - session.size_version
+        if count == session.size_count + added:
+            size_bytes = session.size_bytes + _estimate_bytes(
+                memory.messages_since(session.size_version)
+            )
+        else:
+            # Messages were evicted or rewritten; measure what is retained now.
+            size_bytes = _estimate_bytes(memory.snapshot())
+        with self._lock:
+            session.size_bytes = size_bytes
+            session.size_version, session.size_count = version, count
+
+    def _ensure_loaded(self, session_id: str, session: _Session) -> None:
+        """Load the stored conversation once; the caller holds the session's turn lock."""
+        if session.loaded:
+            return
+        memory = session.memory
+        stored = self.store.load(session_id)
+        messages: Sequence[Message] = self._initial_messages if stored is None else stored
+        # A factory may start memories with a prefix, e.g. a `SharedPrefix` system
+        # prompt; it is not added a second time.
+        preset = memory.snapshot()
+        if preset and list(messages[: len(preset)]) == list(preset):
+            messages = messages[len(preset) :]
+        for message in messages:
+            memory.add(message)
+        size_bytes = _estimate_bytes(memory.snapshot())
+        with self._lock:
+            session.size_bytes = size_bytes
+            session.size_version, session.size_count = memory.version, len(memory)
+            session.loaded = True
+            if stored is not None:
+                self.rehydrations += 1
+
+    def _enforce_budget(self) -> _Evicted:
+        evicted: _Evicted = []
+        for session_id in list(self._sessions):
+            if not self._over_budget():
+                break
+            session = self._sessions[session_id]
+            if not session.in_use:
+                evicted.extend(self._evict(session_id, session))
+        return evicted
+
+    def _over_budget(self) -> bool:
+        if len(self._sessions) > self.max_sessions:
+            return True
+        if self.max_bytes is None:
+            return False
+        return sum(session.size_bytes for session in self._sessions.values()) > self.max_bytes
+
+    def _evict(self, session_id: str, session: _Session) -> _Evicted:
+        """Drop a session under the lock; the caller saves it with `_save` afterwards."""
+        del self._sessions[session_id]
+        self.evictions += 1
+        if not session.loaded:
+            # Its stored conversation was never loaded, so there is nothing new to save.
+            return []
+        session.pending_saves += 1
+        self._evicting[session_id] = session
+        return [(session_id, session)]
+
+    def _save(self, evicted: _Evicted) -> None:
+        for session_id, session in evicted:
+            saved = False
+            try:
+                with session.save_lock:
+                    if not session.deleted:
+                        self.store.save(session_id, session.memory.snapshot())
+                saved = True
+            finally:
+                with self._lock:
+                    session.pending_saves -= 1
+                    # After a failed save the session stays recoverable from `_evicting`.
+                    if (
+                        saved
+                        and not session.pending_saves
+                        and self._evicting.get(session_id) is session
+                    ):
+                        del self._evicting[session_id]
+
+
+async def _acquire_thread_lock(lock: threading.Lock) -> None:
+    if lock.acquire(blocking=False):
+        return
+    # Held by another turn on any thread or loop; wait for it without blocking the loop.
+    acquiring = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        acquiring.add_done_callback(lambda _: lock.release())
+        raise
+
+
+def _estimate_bytes(messages: Sequence[Message]) -> int:
+    return sum(
+        len(message.content) + len(message.role) + len(message.name or "")
+        for message in messages
+    )
+
+
+def _encode_messages(messages: Sequence[Message]) -> bytes:
+    payload = [message.model_dump(exclude_none=True) for message in messages]
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_messages(payload: bytes) -> List[Message]:
+    return [Message.model_validate(item) for item in json.loads(payload)]
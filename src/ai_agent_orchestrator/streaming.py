@@ -1,12 +1,148 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Literal
+
+StreamMode = Literal["buffered", "incremental"]
+# "buffered" parses the full model response before emitting chunks; "incremental"
+# forwards final-answer content while the provider is still generating.
+
+_FINAL_PREFIX_TOKENS = ("{", '"type"', ":", '"final"', ",", '"content"', ":", '"')
+_JSON_WHITESPACE = " \t\r\n"
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
 
 
 @dataclass(frozen=True)
 class StreamChunk:
-    """A streaming chunk emitted by the agent."""
+    """A streaming chunk emitted by the agent.
+
+    `reset` marks a correction: text already received for this step did not survive
+    parsing, so discard it and continue with this chunk's `text`.
+    """
 
     text: str
     step: int
     is_final: bool = False
+    reset: bool = False
+
+
+class FinalContentDecoder:
+    """Incrementally decode the `content` of a `{"type":"final","content":"..."}` reply.
+
+    Feed raw provider text as it arrives; `feed` returns the newly decoded content
+    characters. Decoding only starts once the prefix has matched (whitespace between
+    JSON tokens is allowed), so tool calls and non-JSON replies never produce output.
+    """
+
+    def __init__(self) -> None:
+        self._token_index = 0
+        self._token_offset = 0
+        self._escape = ""
+        self._high_surrogate: str | None = None
+        self.matched = False
+        self.failed = False
+        self.done = False
+
+    @property
+    def active(self) -> bool:
+        """Whether more input can still produce decoded content."""
+        return not (self.failed or self.done)
+
+    def feed(self, text: str) -> str:
+        if not self.active:
+            return ""
+        decoded: list[str] = []
+        index = 0
+        length = len(text)
+        while index < length and self.active:
+            if not self.matched:
+                self._match_prefix(text[index])
+                index += 1
+                continue
+            if not self._escape and self._high_surrogate is None:
+                # Fast path: copy the run of plain characters up to the next quote/escape.
+                end = index
+                while end < length and text[end] not in '"\\':
+                    end += 1
+                if end > index:
+                    decoded.append(text[index:end])
+                    index = end
+                    continue
+            self._decode_char(text[index], decoded)
+            index += 1
+        return "".join(decoded)
+
+    def _match_prefix(self, char: str) -> None:
+        token = _FINAL_PREFIX_TOKENS[self._token_index]
+        if self._token_offset == 0 and char in _JSON_WHITESPACE:
+            return
+        if char != token[self._token_offset]:
+            self.failed = True
+            return
+        self._token_offset += 1
+        if self._token_offset == len(token):
+            self._token_index += 1
+            self._token_offset = 0
+            if self._token_index == len(_FINAL_PREFIX_TOKENS):
+                self.matched = True
+
+    def _decode_char(self, char: str, decoded: list[str]) -> None:
+        if self._escape:
+            self._escape += char
+            if self._escape[1] == "u":
+                if len(self._escape) < 6:
+                    return
+                try:
+                    code_point = int(self._escape[2:], 16)
+                except ValueError:
+                    self.failed = True
+                    return
+                self._escape = ""
+                self._emit_code_point(code_point, decoded)
+                return
+            replacement = _SIMPLE_ESCAPES.get(char)
+            self._escape = ""
+            if replacement is None:
+                self.failed = True
+                return
+            self._emit_text(replacement, decoded)
+            return
+        if char == "\\":
+            self._escape = char
+            return
+        if char == '"':
+            self._flush_surrogate(decoded)
+            self.done = True
+            return
+        self._emit_text(char, decoded)
+
+    def _emit_code_point(self, code_point: int, decoded: list[str]) -> None:
+        if 0xD800 <= code_point <= 0xDBFF:
+            self._flush_surrogate(decoded)
+            self._high_surrogate = chr(code_point)
+            return
+        if 0xDC00 <= code_point <= 0xDFFF and self._high_surrogate is not None:
+            high = ord(self._high_surrogate) - 0xD800
+            low = code_point - 0xDC00
+            self._high_surrogate = None
+            decoded.append(chr(0x10000 + (high << 10) + low))
+            return
+        self._emit_text(chr(code_point), decoded)
+
+    def _emit_text(self, text: str, decoded: list[str]) -> None:
+        self._flush_surrogate(decoded)
+        decoded.append(text)
+
+    def _flush_surrogate(self, decoded: list[str]) -> None:
+        if self._high_surrogate is not None:
+            decoded.append(self._high_surrogate)
+            self._high_surrogate = None
@@ -1,4 +1,25 @@
-from ai_agent_orchestrator.tools.base import Tool, ToolInput
-from ai_agent_orchestrator.tools.registry import ToolRegistry
+from ai_agent_orchestrator.tools.base import AsyncTool, Tool, ToolInput
+from ai_agent_orchestrator.tools.blobs import BlobRef, BlobStore
+from ai_agent_orchestrator.tools.cache import CacheStats, ToolResultCache
+from ai_agent_orchestrator.tools.process_pool import ToolProcessPool
+from ai_agent_orchestrator.tools.registry import (
+    FrozenToolRegistry,
+    ToolExecution,
+    ToolRegistry,
+    ToolSpec,
+)
 
-__all__ = ["Tool", "ToolInput", "ToolRegistry"]
+__all__ = [
+    "AsyncTool",
+    "BlobRef",
+    "BlobStore",
+    "CacheStats",
+    "FrozenToolRegistry",
+    "Tool",
+    "ToolExecution",
+    "ToolInput",
+    "ToolProcessPool",
+    "ToolRegistry",
+    "ToolResultCache",
+    "ToolSpec",
+]
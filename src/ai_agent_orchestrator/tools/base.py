@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Iterable, TypeVar
 
 from pydantic import BaseModel
 
@@ -14,11 +16,27 @@ TToolInput = TypeVar("TToolInput", bound=ToolInput)
 
 
 class Tool(ABC, Generic[TToolInput]):
-    """Abstract tool interface."""
+    """Abstract tool interface.
+
+    Tools may also define `async def arun(self, validated_input) -> str`; the async agent
+    paths await it on the event loop instead of running `run` in a worker thread.
+    """
 
     name: str
     description: str
     input_model: type[TToolInput]
+    # Results may be served from the registry's ToolResultCache.
+    cacheable: bool = False
+    # Enforced by the async agent paths; the registry may override it.
+    timeout_s: float | None = None
+    # Concurrent async calls per event loop; None is unlimited.
+    max_concurrency: int | None = None
+    # Run in the registry's ToolProcessPool; the tool and its input must pickle.
+    run_in_process: bool = False
+    # Store large results in the registry's BlobStore and return a handle.
+    offload_output: bool = True
+    # Cut the middle out of longer results; None keeps them whole.
+    output_char_budget: int | None = None
 
     @abstractmethod
     def run(self, validated_input: TToolInput) -> str:
@@ -26,3 +44,27 @@ class Tool(ABC, Generic[TToolInput]):
 
     def validate(self, args: dict[str, Any]) -> TToolInput:
         return self.input_model.model_validate(args)
+
+    def cache_tags(self, validated_input: TToolInput) -> Iterable[str]:
+        """Tags attached to a cached result (e.g. the path it was read from)."""
+        return ()
+
+    def invalidates(self, validated_input: TToolInput) -> Iterable[str]:
+        """Cache tags made stale by a successful run (e.g. the path it wrote)."""
+        return ()
+
+
+class AsyncTool(Tool[TToolInput]):
+    """Tool implemented as a coroutine; sync callers run it on a private event loop."""
+
+    @abstractmethod
+    async def arun(self, validated_input: TToolInput) -> str:
+        raise NotImplementedError
+
+    def run(self, validated_input: TToolInput) -> str:
+        return asyncio.run(self.arun(validated_input))
+
+
+def is_async_tool(tool: Tool[Any]) -> bool:
+    """True when `tool` defines a coroutine `arun`."""
+    return inspect.iscoroutinefunction(getattr(tool, "arun", None))
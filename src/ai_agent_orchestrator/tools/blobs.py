@@ -0,0 +1,114 @@
+"""Content-addressed storage for large tool results, referenced by handle in memory."""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+BLOB_READ_TOOL = "blob.read"
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    blob_id: str
+    # Length of the stored text in characters.
+    size: int
+
+
+class BlobStore:
+    """Thread-safe store for tool results too large to keep in the conversation.
+
+    Results longer than `threshold_chars` are stored under a hash of their text and the
+    conversation gets a handle instead: the blob id, its size and the first
+    `preview_chars` characters. The model pages through the rest with the `blob.read`
+    tool. Blobs are kept as files in the `path` directory when given. Otherwise they are
+    kept in memory, up to `max_memory_chars` in total; beyond that the least recently used
+    blobs are dropped and reading them fails like an unknown id.
+    """
+
+    def __init__(
+        self,
+        threshold_chars: int = 8000,
+        preview_chars: int = 500,
+        path: Path | str | None = None,
+        max_memory_chars: int = 64_000_000,
+    ) -> None:
+        if threshold_chars < 1:
+            raise ValueError("threshold_chars must be a positive integer.")
+        if not 0 <= preview_chars <= threshold_chars:
+            raise ValueError("preview_chars must be between 0 and threshold_chars.")
+        if max_memory_chars < 1:
+            raise ValueError("max_memory_chars must be a positive integer.")
+        self.threshold_chars = threshold_chars
+        self.preview_chars = preview_chars
+        self.max_memory_chars = max_memory_chars
+        self._blobs: OrderedDict[str, str] = OrderedDict()
+        self._memory_chars = 0
+        self._lock = threading.Lock()
+        self._dir: Path | None = None
+        if path is not None:
+            self._dir = Path(path)
+            self._dir.mkdir(parents=True, exist_ok=True)
+
+    def put(self, text: str) -> BlobRef:
+        digest = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+        ref = BlobRef(blob_id=f"blob-{digest[:24]}", size=len(text))
+        file = self._file(ref.blob_id)
+        if file is None:
+            self._remember(ref.blob_id, text)
+        elif not file.is_file():
+            # Write-then-rename so concurrent readers never see a partial blob.
+            partial = file.with_name(f"{file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            partial.write_text(text, encoding="utf-8", errors="surrogatepass")
+            os.replace(partial, file)
+        return ref
+
+    def get(self, blob_id: str) -> str:
+        """Full text of a blob; raises KeyError for unknown ids."""
+        file = self._file(blob_id)
+        if file is None:
+            with self._lock:
+                text = self._blobs[blob_id]
+                self._blobs.move_to_end(blob_id)
+                return text
+        try:
+            return file.read_text(encoding="utf-8", errors="surrogatepass")
+        except FileNotFoundError:
+            raise KeyError(blob_id) from None
+
+    def offload(self, text: str) -> tuple[str, BlobRef | None]:
+        """Store `text` when it exceeds the threshold and return the handle to keep inline."""
+        if len(text) <= self.threshold_chars:
+            return text, None
+        ref = self.put(text)
+        return self.handle(ref, text[: self.preview_chars]), ref
+
+    def handle(self, ref: BlobRef, preview: str) -> str:
+        return (
+            f"[{ref.blob_id}: {ref.size} chars stored out of band, first {len(preview)} shown."
+            f' Call {BLOB_READ_TOOL} with {{"blob_id": "{ref.blob_id}",'
+            f' "offset": {len(preview)}}} to read more.]\n{preview}'
+        )
+
+    def _remember(self, blob_id: str, text: str) -> None:
+        with self._lock:
+            previous = self._blobs.pop(blob_id, None)
+            if previous is not None:
+                self._memory_chars -= len(previous)
+            self._blobs[blob_id] = text
+            self._memory_chars += len(text)
+            # The newest blob is kept even if it alone exceeds the cap.
+            while self._memory_chars > self.max_memory_chars and len(self._blobs) > 1:
+                _, dropped = self._blobs.popitem(last=False)
+                self._memory_chars -= len(dropped)
+
+    def _file(self, blob_id: str) -> Path | None:
+        if self._dir is None:
+            return None
+        if not blob_id.startswith("blob-") or not blob_id[5:].isalnum():
+            # Ids become file names; reject anything that could escape the directory.
+            raise KeyError(blob_id)
+        return self._dir / f"{blob_id}.txt"
@@ -1,4 +1,5 @@
+from ai_agent_orchestrator.tools.builtin.blob_tool import BlobReadTool
 from ai_agent_orchestrator.tools.builtin.echo_tool import EchoTool
 from ai_agent_orchestrator.tools.builtin.math_tool import MathAddTool
 
-__all__ = ["EchoTool", "MathAddTool"]
+__all__ = ["BlobReadTool", "EchoTool", "MathAddTool"]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.blobs import BLOB_READ_TOOL, BlobStore
+
+
+class BlobReadInput(ToolInput):
+    blob_id: str
+    offset: int = Field(default=0, ge=0)
+    limit: int = Field(default=4000, ge=1)
+
+
+class BlobReadTool(Tool[BlobReadInput]):
+    name = BLOB_READ_TOOL
+    description = "Read a character range of a large tool result stored out of band."
+    input_model = BlobReadInput
+    offload_output = False
+
+    def __init__(self, store: BlobStore) -> None:
+        self._store = store
+
+    def run(self, validated_input: BlobReadInput) -> str:
+        # Pages never exceed the offload threshold, so they can stay inline.
+        limit = min(validated_input.limit, self._store.threshold_chars)
+        try:
+            text = self._store.get(validated_input.blob_id)
+        except KeyError:
+            raise ValueError(f"Unknown blob id '{validated_input.blob_id}'") from None
+        end = validated_input.offset + limit
+        page = text[validated_input.offset : end]
+        if end < len(text):
+            page += f"\n[{len(text) - end} more chars; next offset {end}]"
+        return page
@@ -14,3 +14,7 @@ class EchoTool(Tool[EchoInput]):
 
     def run(self, validated_input: EchoInput) -> str:
         return validated_input.message
+
+    async def arun(self, validated_input: EchoInput) -> str:
+        # Trivial CPU work: cheaper inline on the event loop than a thread hop.
+        return self.run(validated_input)
@@ -17,3 +17,6 @@ class MathAddTool(Tool[MathAddInput]):
 
     def run(self, validated_input: MathAddInput) -> str:
         return str(validated_input.a + validated_input.b)
+
+    async def arun(self, validated_input: MathAddInput) -> str:
+        return self.run(validated_input)
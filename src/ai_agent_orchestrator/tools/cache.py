@@ -0,0 +1,173 @@
+"""Registry-level memoization of tool results with TTL and LRU eviction."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+from pydantic import BaseModel
+
+MonotonicClock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _Entry:
+    value: str
+    expires_at: float | None
+    tags: frozenset[str]
+
+
+class ToolResultCache:
+    """Thread-safe LRU cache of tool results keyed by tool name plus canonical args.
+
+    Entries expire after `ttl_s` seconds (never when None) and the least recently
+    used entry is evicted once `max_entries` is exceeded. Every entry is tagged with
+    `tool:<name>` plus the tags the tool declares, so writes can invalidate reads. A
+    result computed while one of its tags was invalidated is not stored: pass the
+    `sequence` read before computing it as `put(..., since=...)`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_s: float | None = 300.0,
+        clock: MonotonicClock = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        # Sequence number of the latest invalidation of each recently invalidated tag.
+        # Tags pruned from it are covered by `_forgotten`, so checks err on not storing.
+        self._sequence = 0
+        self._invalidated: OrderedDict[str, int] = OrderedDict()
+        self._forgotten = 0
+
+    @property
+    def sequence(self) -> int:
+        """Number of invalidations so far; see `put`."""
+        return self._sequence
+
+    @staticmethod
+    def make_key(tool_name: str, validated_input: BaseModel) -> str:
+        args = validated_input.model_dump(mode="json")
+        canonical = json.dumps(args, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return f"{tool_name}\x00{canonical}"
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: str,
+        value: str,
+        tool_name: str,
+        tags: Iterable[str] = (),
+        since: int | None = None,
+    ) -> None:
+        """Store `value`, unless one of its tags was invalidated after sequence `since`."""
+        expires_at = None if self.ttl_s is None else self._clock() + self.ttl_s
+        entry = _Entry(
+            value=value,
+            expires_at=expires_at,
+            tags=frozenset((_tool_tag(tool_name), *tags)),
+        )
+        with self._lock:
+            if since is not None and self._stale_since(entry.tags, since):
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(
+        self, tool_name: str | None = None, tags: Iterable[str] = ()
+    ) -> int:
+        """Drop entries of `tool_name` and entries carrying any of `tags`."""
+        targets = set(tags)
+        if tool_name is not None:
+            targets.add(_tool_tag(tool_name))
+        if not targets:
+            return 0
+        with self._lock:
+            self._sequence += 1
+            for tag in targets:
+                self._invalidated[tag] = self._sequence
+                self._invalidated.move_to_end(tag)
+            while len(self._invalidated) > self.max_entries:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+            stale = [key for key, entry in self._entries.items() if entry.tags & targets]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._sequence += 1
+            self._invalidated.clear()
+            self._forgotten = self._sequence
+
+    def _stale_since(self, tags: frozenset[str], since: int) -> bool:
+        if since < self._forgotten:
+            return True
+        return any(self._invalidated.get(tag, 0) > since for tag in tags)
+
+
+def path_tag(path: Path | str) -> str:
+    """Cache tag for a filesystem path, shared by readers and writers of that path."""
+    return f"path:{path}"
+
+
+def _tool_tag(tool_name: str) -> str:
+    return f"tool:{tool_name}"
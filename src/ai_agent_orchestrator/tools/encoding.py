@@ -0,0 +1,92 @@
+"""Compact renderings of tool results, so fewer characters are resent on every step."""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, Mapping, Sequence
+
+
+class EncodedOutput(str):
+    """Tool result text that remembers the size of its plain JSON rendering.
+
+    The registry reports `raw_chars` next to the encoded size on `agent.tool.finished`,
+    which shows how much each tool's encoding saves. Pass the `raw_indent` a tool used
+    before adopting an encoding so the comparison is against what it actually sent.
+    """
+
+    raw_chars: int
+
+    def __new__(cls, text: str, raw_chars: int) -> EncodedOutput:
+        encoded = super().__new__(cls, text)
+        encoded.raw_chars = raw_chars
+        return encoded
+
+    def __reduce__(self) -> tuple[type[EncodedOutput], tuple[str, int]]:
+        # Keeps `raw_chars` when results cross a process boundary.
+        return EncodedOutput, (str(self), self.raw_chars)
+
+
+def compact_json(value: Any, raw_indent: int | None = None) -> EncodedOutput:
+    """JSON without insignificant whitespace or ASCII escaping."""
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return EncodedOutput(text, raw_chars=_plain_json_chars(value, raw_indent))
+
+
+def records_table(
+    records: Sequence[Mapping[str, Any]],
+    columns: Sequence[str] | None = None,
+    raw_indent: int | None = None,
+) -> EncodedOutput:
+    """Render records as CSV: one header row, then one row per record.
+
+    Columns default to every key in first-seen order. Missing and None values are empty
+    and nested values are compact JSON. No records render as an empty string.
+    """
+    if not records:
+        return EncodedOutput("", raw_chars=_plain_json_chars(records, raw_indent))
+    if columns is None:
+        columns = list(dict.fromkeys(key for record in records for key in record))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows([_cell(record.get(column)) for column in columns] for record in records)
+    raw_chars = _plain_json_chars(records, raw_indent)
+    return EncodedOutput(buffer.getvalue().rstrip("\n"), raw_chars=raw_chars)
+
+
+def truncate(text: str, budget: int) -> str:
+    """Cut the middle out of `text` so the result, marker included, fits `budget` chars.
+
+    The head and tail are kept, since headers and totals tend to live there.
+    """
+    if budget < 0:
+        raise ValueError("budget must be non-negative.")
+    if len(text) <= budget:
+        return text
+    # Size the marker for the largest possible count so the result never overshoots.
+    marker_chars = len(_marker(len(text)))
+    keep = budget - marker_chars
+    if keep <= 0:
+        return text[:budget]
+    tail = keep // 2
+    head = keep - tail
+    return text[:head] + _marker(len(text) - keep) + (text[-tail:] if tail else "")
+
+
+def _marker(omitted: int) -> str:
+    return f"\n[... {omitted} chars omitted ...]\n"
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bool, int, float)):
+        return json.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _plain_json_chars(value: Any, indent: int | None) -> int:
+    return len(json.dumps(value, ensure_ascii=False, indent=indent))
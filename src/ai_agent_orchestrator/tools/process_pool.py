@@ -0,0 +1,342 @@
+"""Warm worker processes for CPU-bound tools, with recycling and hard kill on timeout."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Sequence
+
+from ai_agent_orchestrator.tools.base import Tool
+from ai_agent_orchestrator.utils.errors import ToolTimeoutError
+
+
+@dataclass
+class _Worker:
+    process: Any
+    conn: Connection
+    calls: int = 0
+
+
+class ToolProcessPool:
+    """Runs `Tool.run` in long-lived worker processes, one call per worker at a time.
+
+    The tool instance and its validated input are pickled for every call, so both must
+    be picklable (tool classes must be importable by the workers). A worker is retired
+    after `max_calls_per_worker` calls. A worker whose call overruns its timeout, or whose
+    caller is cancelled, is killed. Retired and killed workers are replaced right away so
+    the pool stays warm. Workers import the `preload` modules (typically those defining
+    the tools) before they accept calls, so imports never count against a tool timeout.
+    `run_async` waits for the worker's reply with an event-loop reader, so no thread is
+    held per call; only waiting for a free worker or spawning one uses the pool's own
+    `max_workers` threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_calls_per_worker: int | None = 100,
+        start_method: str = "spawn",
+        poll_interval_s: float = 0.05,
+        preload: Sequence[str] = (),
+    ) -> None:
+        workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        if max_calls_per_worker is not None and max_calls_per_worker < 1:
+            raise ValueError("max_calls_per_worker must be a positive integer or None.")
+        self.max_workers = workers
+        self.max_calls_per_worker = max_calls_per_worker
+        self._context: Any = multiprocessing.get_context(start_method)
+        self._poll_interval_s = poll_interval_s
+        self._preload = tuple(preload)
+        self._idle: list[_Worker] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # Runs blocking checkouts for `run_async`, never the default executor.
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="tool-process-pool")
+        self.recycled = 0
+        self.killed = 0
+
+    def __enter__(self) -> ToolProcessPool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Spawn every worker up front instead of on first use."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.max_workers:
+                    return
+                self._size += 1
+            self._add_idle(self._spawn())
+
+    def close(self) -> None:
+        """Stop idle workers now; busy workers stop when their call returns."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            _stop(worker)
+        self._executor.shutdown(wait=False)
+
+    def run(
+        self,
+        tool: Tool[Any],
+        validated_input: Any,
+        timeout_s: float | None = None,
+        cancelled: threading.Event | None = None,
+    ) -> str:
+        payload = _payload(tool, validated_input)
+        worker = self._checkout(cancelled)
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        healthy = False
+        try:
+            worker.conn.send_bytes(payload)
+            while not worker.conn.poll(self._poll_interval_s):
+                if cancelled is not None and cancelled.is_set():
+                    raise RuntimeError(f"Tool '{tool.name}' call was cancelled")
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ToolTimeoutError(f"Tool '{tool.name}' timed out after {timeout_s}s")
+            status, result = _receive(worker)
+            healthy = True
+        finally:
+            self._checkin(worker, healthy)
+        return _unwrap(status, result)
+
+    async def run_async(
+        self, tool: Tool[Any], validated_input: Any, timeout_s: float | None = None
+    ) -> str:
+        """Await a worker without blocking the loop; cancellation kills the worker."""
+        payload = _payload(tool, validated_input)
+        worker = await self._checkout_async()
+        healthy = False
+        try:
+            worker.conn.send_bytes(payload)
+            try:
+                await asyncio.wait_for(self._readable(worker.conn), timeout_s)
+            except asyncio.TimeoutError:
+                raise ToolTimeoutError(
+                    f"Tool '{tool.name}' timed out after {timeout_s}s"
+                ) from None
+            status, result = _receive(worker)
+            healthy = True
+        finally:
+            self._checkin(worker, healthy)
+        return _unwrap(status, result)
+
+    async def _checkout_async(self) -> _Worker:
+        with self._cond:
+            if self._idle and not self._closed:
+                worker = self._idle.pop()
+                worker.calls += 1
+                return worker
+        # Waiting for a busy worker or spawning one blocks, so it runs on our executor.
+        cancelled = threading.Event()
+        checkout = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._checkout, cancelled
+        )
+        try:
+            return await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            cancelled.set()
+            checkout.add_done_callback(self._return_unused)
+            raise
+
+    async def _readable(self, conn: Connection) -> None:
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future[None] = loop.create_future()
+
+        def _on_readable() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        try:
+            loop.add_reader(conn.fileno(), _on_readable)
+        except NotImplementedError:
+            # Loops without reader support (e.g. Windows' proactor) wait on our executor;
+            # killing the worker on timeout or cancellation ends the wait.
+            await loop.run_in_executor(self._executor, conn.poll, None)
+            return
+        try:
+            await ready
+        finally:
+            loop.remove_reader(conn.fileno())
+
+    def _return_unused(self, checkout: asyncio.Future[_Worker]) -> None:
+        if not checkout.cancelled() and checkout.exception() is None:
+            worker = checkout.result()
+            worker.calls -= 1
+            self._checkin(worker, healthy=True)
+
+    def _checkout(self, cancelled: threading.Event | None) -> _Worker:
+        worker: _Worker | None = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("ToolProcessPool is closed")
+                if cancelled is not None and cancelled.is_set():
+                    raise RuntimeError("Tool call was cancelled while waiting for a worker")
+                if self._idle:
+                    worker = self._idle.pop()
+                    break
+                if self._size < self.max_workers:
+                    self._size += 1
+                    break
+                self._cond.wait(self._poll_interval_s)
+        if worker is None:
+            try:
+                worker = self._spawn()
+            except BaseException:
+                self._retire_slot()
+                raise
+        worker.calls += 1
+        return worker
+
+    def _checkin(self, worker: _Worker, healthy: bool) -> None:
+        if not healthy:
+            with self._cond:
+                self.killed += 1
+        elif (
+            self.max_calls_per_worker is not None
+            and worker.calls >= self.max_calls_per_worker
+        ):
+            with self._cond:
+                self.recycled += 1
+        else:
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(worker)
+                    self._cond.notify()
+                    return
+            _stop(worker)
+            self._retire_slot()
+            return
+        # The retired worker is stopped and its slot reused by a replacement, both off
+        # the caller's thread so the finished call returns immediately.
+        threading.Thread(target=self._replace, args=(worker, healthy), daemon=True).start()
+
+    def _replace(self, retired: _Worker, healthy: bool) -> None:
+        if healthy:
+            _stop(retired)
+        else:
+            _kill(retired)
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                self._cond.notify()
+                return
+        try:
+            replacement = self._spawn()
+        except Exception:  # noqa: BLE001 - free the slot; the next checkout retries
+            self._retire_slot()
+            return
+        self._add_idle(replacement)
+
+    def _add_idle(self, worker: _Worker) -> None:
+        with self._cond:
+            if not self._closed:
+                self._idle.append(worker)
+                self._cond.notify()
+                return
+        _stop(worker)
+        self._retire_slot()
+
+    def _retire_slot(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn, self._preload), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process=process, conn=parent_conn)
+        try:
+            # Block until the worker has finished importing and is ready for calls.
+            parent_conn.recv_bytes()
+        except EOFError as exc:
+            _kill(worker)
+            raise RuntimeError(
+                f"Worker process exited during startup with code {process.exitcode}"
+            ) from exc
+        return worker
+
+
+def _payload(tool: Tool[Any], validated_input: Any) -> bytes:
+    try:
+        return pickle.dumps((tool, validated_input))
+    except Exception as exc:  # noqa: BLE001 - any pickling failure
+        raise TypeError(
+            f"Tool '{tool.name}' and its input must be picklable to run in a process"
+        ) from exc
+
+
+def _receive(worker: _Worker) -> tuple[str, Any]:
+    try:
+        status, result = pickle.loads(worker.conn.recv_bytes())
+    except EOFError as exc:
+        raise RuntimeError(f"Worker process exited with code {worker.process.exitcode}") from exc
+    return status, result
+
+
+def _unwrap(status: str, result: Any) -> str:
+    if status == "error":
+        raise result
+    return result if isinstance(result, str) else str(result)
+
+
+def _worker_main(conn: Connection, preload: Sequence[str]) -> None:
+    for module in preload:
+        importlib.import_module(module)
+    conn.send_bytes(b"ready")
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except EOFError:
+            return
+        if not message:
+            return
+        try:
+            tool, validated_input = pickle.loads(message)
+            reply: tuple[str, Any] = ("ok", tool.run(validated_input))
+        except Exception as exc:  # noqa: BLE001 - errors are returned to the caller
+            reply = ("error", exc)
+        try:
+            encoded = pickle.dumps(reply)
+        except Exception:  # noqa: BLE001 - unpicklable exception or result
+            encoded = pickle.dumps(("error", RuntimeError(repr(reply[1]))))
+        conn.send_bytes(encoded)
+
+
+def _stop(worker: _Worker) -> None:
+    try:
+        worker.conn.send_bytes(b"")
+    except OSError:
+        pass
+    worker.process.join(timeout=1.0)
+    if worker.process.is_alive():
+        _kill(worker)
+        return
+    worker.conn.close()
+
+
+def _kill(worker: _Worker) -> None:
+    worker.process.kill()
+    worker.process.join()
+    worker.conn.close()
@@ -1,33 +1,356 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, Mapping
 
-from ai_agent_orchestrator.tools.base import Tool
-from ai_agent_orchestrator.utils.errors import ToolExecutionError, ToolNotFoundError
+from ai_agent_orchestrator.executors import ConcurrencyLimit, ExecutorLane, QueueStats
+from ai_agent_orchestrator.tools.base import Tool, is_async_tool
+from ai_agent_orchestrator.tools.blobs import BlobStore
+from ai_agent_orchestrator.tools.cache import ToolResultCache
+from ai_agent_orchestrator.tools.encoding import EncodedOutput, truncate
+from ai_agent_orchestrator.tools.process_pool import ToolProcessPool
+from ai_agent_orchestrator.utils.errors import (
+    ToolExecutionError,
+    ToolNotFoundError,
+    ToolTimeoutError,
+)
+
+# Cache key of a missed lookup and the cache's invalidation sequence at that moment.
+_PendingPut = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class ToolExecution:
+    """Result of a registry dispatch plus how it was served."""
+
+    content: str
+    cached: bool = False
+    # Set when the call waited on a dedicated executor or a concurrency limit.
+    queued: QueueStats | None = None
+    # Set when the result went to the BlobStore and `content` is its handle.
+    blob_id: str | None = None
+    # Size of the tool's result before encoding, truncation and offloading.
+    raw_chars: int | None = None
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Catalog entry of a frozen registry: a tool's schema and capabilities."""
+
+    name: str
+    description: str
+    input_schema: Mapping[str, Any]
+    aliases: tuple[str, ...] = ()
+    is_async: bool = False
+    cacheable: bool = False
+    run_in_process: bool = False
+    timeout_s: float | None = None
+    max_concurrency: int | None = None
 
 
 class ToolRegistry:
     """Registry for tools available to agents."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: ToolResultCache | None = None,
+        executor: Executor | None = None,
+        process_pool: ToolProcessPool | None = None,
+        blob_store: BlobStore | None = None,
+    ) -> None:
         self._tools: Dict[str, Tool[Any]] = {}
+        self._timeouts: Dict[str, float] = {}
+        self._limits: Dict[str, ConcurrencyLimit] = {}
+        self._validators: Dict[str, Callable[[dict[str, Any]], Any]] = {}
+        self._async: Dict[str, bool] = {}
+        self._aliases: Dict[str, str] = {}
+        self.cache = cache
+        # Sync tools called from async code; None uses the loop's default executor.
+        self.lane = None if executor is None else ExecutorLane(executor)
+        # Runs tools that set `run_in_process`; without a pool they run in-process.
+        self.process_pool = process_pool
+        # Results over its threshold are stored there and replaced by a handle.
+        self.blob_store = blob_store
+
+    def register(
+        self,
+        tool: Tool[Any],
+        timeout_s: float | None = None,
+        max_concurrency: int | None = None,
+        aliases: Iterable[str] = (),
+    ) -> None:
+        """Register a tool; `timeout_s` and `max_concurrency` override the tool's own.
 
-    def register(self, tool: Tool[Any]) -> None:
+        `aliases` are extra names the model may call the tool by. Calls through an alias
+        share the tool's timeout, concurrency limit and cached results.
+        """
+        if timeout_s is not None and timeout_s <= 0:
+            raise ValueError("timeout_s must be positive or None.")
+        aliases = tuple(aliases)
+        if tool.name in self._aliases:
+            owner = self._aliases[tool.name]
+            raise ValueError(f"Tool name '{tool.name}' clashes with an alias of '{owner}'.")
+        for alias in aliases:
+            if alias == tool.name or alias in self._tools:
+                raise ValueError(f"Alias '{alias}' clashes with a registered tool name.")
+            owner = self._aliases.get(alias, tool.name)
+            if owner != tool.name:
+                raise ValueError(f"Alias '{alias}' is already registered for '{owner}'.")
         self._tools[tool.name] = tool
+        self._validators[tool.name] = _validator_for(tool)
+        self._async[tool.name] = is_async_tool(tool)
+        # Registering a tool again replaces its aliases along with its settings.
+        for alias in [alias for alias, owner in self._aliases.items() if owner == tool.name]:
+            del self._aliases[alias]
+        for alias in aliases:
+            self._aliases[alias] = tool.name
+        if timeout_s is None:
+            self._timeouts.pop(tool.name, None)
+        else:
+            self._timeouts[tool.name] = timeout_s
+        limit = max_concurrency if max_concurrency is not None else tool.max_concurrency
+        if limit is None:
+            self._limits.pop(tool.name, None)
+        else:
+            self._limits[tool.name] = ConcurrencyLimit(limit)
+
+    def __len__(self) -> int:
+        return len(self._tools)
 
     def iter_tools(self) -> Iterable[Tool[Any]]:
         """Return registered tools for read-only inspection (e.g., CLI)."""
         return self._tools.values()
 
     def get(self, name: str) -> Tool[Any]:
-        if name not in self._tools:
-            raise ToolNotFoundError(f"Tool '{name}' is not registered")
-        return self._tools[name]
+        tool = self._tools.get(name)
+        if tool is None:
+            tool = self._tools.get(self._aliases.get(name, ""))
+            if tool is None:
+                raise ToolNotFoundError(f"Tool '{name}' is not registered")
+        return tool
+
+    def freeze(self) -> FrozenToolRegistry:
+        """Snapshot the registry into an immutable, precompiled dispatch table."""
+        return FrozenToolRegistry(self)
+
+    def timeout_for(self, name: str) -> float | None:
+        """Effective timeout of a tool in seconds (None: unbounded or unknown tool)."""
+        name = self._aliases.get(name, name)
+        if name in self._timeouts:
+            return self._timeouts[name]
+        tool = self._tools.get(name)
+        return None if tool is None else tool.timeout_s
 
     def run(self, name: str, args: dict[str, Any]) -> str:
+        return self.execute(name, args).content
+
+    def execute(self, name: str, args: dict[str, Any]) -> ToolExecution:
+        tool = self.get(name)
+        return self._finish(tool, self._execute(tool.name, tool, args))
+
+    def _execute(self, name: str, tool: Tool[Any], args: dict[str, Any]) -> ToolExecution:
+        try:
+            validated = self._validators[name](args)
+            pending, cached = self._lookup(name, tool, validated)
+            if cached is not None:
+                return cached
+            if self.process_pool is not None and tool.run_in_process:
+                result = self.process_pool.run(tool, validated, self.timeout_for(name))
+            else:
+                result = tool.run(validated)
+            self._store(name, tool, validated, pending, result)
+            return ToolExecution(content=result)
+        except ToolTimeoutError:
+            raise
+        except Exception as exc:  # noqa: BLE001 - wrap tool errors
+            raise ToolExecutionError(f"Tool '{name}' failed: {exc}") from exc
+
+    async def run_async(self, name: str, args: dict[str, Any]) -> str:
+        return (await self.execute_async(name, args)).content
+
+    async def execute_async(self, name: str, args: dict[str, Any]) -> ToolExecution:
+        """Await async tools on the running loop; run sync tools on the registry's lane.
+
+        Waiting for the tool's concurrency limit or a worker of the registry's executor is
+        reported in `ToolExecution.queued`.
+        """
         tool = self.get(name)
+        name = tool.name
+        limit = self._limits.get(name)
+        if limit is None:
+            return self._finish(tool, await self._dispatch_async(name, tool, args))
+        async with limit.hold() as held:
+            execution = await self._dispatch_async(name, tool, args)
+        queued = held if execution.queued is None else held + execution.queued
+        return self._finish(tool, replace(execution, queued=queued))
+
+    async def _dispatch_async(
+        self, name: str, tool: Tool[Any], args: dict[str, Any]
+    ) -> ToolExecution:
+        in_process_pool = self.process_pool is not None and tool.run_in_process
+        if not in_process_pool and not self._async[name]:
+            if self.lane is None:
+                return await asyncio.to_thread(self._execute, name, tool, args)
+            execution, queued = await self.lane.run(self._execute, name, tool, args)
+            return replace(execution, queued=queued)
         try:
-            validated = tool.validate(args)
-            return tool.run(validated)
+            validated = self._validators[name](args)
+            pending, cached = self._lookup(name, tool, validated)
+            if cached is not None:
+                return cached
+            if self.process_pool is not None and in_process_pool:
+                result = await self.process_pool.run_async(
+                    tool, validated, self.timeout_for(name)
+                )
+            else:
+                result = await tool.arun(validated)  # type: ignore[attr-defined]
+            self._store(name, tool, validated, pending, result)
+            return ToolExecution(content=result)
+        except ToolTimeoutError:
+            raise
         except Exception as exc:  # noqa: BLE001 - wrap tool errors
             raise ToolExecutionError(f"Tool '{name}' failed: {exc}") from exc
+
+    def _finish(self, tool: Tool[Any], execution: ToolExecution) -> ToolExecution:
+        # Applies the tool's character budget, then moves what is still large to the
+        # blob store. Cached results are stored before either step.
+        result = execution.content
+        raw_chars = result.raw_chars if isinstance(result, EncodedOutput) else len(result)
+        content = result
+        if tool.output_char_budget is not None:
+            content = truncate(content, tool.output_char_budget)
+        blob_id = None
+        store = self.blob_store
+        if store is not None and tool.offload_output:
+            content, ref = store.offload(content)
+            blob_id = None if ref is None else ref.blob_id
+        return replace(execution, content=content, blob_id=blob_id, raw_chars=raw_chars)
+
+    def _lookup(
+        self, name: str, tool: Tool[Any], validated: Any
+    ) -> tuple[_PendingPut | None, ToolExecution | None]:
+        cache = self.cache
+        if cache is None or not tool.cacheable:
+            return None, None
+        # Taken before the lookup, so an invalidation while the tool runs is not missed.
+        since = cache.sequence
+        cache_key = cache.make_key(name, validated)
+        cached = cache.get(cache_key)
+        if cached is None:
+            return (cache_key, since), None
+        return None, ToolExecution(content=cached, cached=True)
+
+    def _store(
+        self,
+        name: str,
+        tool: Tool[Any],
+        validated: Any,
+        pending: _PendingPut | None,
+        result: str,
+    ) -> None:
+        cache = self.cache
+        if cache is None:
+            return
+        stale_tags = tuple(tool.invalidates(validated))
+        if stale_tags:
+            cache.invalidate(tags=stale_tags)
+        if pending is not None:
+            cache_key, since = pending
+            cache.put(cache_key, result, name, tool.cache_tags(validated), since=since)
+
+    def invalidate_cache(
+        self, tool_name: str | None = None, tags: Iterable[str] = ()
+    ) -> int:
+        """Drop cached results by tool name and/or tag; returns the number dropped."""
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(tool_name=tool_name, tags=tags)
+
+
+class FrozenToolRegistry(ToolRegistry):
+    """Immutable snapshot of a `ToolRegistry`, built once and shared by agents.
+
+    Names and aliases resolve with a single lookup, and validators, capability flags and
+    the tool catalog are computed at freeze time. Registering on the snapshot raises, and
+    later changes to the source registry do not affect it, so one instance can serve
+    agents on any number of threads and event loops. The result cache, executor lane,
+    process pool and blob store are shared with the source registry.
+    """
+
+    def __init__(self, source: ToolRegistry) -> None:
+        super().__init__(
+            cache=source.cache,
+            process_pool=source.process_pool,
+            blob_store=source.blob_store,
+        )
+        self.lane = source.lane
+        self._tools = dict(source._tools)
+        self._validators = dict(source._validators)
+        self._async = dict(source._async)
+        self._aliases = dict(source._aliases)
+        self._limits = dict(source._limits)
+        self._timeouts = {
+            name: timeout
+            for name in self._tools
+            if (timeout := source.timeout_for(name)) is not None
+        }
+        self._resolved: Dict[str, Tool[Any]] = {
+            alias: self._tools[name] for alias, name in self._aliases.items()
+        }
+        self._resolved.update(self._tools)
+        self._tool_count = len(self._tools)
+        aliases_of: Dict[str, list[str]] = {}
+        for alias, name in self._aliases.items():
+            aliases_of.setdefault(name, []).append(alias)
+        self.catalog: tuple[ToolSpec, ...] = tuple(
+            ToolSpec(
+                name=name,
+                description=tool.description,
+                input_schema=tool.input_model.model_json_schema(),
+                aliases=tuple(aliases_of.get(name, ())),
+                is_async=self._async[name],
+                cacheable=tool.cacheable,
+                run_in_process=tool.run_in_process,
+                timeout_s=self._timeouts.get(name),
+                max_concurrency=limit.limit if (limit := self._limits.get(name)) else None,
+            )
+            for name, tool in self._tools.items()
+        )
+
+    def __len__(self) -> int:
+        return self._tool_count
+
+    def register(
+        self,
+        tool: Tool[Any],
+        timeout_s: float | None = None,
+        max_concurrency: int | None = None,
+        aliases: Iterable[str] = (),
+    ) -> None:
+        raise TypeError("FrozenToolRegistry is immutable; register tools before freeze().")
+
+    def freeze(self) -> FrozenToolRegistry:
+        return self
+
+    def get(self, name: str) -> Tool[Any]:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            raise ToolNotFoundError(f"Tool '{name}' is not registered") from None
+
+    def timeout_for(self, name: str) -> float | None:
+        tool = self._resolved.get(name)
+        return None if tool is None else self._timeouts.get(tool.name)
+
+
+def _validator_for(tool: Tool[Any]) -> Callable[[dict[str, Any]], Any]:
+    # Tools that customise `validate` keep it; otherwise call the input model's compiled
+    # pydantic validator directly.
+    if type(tool).validate is not Tool.validate:
+        return tool.validate
+    validator: Callable[[dict[str, Any]], Any] = (
+        tool.input_model.__pydantic_validator__.validate_python
+    )
+    return validator
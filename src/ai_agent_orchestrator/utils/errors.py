@@ -12,3 +12,11 @@ class ToolExecutionError(OrchestratorError):
 
 class LLMError(OrchestratorError):
     """Raised when LLM interaction fails."""
+
+
+class AgentTimeoutError(OrchestratorError, TimeoutError):
+    """Raised when a run exceeds its wall-clock budget."""
+
+
+class ToolTimeoutError(ToolExecutionError, TimeoutError):
+    """Raised when a tool exceeds its timeout."""
@@ -3,12 +3,19 @@ from __future__ import annotations
 import importlib
 import importlib.util
 import json
+import operator
 import os
+import threading
+from collections import OrderedDict, deque
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Sequence, cast
+from itertools import compress, islice
+from typing import Any, AsyncGenerator, AsyncIterator, Sequence, cast
 
 from ai_agent_orchestrator.llm import LLMClient, LLMStreamChunk
+from ai_agent_orchestrator.memory.base import PrefixedView
 from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import DecodedResponse, decode_output
 
 DEFAULT_BASE_URL = "http://localhost:1234/v1"
 DEFAULT_TIMEOUT = 30.0
@@ -64,6 +71,15 @@ class LMStudioClient(LLMClient):
             timeout=httpx_module.Timeout(self._config.timeout),
         )
         self._async_client = async_client
+        self._messages_encoder = MessagesEncoder()
+
+    @property
+    def model(self) -> str:
+        return self._config.model
+
+    @property
+    def base_url(self) -> str:
+        return self._config.base_url
 
     def generate(self, conversation: Sequence[Message]) -> str:
         raw = self._request(conversation)
@@ -72,8 +88,10 @@ class LMStudioClient(LLMClient):
     def _ensure_protocol_with_retry(
         self, raw_text: str, conversation: Sequence[Message]
     ) -> str:
-        if _is_protocol_compliant(raw_text):
-            return raw_text
+        decoded = decode_output(raw_text)
+        if decoded.is_valid:
+            # The agent reuses the attached decode instead of parsing the text again.
+            return DecodedResponse(raw_text, decoded)
 
         corrected_conversation = list(conversation) + [
             Message(role="system", content=PROTOCOL_REMINDER)
@@ -81,18 +99,15 @@ class LMStudioClient(LLMClient):
         return self._request(corrected_conversation)
 
     def _request(self, conversation: Sequence[Message]) -> str:
-        payload = {
-            "model": self._config.model,
-            "messages": [_message_to_dict(msg) for msg in conversation],
-        }
-        headers = {}
+        body = self._request_body(conversation, stream=False)
+        headers = {"Content-Type": "application/json"}
         if self._config.api_key:
             headers["Authorization"] = f"Bearer {self._config.api_key}"
 
         try:
             response = self._client.post(
                 "/chat/completions",
-                json=payload,
+                content=body,
                 headers=headers,
             )
             response.raise_for_status()
@@ -108,23 +123,19 @@ class LMStudioClient(LLMClient):
     async def stream(
         self, conversation: Sequence[Message]
     ) -> AsyncIterator[LLMStreamChunk]:
-        headers = {}
+        headers = {"Content-Type": "application/json"}
         if self._config.api_key:
             headers["Authorization"] = f"Bearer {self._config.api_key}"
 
         async def _stream_with_client(
             client: Any, messages: Sequence[Message], buffer_parts: list[str]
-        ) -> AsyncIterator[LLMStreamChunk]:
-            payload = {
-                "model": self._config.model,
-                "messages": [_message_to_dict(msg) for msg in messages],
-                "stream": True,
-            }
+        ) -> AsyncGenerator[LLMStreamChunk, None]:
+            body = self._request_body(messages, stream=True)
             try:
                 async with client.stream(
                     "POST",
                     "/chat/completions",
-                    json=payload,
+                    content=body,
                     headers=headers,
                     timeout=self._httpx.Timeout(self._config.timeout),
                 ) as response:
@@ -163,15 +174,18 @@ class LMStudioClient(LLMClient):
 
         async def _run_with_client(
             client: Any,
-        ) -> AsyncIterator[LLMStreamChunk]:
+        ) -> AsyncGenerator[LLMStreamChunk, None]:
             first_response_parts: list[str] = []
-            async for chunk in _stream_with_client(
-                client, conversation, first_response_parts
-            ):
-                yield chunk
+            # aclosing() releases the HTTP response as soon as the consumer stops
+            # iterating, instead of when the generator is garbage collected.
+            async with aclosing(
+                _stream_with_client(client, conversation, first_response_parts)
+            ) as first_stream:
+                async for chunk in first_stream:
+                    yield chunk
 
             first_response = "".join(first_response_parts)
-            if _is_protocol_compliant(first_response):
+            if decode_output(first_response).is_valid:
                 yield LLMStreamChunk(content="", is_final=True)
                 return
 
@@ -179,47 +193,110 @@ class LMStudioClient(LLMClient):
                 Message(role="system", content=PROTOCOL_REMINDER)
             ]
             retry_parts: list[str] = []
-            async for chunk in _stream_with_client(
-                client, retry_conversation, retry_parts
-            ):
-                yield chunk
+            async with aclosing(
+                _stream_with_client(client, retry_conversation, retry_parts)
+            ) as retry_stream:
+                async for chunk in retry_stream:
+                    yield chunk
             yield LLMStreamChunk(content="", is_final=True)
 
         if self._async_client is not None:
-            async for chunk in _run_with_client(self._async_client):
-                yield chunk
+            async with aclosing(_run_with_client(self._async_client)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
             return
 
         async with self._httpx.AsyncClient(
             base_url=self._config.base_url,
             timeout=self._httpx.Timeout(self._config.timeout),
         ) as client:
-            async for chunk in _run_with_client(client):
-                yield chunk
+            async with aclosing(_run_with_client(client)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
 
+    def _request_body(self, conversation: Sequence[Message], stream: bool) -> bytes:
+        messages = self._messages_encoder.encode(conversation)
+        model = json.dumps(self._config.model, ensure_ascii=False)
+        tail = ',"stream":true}' if stream else "}"
+        return f'{{"model":{model},"messages":{messages}{tail}'.encode("utf-8")
 
-def _message_to_dict(message: Message) -> dict[str, str]:
-    payload = {"role": message.role, "content": message.content}
-    if message.name:
-        payload["name"] = message.name
-    return payload
 
+class MessagesEncoder:
+    """Encodes conversations as JSON arrays, reusing each message's encoded JSON.
+
+    Conversations grow by appending, so consecutive requests resend mostly the same
+    messages. The encoder caches the JSON of each `(role, content, name)` it has
+    encoded, so interleaved sessions and forked conversations share one cache and an
+    in-place edit is simply a new entry. Lookups hash the content string once and then
+    compare it by identity, so unchanged messages cost no string comparison. Entries
+    count their content plus its JSON against `max_chars`; beyond it the least recently
+    used are dropped. A `SharedPrefix` at the start of the conversation is encoded once
+    for all encoders.
+    """
+
+    def __init__(self, max_chars: int = 16_000_000) -> None:
+        if max_chars < 1:
+            raise ValueError("max_chars must be a positive integer.")
+        self.max_chars = max_chars
+        self._cache: OrderedDict[_Fields, str] = OrderedDict()
+        self._chars = 0
+        # Held for dictionary updates only; messages are encoded outside it.
+        self._lock = threading.Lock()
+        # Messages taken from the cache by the last call.
+        self.reused = 0
+
+    @property
+    def cached_chars(self) -> int:
+        return self._chars
+
+    def encode(self, conversation: Sequence[Message]) -> str:
+        shared = _shared_fragments(conversation)
+        start = min(len(shared), len(conversation))
+        keys = list(map(_fields, islice(conversation, start, None)))
+        cache = self._cache
+        with self._lock:
+            cached = list(map(cache.get, keys))
+            # Fragments are never empty, so `compress` picks exactly the hits.
+            deque(map(cache.move_to_end, compress(keys, cached)), maxlen=0)
+        missing = [index for index, fragment in enumerate(cached) if fragment is None]
+        for index in missing:
+            cached[index] = _encode_message(conversation[start + index])
+        if missing:
+            with self._lock:
+                for index in missing:
+                    key = keys[index]
+                    if key not in cache:
+                        cache[key] = cast(str, cached[index])
+                        self._chars += _entry_chars(key, cache[key])
+                while self._chars > self.max_chars and cache:
+                    self._chars -= _entry_chars(*cache.popitem(last=False))
+        self.reused = len(conversation) - len(missing)
+        return f"[{','.join([*shared[:start], *cast(list[str], cached)])}]"
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
-def _is_protocol_compliant(raw: str) -> bool:
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return False
 
-    if not isinstance(data, dict):
-        return False
+def _entry_chars(key: _Fields, fragment: str) -> int:
+    return len(key[1]) + len(fragment)
 
-    message_type = data.get("type")
-    if message_type == "tool_call":
-        tool_name = data.get("tool_name")
-        args = data.get("args", {})
-        return isinstance(tool_name, str) and isinstance(args, dict)
-    if message_type == "final":
-        return "content" in data
 
-    return False
+_Fields = tuple[str, str, "str | None"]
+_fields = operator.attrgetter("role", "content", "name")
+
+
+def _shared_fragments(conversation: Sequence[Message]) -> tuple[str, ...]:
+    if isinstance(conversation, PrefixedView) and conversation.shared_prefix is not None:
+        return conversation.shared_prefix.encoded(_encode_message)
+    return ()
+
+
+def _encode_message(message: Message) -> str:
+    return json.dumps(_message_to_dict(message), ensure_ascii=False, separators=(",", ":"))
+
+
+def _message_to_dict(message: Message) -> dict[str, str]:
+    payload = {"role": message.role, "content": message.content}
+    if message.name:
+        payload["name"] = message.name
+    return payload
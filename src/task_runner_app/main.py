@@ -7,8 +7,10 @@ from typing import Annotated
 import typer
 
 from ai_agent_orchestrator.agent import Agent, AgentEventType
+from ai_agent_orchestrator.memory.base import SharedPrefix
 from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
-from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.tools.blobs import BlobStore
+from ai_agent_orchestrator.tools.cache import ToolResultCache
 from task_runner_app.llm import LMStudioClient
 from task_runner_app.tools import build_tool_registry
 
@@ -20,8 +22,12 @@ SYSTEM_PROMPT = """You are a task runner assistant. Follow the protocol strictly
 
 You must respond ONLY with valid JSON of one of these forms:
 {"type":"tool_call","tool_name":"...","args":{...}}
+{"type":"tool_calls","calls":[{"tool_name":"...","args":{...}}, ...]}
 {"type":"final","content":"..."}
 
+Use "tool_calls" only for independent calls (for example reading several files); they
+may run concurrently and their results arrive in the listed order.
+
 Tool names are EXACT and must match the list below. Do not invent new tool names or
 shorten them. For example, never respond with a made-up tool name like "tasks" when the
 list says "tasks.list".
@@ -40,6 +46,7 @@ Available tools:
 - text.search(path, query): Search for a string within a text file.
 - tasks.add(title, notes, priority): Add a task entry to workspace/tasks.json.
 - tasks.list(): List tasks from workspace/tasks.json.
+- blob.read(blob_id, offset, limit): Read more of a large result shown as a blob handle.
 
 Examples:
 "List my tasks." ->
@@ -53,6 +60,9 @@ Examples:
 }}
 """
 
+# Validated once and shared by every conversation that starts with it.
+SYSTEM_PREFIX = SharedPrefix.system(SYSTEM_PROMPT)
+
 
 @app.command()
 def task_runner(
@@ -72,10 +82,11 @@ def task_runner(
     )
     workspace_root.mkdir(parents=True, exist_ok=True)
 
-    memory = InMemoryMemory()
-    memory.add(Message(role="system", content=SYSTEM_PROMPT))
+    memory = InMemoryMemory(prefix=SYSTEM_PREFIX)
 
-    tools = build_tool_registry(repo_root, workspace_root)
+    tools = build_tool_registry(
+        repo_root, workspace_root, cache=ToolResultCache(), blob_store=BlobStore()
+    )
     llm = LMStudioClient()
     agent = Agent(llm=llm, tools=tools, memory=memory, max_steps=max_steps)
     response = agent.run(instruction)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ai_agent_orchestrator.tools.blobs import BlobStore
+from ai_agent_orchestrator.tools.builtin.blob_tool import BlobReadTool
+from ai_agent_orchestrator.tools.cache import ToolResultCache
 from ai_agent_orchestrator.tools.registry import ToolRegistry
 from task_runner_app.tools.files import (
     FilesListDirTool,
@@ -12,8 +15,13 @@ from task_runner_app.tools.files import (
 from task_runner_app.tools.tasks import TaskAddTool, TaskListAliasTool, TaskListTool
 
 
-def build_tool_registry(repo_root: Path, workspace_root: Path) -> ToolRegistry:
-    registry = ToolRegistry()
+def build_tool_registry(
+    repo_root: Path,
+    workspace_root: Path,
+    cache: ToolResultCache | None = None,
+    blob_store: BlobStore | None = None,
+) -> ToolRegistry:
+    registry = ToolRegistry(cache=cache, blob_store=blob_store)
     allowed_roots = [repo_root, workspace_root]
 
     registry.register(FilesReadTextTool(allowed_roots))
@@ -23,5 +31,7 @@ def build_tool_registry(repo_root: Path, workspace_root: Path) -> ToolRegistry:
     registry.register(TaskAddTool(workspace_root))
     registry.register(TaskListTool(workspace_root))
     registry.register(TaskListAliasTool(workspace_root))
+    if blob_store is not None:
+        registry.register(BlobReadTool(blob_store))
 
     return registry
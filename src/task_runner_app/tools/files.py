@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Iterable
 
 from pydantic import Field
 
 from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.cache import path_tag
+from ai_agent_orchestrator.tools.encoding import compact_json, records_table
 from task_runner_app.tools.sandbox import resolve_path
 
 MAX_SEARCH_FILE_SIZE = 200_000
@@ -33,10 +35,14 @@ class FilesReadTextTool(Tool[ReadTextInput]):
     name = "files.read_text"
     description = "Read a UTF-8 text file within the repo or workspace."
     input_model = ReadTextInput
+    cacheable = True
 
     def __init__(self, allowed_roots: list[Path]) -> None:
         self._allowed_roots = allowed_roots
 
+    def cache_tags(self, validated_input: ReadTextInput) -> Iterable[str]:
+        return [resolved_path_tag(validated_input.path, self._allowed_roots)]
+
     def run(self, validated_input: ReadTextInput) -> str:
         resolved = resolve_path(validated_input.path, self._allowed_roots)
         if not resolved.is_file():
@@ -48,16 +54,20 @@ class FilesListDirTool(Tool[ListDirInput]):
     name = "files.list_dir"
     description = "List directory contents within the repo or workspace."
     input_model = ListDirInput
+    cacheable = True
 
     def __init__(self, allowed_roots: list[Path]) -> None:
         self._allowed_roots = allowed_roots
 
+    def cache_tags(self, validated_input: ListDirInput) -> Iterable[str]:
+        return [resolved_path_tag(validated_input.path, self._allowed_roots)]
+
     def run(self, validated_input: ListDirInput) -> str:
         resolved = resolve_path(validated_input.path, self._allowed_roots)
         if not resolved.is_dir():
             raise ValueError(f"{resolved} is not a directory")
         entries = sorted(path.name for path in resolved.iterdir())
-        return json.dumps(entries, ensure_ascii=False)
+        return compact_json(entries)
 
 
 class FilesWriteTextTool(Tool[WriteTextInput]):
@@ -68,6 +78,9 @@ class FilesWriteTextTool(Tool[WriteTextInput]):
     def __init__(self, workspace_root: Path) -> None:
         self._workspace_root = workspace_root
 
+    def invalidates(self, validated_input: WriteTextInput) -> Iterable[str]:
+        return workspace_path_tags(validated_input.path, self._workspace_root)
+
     def run(self, validated_input: WriteTextInput) -> str:
         resolved = resolve_path(validated_input.path, [self._workspace_root])
         resolved.parent.mkdir(parents=True, exist_ok=True)
@@ -79,10 +92,15 @@ class TextSearchTool(Tool[SearchTextInput]):
     name = "text.search"
     description = "Search for a string within a text file (size-limited)."
     input_model = SearchTextInput
+    cacheable = True
+    output_char_budget = 8000
 
     def __init__(self, allowed_roots: list[Path]) -> None:
         self._allowed_roots = allowed_roots
 
+    def cache_tags(self, validated_input: SearchTextInput) -> Iterable[str]:
+        return [resolved_path_tag(validated_input.path, self._allowed_roots)]
+
     def run(self, validated_input: SearchTextInput) -> str:
         resolved = resolve_path(validated_input.path, self._allowed_roots)
         if not resolved.is_file():
@@ -90,11 +108,30 @@ class TextSearchTool(Tool[SearchTextInput]):
         if resolved.stat().st_size > MAX_SEARCH_FILE_SIZE:
             raise ValueError("File too large to search")
 
-        results: list[dict[str, str | int]] = []
+        matches: list[dict[str, str | int]] = []
         for idx, line in enumerate(
             resolved.read_text(encoding="utf-8", errors="replace").splitlines(),
             start=1,
         ):
             if validated_input.query in line:
-                results.append({"line": idx, "text": line})
-        return json.dumps(results, ensure_ascii=False)
+                matches.append({"line": idx, "text": line})
+        if not matches:
+            return "No matches."
+        return records_table(matches, columns=("line", "text"))
+
+
+def resolved_path_tag(path: str | Path, allowed_roots: list[Path]) -> str:
+    """Cache tag of `path` as the tools resolve it, so readers and writers agree on it."""
+    return path_tag(resolve_path(str(path), allowed_roots))
+
+
+def workspace_path_tags(path: str | Path, workspace_root: Path) -> list[str]:
+    """Tags for a written path plus every directory listing it may change."""
+    resolved = resolve_path(str(path), [workspace_root])
+    root = workspace_root.resolve()
+    tags = [path_tag(resolved)]
+    for parent in resolved.parents:
+        tags.append(path_tag(parent))
+        if parent == root:
+            break
+    return tags
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Iterable
 
 from pydantic import ConfigDict, Field
 
 from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.encoding import records_table
+from task_runner_app.tools.files import resolved_path_tag, workspace_path_tags
 from task_runner_app.tools.sandbox import resolve_path
 
+TASKS_FILE = "tasks.json"
+
 
 class TaskAddInput(ToolInput):
     title: str
@@ -23,11 +28,11 @@ class TaskAddTool(Tool[TaskAddInput]):
     def __init__(self, workspace_root: Path) -> None:
         self._workspace_root = workspace_root
 
+    def invalidates(self, validated_input: TaskAddInput) -> Iterable[str]:
+        return workspace_path_tags(self._workspace_root / TASKS_FILE, self._workspace_root)
+
     def run(self, validated_input: TaskAddInput) -> str:
-        tasks_path = resolve_path(
-            str(self._workspace_root / "tasks.json"),
-            [self._workspace_root],
-        )
+        tasks_path = _tasks_path(self._workspace_root)
         tasks = _load_tasks(tasks_path)
         tasks.append(
             {
@@ -49,17 +54,17 @@ class TaskListTool(Tool[TaskListInput]):
     name = "tasks.list"
     description = "List tasks from the workspace task list."
     input_model = TaskListInput
+    cacheable = True
 
     def __init__(self, workspace_root: Path) -> None:
         self._workspace_root = workspace_root
 
+    def cache_tags(self, validated_input: TaskListInput) -> Iterable[str]:
+        return [resolved_path_tag(self._workspace_root / TASKS_FILE, [self._workspace_root])]
+
     def run(self, validated_input: TaskListInput) -> str:
-        tasks_path = resolve_path(
-            str(self._workspace_root / "tasks.json"),
-            [self._workspace_root],
-        )
-        tasks = _load_tasks(tasks_path)
-        return json.dumps(tasks, ensure_ascii=False, indent=2)
+        tasks_path = _tasks_path(self._workspace_root)
+        return _render_tasks(_load_tasks(tasks_path))
 
 
 class TaskListAliasInput(ToolInput):
@@ -70,17 +75,26 @@ class TaskListAliasTool(Tool[TaskListAliasInput]):
     name = "tasks"
     description = "Alias for tasks.list to list tasks from the workspace task list."
     input_model = TaskListAliasInput
+    cacheable = True
 
     def __init__(self, workspace_root: Path) -> None:
         self._workspace_root = workspace_root
 
+    def cache_tags(self, validated_input: TaskListAliasInput) -> Iterable[str]:
+        return [resolved_path_tag(self._workspace_root / TASKS_FILE, [self._workspace_root])]
+
     def run(self, validated_input: TaskListAliasInput) -> str:
-        tasks_path = resolve_path(
-            str(self._workspace_root / "tasks.json"),
-            [self._workspace_root],
-        )
-        tasks = _load_tasks(tasks_path)
-        return json.dumps(tasks, ensure_ascii=False, indent=2)
+        tasks_path = _tasks_path(self._workspace_root)
+        return _render_tasks(_load_tasks(tasks_path))
+
+
+def _tasks_path(workspace_root: Path) -> Path:
+    return resolve_path(str(workspace_root / TASKS_FILE), [workspace_root])
+
+
+def _render_tasks(tasks: list[dict[str, str]]) -> str:
+    # The tools returned `indent=2` JSON before they switched to tables.
+    return records_table(tasks, raw_indent=2) if tasks else "No tasks."
 
 
 def _load_tasks(path: Path) -> list[dict[str, str]]:
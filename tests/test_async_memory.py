@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.base import SupportsAsyncMemory
+from ai_agent_orchestrator.memory.executor import ExecutorMemory
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput
+from ai_agent_orchestrator.sessions import SessionManager
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+DELAY_S = 0.02
+
+
+class SlowMemory(InMemoryMemory):
+    """Stands in for a disk or database backend: every call blocks its thread."""
+
+    def add(self, message: Message) -> None:
+        time.sleep(DELAY_S)
+        super().add(message)
+
+    def snapshot(self) -> Sequence[Message]:
+        time.sleep(DELAY_S)
+        return super().snapshot()
+
+
+class RecordingMemory(ExecutorMemory):
+    def __init__(self) -> None:
+        super().__init__(InMemoryMemory())
+        self.calls: List[str] = []
+
+    def add(self, message: Message) -> None:
+        self.calls.append("add")
+        super().add(message)
+
+    async def extend_async(self, messages: Sequence[Message]) -> None:
+        self.calls.append(f"extend_async:{len(messages)}")
+        await super().extend_async(messages)
+
+    async def get_conversation_async(self) -> Sequence[Message]:
+        self.calls.append("get_conversation_async")
+        return await super().get_conversation_async()
+
+    async def flush_async(self) -> None:
+        self.calls.append("flush_async")
+        await super().flush_async()
+
+
+def _final(content: str) -> str:
+    return FinalOutput(type="final", content=content).model_dump_json()
+
+
+def test_async_agent_prefers_async_memory_methods() -> None:
+    memory = RecordingMemory()
+    agent = Agent(llm=FakeLLM([_final("done")]), tools=ToolRegistry(), memory=memory)
+
+    response = asyncio.run(agent.run_async("hi"))
+
+    assert isinstance(memory, SupportsAsyncMemory)
+    assert response.content == "done"
+    assert memory.calls == [
+        "extend_async:1",
+        "get_conversation_async",
+        "extend_async:1",
+        "flush_async",
+    ]
+    assert [m.content for m in memory.snapshot()] == ["hi", "done"]
+    assert isinstance(memory.fork(), ExecutorMemory)
+
+
+def test_sync_memories_in_an_executor_do_not_block_concurrent_sessions() -> None:
+    sessions = 20
+    executor = ThreadPoolExecutor(max_workers=sessions)
+    tools = ToolRegistry()
+
+    async def _run_all() -> tuple[list[ExecutorMemory], float]:
+        memories = [ExecutorMemory(SlowMemory(), executor) for _ in range(sessions)]
+        lag = 0.0
+        running = True
+
+        async def _ticker() -> None:
+            nonlocal lag
+            while running:
+                before = time.perf_counter()
+                await asyncio.sleep(0.001)
+                lag = max(lag, time.perf_counter() - before)
+
+        ticker = asyncio.create_task(_ticker())
+        await asyncio.gather(
+            *(
+                Agent(llm=FakeLLM([_final(f"done {i}")]), tools=tools, memory=memory).run_async(
+                    f"task {i}"
+                )
+                for i, memory in enumerate(memories)
+            )
+        )
+        running = False
+        await ticker
+        return memories, lag
+
+    start = time.perf_counter()
+    memories, lag = asyncio.run(_run_all())
+    elapsed = time.perf_counter() - start
+    executor.shutdown()
+
+    # Each run makes three blocking memory calls; serially that is 3 * sessions * DELAY_S.
+    assert elapsed < sessions * 3 * DELAY_S / 2
+    assert lag < 2 * DELAY_S
+    for i, memory in enumerate(memories):
+        assert [m.content for m in memory.snapshot()] == [f"task {i}", f"done {i}"]
+
+
+class UnsafeMemory(InMemoryMemory):
+    """Fails if two threads are ever inside it at once, or is called on the `forbidden` thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inside = 0
+        self.overlaps = 0
+        self.forbidden: int | None = None
+        self.calls_on_forbidden = 0
+
+    def _enter(self) -> None:
+        self.inside += 1
+        self.overlaps += self.inside > 1
+        if threading.get_ident() == self.forbidden:
+            self.calls_on_forbidden += 1
+        time.sleep(0.001)
+        self.inside -= 1
+
+    def add(self, message: Message) -> None:
+        self._enter()
+        super().add(message)
+
+    def snapshot(self) -> Sequence[Message]:
+        self._enter()
+        return super().snapshot()
+
+    def messages_since(self, version: int) -> Sequence[Message]:
+        self._enter()
+        return super().messages_since(version)
+
+
+def test_executor_memory_serializes_calls_into_the_wrapped_memory() -> None:
+    inner = UnsafeMemory()
+    memory = ExecutorMemory(inner, ThreadPoolExecutor(max_workers=8))
+
+    async def _hammer() -> None:
+        adds = [memory.add_async(Message(role="user", content=str(i))) for i in range(20)]
+        reads = [memory.get_conversation_async() for _ in range(10)]
+        await asyncio.gather(*adds, *reads, asyncio.to_thread(memory.snapshot))
+
+    asyncio.run(_hammer())
+
+    assert inner.overlaps == 0
+    assert len(memory) == 20
+
+
+def test_session_bookkeeping_of_async_memories_stays_off_the_loop() -> None:
+    inner = UnsafeMemory()
+    agent = Agent(llm=FakeLLM([_final("done")]), tools=ToolRegistry(), memory=InMemoryMemory())
+    manager = SessionManager(agent, memory_factory=lambda: ExecutorMemory(inner))
+
+    async def _turn() -> None:
+        inner.forbidden = threading.get_ident()
+        await manager.run_async("s", "hi")
+
+    asyncio.run(_turn())
+
+    assert inner.calls_on_forbidden == 0
+    assert manager.resident_bytes == len("userhi") + len("assistantdone")
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import ListEventSink
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools import AsyncTool, Tool, ToolInput, ToolRegistry
+from ai_agent_orchestrator.tools.builtin.echo_tool import EchoTool
+from ai_agent_orchestrator.tools.cache import ToolResultCache
+from ai_agent_orchestrator.utils.errors import ToolExecutionError, ToolTimeoutError
+
+
+class FetchInput(ToolInput):
+    key: str
+    delay: float = 0.0
+
+
+class FetchTool(AsyncTool[FetchInput]):
+    name = "fetch"
+    description = "Async lookup."
+    input_model = FetchInput
+    cacheable = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.threads: list[int] = []
+        self.cancelled = False
+
+    async def arun(self, validated_input: FetchInput) -> str:
+        self.calls += 1
+        self.threads.append(threading.get_ident())
+        try:
+            await asyncio.sleep(validated_input.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if validated_input.key == "boom":
+            raise ValueError("boom")
+        return f"value:{validated_input.key}"
+
+
+class ThreadInput(ToolInput):
+    pass
+
+
+class ThreadTool(Tool[ThreadInput]):
+    name = "thread"
+    description = "Reports the thread it ran on."
+    input_model = ThreadInput
+
+    def run(self, validated_input: ThreadInput) -> str:
+        return str(threading.get_ident())
+
+
+def _registry(cache: ToolResultCache | None = None) -> tuple[ToolRegistry, FetchTool]:
+    tool = FetchTool()
+    tools = ToolRegistry(cache=cache)
+    tools.register(tool)
+    tools.register(ThreadTool())
+    return tools, tool
+
+
+def test_async_tools_run_on_the_loop_and_sync_tools_in_a_thread() -> None:
+    tools, tool = _registry()
+
+    async def run_both() -> tuple[str, str, int]:
+        fetched = await tools.run_async("fetch", {"key": "a"})
+        thread_id = await tools.run_async("thread", {})
+        return fetched, thread_id, threading.get_ident()
+
+    fetched, thread_id, loop_thread = asyncio.run(run_both())
+
+    assert fetched == "value:a"
+    assert tool.threads == [loop_thread]
+    assert int(thread_id) != loop_thread
+
+
+def test_async_tool_errors_are_wrapped_and_results_cached() -> None:
+    tools, tool = _registry(cache=ToolResultCache())
+
+    async def run() -> tuple[bool, bool]:
+        first = await tools.execute_async("fetch", {"key": "a"})
+        second = await tools.execute_async("fetch", {"key": "a"})
+        return first.cached, second.cached
+
+    assert asyncio.run(run()) == (False, True)
+    assert tool.calls == 1
+    with pytest.raises(ToolExecutionError, match="boom"):
+        asyncio.run(tools.run_async("fetch", {"key": "boom"}))
+
+
+def test_async_tool_supports_sync_callers() -> None:
+    tools, _ = _registry()
+
+    assert tools.run("fetch", {"key": "b"}) == "value:b"
+
+
+def test_builtin_tools_are_async_native() -> None:
+    tools = ToolRegistry()
+    tools.register(EchoTool())
+
+    assert asyncio.run(tools.run_async("echo", {"message": "hi"})) == "hi"
+
+
+def test_agent_awaits_async_tools_and_cancels_them_on_timeout() -> None:
+    tools, tool = _registry()
+    tools.register(tool, timeout_s=0.05)
+    llm = FakeLLM(
+        [
+            ToolCallOutput(
+                type="tool_call", tool_name="fetch", args={"key": "a"}
+            ).model_dump_json(),
+            ToolCallOutput(
+                type="tool_call", tool_name="fetch", args={"key": "b", "delay": 5}
+            ).model_dump_json(),
+            FinalOutput(type="final", content="Done").model_dump_json(),
+        ]
+    )
+    agent = Agent(llm=llm, tools=tools, memory=InMemoryMemory())
+    sink = ListEventSink()
+
+    with pytest.raises(ToolTimeoutError):
+        asyncio.run(agent.run_async("go", event_sink=sink))
+
+    assert tool.cancelled
+    statuses = [
+        event.data["status"] for event in sink.events if event.name == "agent.tool.finished"
+    ]
+    assert statuses == ["ok", "timeout"]
+    assert [m.content for m in agent.memory.get_conversation() if m.role == "tool"] == [
+        "value:a"
+    ]
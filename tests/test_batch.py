@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.batch import BatchItemResult, summarize_batch
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+class DelayedAsyncLLM:
+    """Async LLM that sleeps for the number of milliseconds in the user prompt."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.conversations: list[list[str]] = []
+
+    async def generate(self, conversation: Sequence[Message]) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.conversations.append([msg.content for msg in conversation])
+        prompt = conversation[-1].content
+        try:
+            if prompt == "fail":
+                raise RuntimeError("provider down")
+            await asyncio.sleep(int(prompt) / 1000)
+        finally:
+            self.active -= 1
+        return FinalOutput(type="final", content=f"done {prompt}").model_dump_json()
+
+
+def test_run_batch_async_yields_results_as_they_complete() -> None:
+    llm = DelayedAsyncLLM()
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+
+    async def collect() -> list[int]:
+        batch = agent.run_batch_async(["60", "5", "30"], max_concurrency=3)
+        return [result.index async for result in batch]
+
+    assert asyncio.run(collect()) == [1, 2, 0]
+    assert agent.memory.get_conversation() == []
+
+
+def test_run_many_isolates_memories_and_caps_concurrency() -> None:
+    llm = DelayedAsyncLLM()
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+    memories: list[InMemoryMemory] = []
+
+    def memory_factory() -> InMemoryMemory:
+        memory = InMemoryMemory()
+        memory.add(Message(role="system", content="sys"))
+        memories.append(memory)
+        return memory
+
+    report = agent.run_many(
+        [str(delay) for delay in (10, 1, 5, 2, 8, 3)],
+        memory_factory=memory_factory,
+        max_concurrency=2,
+    )
+
+    assert [result.index for result in report.results] == [0, 1, 2, 3, 4, 5]
+    assert [
+        result.response.content for result in report.results if result.response
+    ] == ["done 10", "done 1", "done 5", "done 2", "done 8", "done 3"]
+    assert llm.peak == 2
+    assert all(len(conversation) == 2 for conversation in llm.conversations)
+    assert sorted(len(memory.get_conversation()) for memory in memories) == [3] * 6
+    assert report.summary is not None
+    assert report.summary.total == 6
+    assert report.summary.succeeded == 6
+
+
+def test_run_many_reports_failures_per_item() -> None:
+    agent = Agent(llm=DelayedAsyncLLM(), tools=ToolRegistry(), memory=InMemoryMemory())
+
+    report = agent.run_many(["1", "fail", "2"])
+
+    assert [result.ok for result in report.results] == [True, False, True]
+    assert isinstance(report.results[1].error, RuntimeError)
+    assert report.results[1].response is None
+    assert report.summary is not None
+    assert report.summary.failed == 1
+
+
+def test_run_many_with_sync_llm() -> None:
+    agent = Agent(llm=FakeLLM(), tools=ToolRegistry(), memory=InMemoryMemory())
+
+    report = agent.run_many(["a", "b"])
+
+    assert [result.response.content for result in report.results if result.response] == [
+        "Echo: a",
+        "Echo: b",
+    ]
+
+
+def test_summarize_batch_computes_throughput_and_percentiles() -> None:
+    results = [
+        BatchItemResult(
+            index=i, user_input=str(i), response=None, error=None, latency_ms=float(latency)
+        )
+        for i, latency in enumerate([10, 20, 30, 40])
+    ]
+
+    summary = summarize_batch(results, elapsed_ms=500.0)
+
+    assert summary.throughput_per_s == pytest.approx(8.0)
+    assert summary.latency_mean_ms == pytest.approx(25.0)
+    assert summary.latency_p50_ms == 20.0
+    assert summary.latency_p95_ms == 40.0
+    assert summary.latency_max_ms == 40.0
+
+
+def test_batch_summary_uses_injected_timer() -> None:
+    ticks = iter([0.0, 1.0, 1.5, 2.0])
+    agent = Agent(llm=FakeLLM(), tools=ToolRegistry(), memory=InMemoryMemory())
+
+    report = agent.run_many(["a"], timer=lambda: next(ticks))
+
+    assert report.results[0].latency_ms == pytest.approx(500.0)
+    assert report.summary is not None
+    assert report.summary.elapsed_ms == pytest.approx(2000.0)
+    assert report.summary.throughput_per_s == pytest.approx(0.5)
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    agent = Agent(llm=FakeLLM(), tools=ToolRegistry(), memory=InMemoryMemory())
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        agent.run_batch_async(["a"], max_concurrency=0)
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import AgentEvent
+from ai_agent_orchestrator.tools.blobs import BlobStore
+from ai_agent_orchestrator.tools.builtin.blob_tool import BlobReadTool
+from ai_agent_orchestrator.tools.builtin.echo_tool import EchoTool
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+from ai_agent_orchestrator.utils.errors import ToolExecutionError
+
+
+def _registry(store: BlobStore) -> ToolRegistry:
+    registry = ToolRegistry(blob_store=store)
+    registry.register(EchoTool())
+    registry.register(BlobReadTool(store))
+    return registry
+
+
+def test_small_results_stay_inline() -> None:
+    registry = _registry(BlobStore(threshold_chars=20, preview_chars=5))
+
+    execution = registry.execute("echo", {"message": "short"})
+
+    assert (execution.content, execution.blob_id) == ("short", None)
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_large_results_are_replaced_by_a_handle_and_paged(tmp_path: Path, on_disk: bool) -> None:
+    store = BlobStore(threshold_chars=20, preview_chars=5, path=tmp_path if on_disk else None)
+    registry = _registry(store)
+    message = "".join(str(i % 10) for i in range(50))
+
+    execution = registry.execute("echo", {"message": message})
+
+    assert execution.blob_id is not None
+    assert execution.content.endswith("\n01234")
+    assert execution.blob_id in execution.content
+    assert store.get(execution.blob_id) == message
+    page = registry.run("blob.read", {"blob_id": execution.blob_id, "offset": 5, "limit": 10})
+    assert page == "5678901234\n[35 more chars; next offset 15]"
+    # Pages are capped at the threshold so they are never offloaded themselves.
+    tail = registry.run("blob.read", {"blob_id": execution.blob_id, "offset": 40, "limit": 999})
+    assert tail == "0123456789"
+    assert registry.execute("echo", {"message": message}).blob_id == execution.blob_id
+
+
+def test_blob_read_rejects_unknown_ids(tmp_path: Path) -> None:
+    registry = _registry(BlobStore(path=tmp_path))
+
+    with pytest.raises(ToolExecutionError, match="Unknown blob id"):
+        registry.run("blob.read", {"blob_id": "blob-missing"})
+    with pytest.raises(ToolExecutionError, match="Unknown blob id"):
+        registry.run("blob.read", {"blob_id": "../escape"})
+
+
+def test_memory_blobs_are_capped_least_recently_used_first() -> None:
+    store = BlobStore(threshold_chars=10, preview_chars=0, max_memory_chars=25)
+    first, second = store.put("a" * 10), store.put("b" * 10)
+    store.get(first.blob_id)
+
+    third = store.put("c" * 10)
+
+    assert store.get(first.blob_id) == "a" * 10
+    assert store.get(third.blob_id) == "c" * 10
+    with pytest.raises(KeyError):
+        store.get(second.blob_id)
+    with pytest.raises(ValueError, match="max_memory_chars"):
+        BlobStore(max_memory_chars=0)
+
+
+def test_agent_keeps_handles_in_memory_and_reports_blob_ids() -> None:
+    store = BlobStore(threshold_chars=100, preview_chars=10)
+    memory = InMemoryMemory()
+    llm = FakeLLM(
+        [
+            '{"type":"tool_call","tool_name":"echo","args":{"message":"' + "x" * 1000 + '"}}',
+            '{"type":"final","content":"done"}',
+        ]
+    )
+    events: list[AgentEvent] = []
+    agent = Agent(llm=llm, tools=_registry(store), memory=memory)
+
+    agent.run("go", event_sink=events.append)
+
+    tool_message = next(msg for msg in memory.get_conversation() if msg.role == "tool")
+    assert len(tool_message.content) < 300
+    finished = next(event for event in events if event.name == "agent.tool.finished")
+    assert finished.data["blob_id"] in tool_message.content
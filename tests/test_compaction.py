@@ -0,0 +1,172 @@
+import asyncio
+from typing import List, Sequence
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.compaction import ConversationCompactor
+from ai_agent_orchestrator.memory.executor import ExecutorMemory
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.sessions import InMemorySessionStore, SessionManager
+from ai_agent_orchestrator.tools.builtin.math_tool import MathAddTool
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+class RecordingSummarizer:
+    def __init__(self) -> None:
+        self.requests: List[Sequence[Message]] = []
+
+    async def generate(self, conversation: Sequence[Message]) -> str:
+        self.requests.append(conversation)
+        return "added numbers"
+
+
+def _memory_with_tool_turns(turns: int) -> InMemoryMemory:
+    memory = InMemoryMemory()
+    memory.add(Message(role="system", content="sys"))
+    memory.add(Message(role="user", content="go"))
+    for index in range(turns):
+        memory.add(Message(role="assistant", content=f"call {index}"))
+        memory.add(Message(role="tool", content=f"result {index}", name="math.add"))
+    return memory
+
+
+def test_compactor_swaps_old_turns_for_a_summary() -> None:
+    memory = _memory_with_tool_turns(4)
+    summarizer = RecordingSummarizer()
+    compactor = ConversationCompactor(summarizer, keep_recent=2, min_span=2)
+    seen = memory.version
+
+    assert compactor.compact(memory) is True
+
+    conversation = memory.get_conversation()
+    assert [m.role for m in conversation] == ["system", "user", "system", "assistant", "tool"]
+    assert conversation[2].name == "summary"
+    assert conversation[2].content.endswith("added numbers")
+    assert [m.content for m in compactor.archived][:2] == ["call 0", "result 0"]
+    assert len(compactor.archived) == 6
+    assert "result 2" in summarizer.requests[0][-1].content
+    # A rewrite invalidates incremental reads: callers get the whole conversation back.
+    assert list(memory.messages_since(seen)) == conversation
+    # The summary itself is never compacted again.
+    assert compactor.compact(memory) is False
+
+
+def test_compaction_is_dropped_if_the_span_changed() -> None:
+    memory = _memory_with_tool_turns(3)
+    compactor = ConversationCompactor(RecordingSummarizer(), keep_recent=0, min_span=2)
+    start, span = compactor.select(memory.snapshot()) or (0, [])
+    other = Message(role="system", name="summary", content="elsewhere")
+    assert memory.replace_span(start, span, [other]) is True
+
+    assert memory.replace_span(start, span, [other]) is False
+    assert len(memory) == 3
+    assert compactor.compact(memory) is False
+    assert compactor.compactions == 0
+
+
+def test_compactor_rewrites_through_an_executor_memory() -> None:
+    inner = _memory_with_tool_turns(4)
+    memory = ExecutorMemory(inner)
+    compactor = ConversationCompactor(RecordingSummarizer(), keep_recent=2, min_span=2)
+
+    assert compactor.compact(memory) is True
+
+    assert [m.role for m in inner.get_conversation()] == [
+        "system", "user", "system", "assistant", "tool"
+    ]
+    assert memory.get_conversation() == inner.get_conversation()
+    assert compactor.compactions == 1
+
+
+def test_compactor_rejects_an_executor_memory_over_an_append_only_one() -> None:
+    class AppendOnlyMemory(InMemoryMemory):
+        replace_span = None  # type: ignore[assignment]
+
+    memory = ExecutorMemory(AppendOnlyMemory())
+    summarizer = RecordingSummarizer()
+
+    with pytest.raises(TypeError, match="AppendOnlyMemory"):
+        memory.replace_span(0, [], [])
+    with pytest.raises(TypeError, match="replace_span"):
+        ConversationCompactor(summarizer).compact(memory)
+    assert summarizer.requests == []
+
+
+def test_span_rewritten_during_summary_is_not_archived() -> None:
+    memory = _memory_with_tool_turns(3)
+
+    class RewritingSummarizer:
+        async def generate(self, conversation: Sequence[Message]) -> str:
+            memory.replace_span(2, memory.snapshot()[2:4], [])
+            return "stale"
+
+    compactor = ConversationCompactor(RewritingSummarizer(), keep_recent=0, min_span=2)
+
+    assert compactor.compact(memory) is False
+    assert compactor.archived == []
+    assert compactor.compactions == 0
+
+
+def _tool_turns_llm(turns: int) -> FakeLLM:
+    tool_call = ToolCallOutput(
+        type="tool_call", tool_name="math.add", args={"a": 1, "b": 2}
+    ).model_dump_json()
+    final = FinalOutput(type="final", content="Done").model_dump_json()
+    return FakeLLM([tool_call] * turns + [final])
+
+
+def _math_tools() -> ToolRegistry:
+    tools = ToolRegistry()
+    tools.register(MathAddTool())
+    return tools
+
+
+def test_agent_compacts_in_the_background_of_async_runs() -> None:
+    memory = InMemoryMemory()
+    compactor = ConversationCompactor(RecordingSummarizer(), keep_recent=1, min_span=2)
+    agent = Agent(
+        llm=_tool_turns_llm(4),
+        tools=_math_tools(),
+        memory=memory,
+        max_steps=5,
+        compactor=compactor,
+    )
+
+    async def _run() -> str:
+        response = await agent.run_async("add")
+        await agent.wait_for_compaction()
+        return response.content
+
+    assert asyncio.run(_run()) == "Done"
+    assert compactor.compactions >= 1
+    assert any(m.name == "summary" for m in memory.get_conversation())
+    assert memory.get_conversation()[-1].content == "Done"
+
+
+def test_session_turn_waits_for_compaction_before_release() -> None:
+    class SlowSummarizer:
+        async def generate(self, conversation: Sequence[Message]) -> str:
+            await asyncio.sleep(0.05)
+            return "added numbers"
+
+    compactor = ConversationCompactor(SlowSummarizer(), keep_recent=1, min_span=2)
+    agent = Agent(
+        llm=_tool_turns_llm(4),
+        tools=_math_tools(),
+        memory=InMemoryMemory(),
+        max_steps=5,
+        compactor=compactor,
+    )
+    store = InMemorySessionStore()
+    manager = SessionManager(agent, store=store)
+
+    asyncio.run(manager.run_async("a", "add"))
+    assert manager.evict("a") is True
+
+    saved = store.load("a") or []
+    assert compactor.compactions >= 1
+    assert any(m.name == "summary" for m in saved)
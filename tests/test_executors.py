@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.executors import ConcurrencyLimit, ExecutorLane
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import ListEventSink
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCall, ToolCallsOutput
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+class NapInput(ToolInput):
+    delay: float = 0.05
+
+
+class NapTool(Tool[NapInput]):
+    name = "nap"
+    description = "Sleeps and reports its thread name."
+    input_model = NapInput
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def run(self, validated_input: NapInput) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(validated_input.delay)
+            return threading.current_thread().name
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class ScriptedLLM:
+    """Sync client returning scripted responses and recording its thread names."""
+
+    def __init__(self, responses: list[str]) -> None:
+        self._responses = list(responses)
+        self.threads: list[str] = []
+
+    def generate(self, conversation: Sequence[Message]) -> str:
+        self.threads.append(threading.current_thread().name)
+        return self._responses.pop(0)
+
+
+def test_lane_reports_queue_depth_and_wait() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lane = ExecutorLane(executor)
+
+        async def run_three() -> list[tuple[float, int]]:
+            outcomes = await asyncio.gather(
+                *(lane.run(time.sleep, 0.05) for _ in range(3))
+            )
+            return [(queued.wait_ms, queued.depth) for _, queued in outcomes]
+
+        stats = asyncio.run(run_three())
+
+    # The first call starts at once; depth counts calls still waiting ahead.
+    assert [depth for _, depth in stats] == [0, 0, 1]
+    assert stats[2][0] >= 80
+    assert lane.queue_depth == 0
+
+
+def test_lane_releases_queue_slot_when_cancelled_before_start() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lane = ExecutorLane(executor)
+
+        async def cancel_queued() -> int:
+            running = asyncio.ensure_future(lane.run(time.sleep, 0.1))
+            queued = asyncio.ensure_future(lane.run(time.sleep, 0.1))
+            await asyncio.sleep(0.02)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await running
+            return lane.queue_depth
+
+        assert asyncio.run(cancel_queued()) == 0
+
+
+def test_concurrency_limit_works_across_event_loops() -> None:
+    limit = ConcurrencyLimit(1)
+
+    async def hold_three() -> list[int]:
+        async def hold() -> int:
+            async with limit.hold() as queued:
+                await asyncio.sleep(0.01)
+                return queued.depth
+
+        return list(await asyncio.gather(hold(), hold(), hold()))
+
+    assert asyncio.run(hold_three()) == [0, 0, 1]
+    assert asyncio.run(hold_three()) == [0, 0, 1]
+    with pytest.raises(ValueError, match="limit"):
+        ConcurrencyLimit(0)
+
+
+def test_agent_uses_dedicated_executors_and_reports_queueing() -> None:
+    calls = [ToolCall(tool_name="nap", args={}) for _ in range(3)]
+    llm = ScriptedLLM(
+        [
+            ToolCallsOutput(type="tool_calls", calls=calls).model_dump_json(),
+            FinalOutput(type="final", content="Done").model_dump_json(),
+        ]
+    )
+    tool = NapTool()
+    with (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm") as llm_executor,
+        ThreadPoolExecutor(max_workers=4, thread_name_prefix="tools") as tool_executor,
+    ):
+        tools = ToolRegistry(executor=tool_executor)
+        tools.register(tool, max_concurrency=1)
+        agent = Agent(
+            llm=llm, tools=tools, memory=InMemoryMemory(), llm_executor=llm_executor
+        )
+        sink = ListEventSink()
+        response = asyncio.run(agent.run_async("go", event_sink=sink))
+
+    assert response.content == "Done"
+    assert all(name.startswith("llm") for name in llm.threads)
+    tool_results = [m.content for m in agent.memory.get_conversation() if m.role == "tool"]
+    assert all(name.startswith("tools") for name in tool_results)
+    assert tool.peak == 1
+    responded = [e.data for e in sink.events if e.name == "agent.model.responded"]
+    assert all("queue_wait_ms" in data and "queue_depth" in data for data in responded)
+    finished = [e.data for e in sink.events if e.name == "agent.tool.finished"]
+    assert sorted(data["queue_depth"] for data in finished) == [0, 0, 1]
+    assert max(data["queue_wait_ms"] for data in finished) >= 80
+
+
+def test_default_executor_reports_no_queue_fields() -> None:
+    llm = ScriptedLLM([FinalOutput(type="final", content="Done").model_dump_json()])
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+    sink = ListEventSink()
+
+    asyncio.run(agent.run_async("go", event_sink=sink))
+
+    responded = [e.data for e in sink.events if e.name == "agent.model.responded"]
+    assert "queue_wait_ms" not in responded[0]
@@ -0,0 +1,171 @@
+import mmap
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ai_agent_orchestrator.memory.jsonl import JsonlLogStore
+from ai_agent_orchestrator.protocol.messages import Message
+
+
+def _contents(messages: object) -> list[str]:
+    return [message.content for message in messages]  # type: ignore[attr-defined]
+
+
+def test_jsonl_memory_round_trips_through_the_log(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    store = JsonlLogStore(path)
+    odd_id = 'team "a","q":1\\b'
+    store.memory(odd_id).add(Message(role="system", content="sys"))
+    store.memory("b").add(Message(role="user", content="other"))
+    store.memory(odd_id).add(Message(role="tool", content="é\n{}", name="echo"))
+    store.close()
+
+    reopened = JsonlLogStore(path)
+    memory = reopened.memory(odd_id)
+
+    assert sorted(reopened.session_ids()) == sorted([odd_id, "b"])
+    assert (len(memory), memory.version) == (2, 2)
+    assert memory.snapshot() == [
+        Message(role="system", content="sys"),
+        Message(role="tool", content="é\n{}", name="echo"),
+    ]
+    memory.add(Message(role="assistant", content="done"))
+    assert _contents(memory.messages_since(2)) == ["done"]
+    reopened.close()
+
+
+def test_jsonl_memory_round_trips_lone_surrogates(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    store = JsonlLogStore(path)
+    broken = "half a pair: \ud83d, emoji: \U0001f600"
+    store.memory("s\udc80").add(Message(role="tool", content=broken, name="\udfff"))
+    store.memory("s\udc80").add(Message(role="user", content="next"))
+    store.close()
+
+    memory = JsonlLogStore(path).memory("s\udc80")
+
+    assert memory.snapshot()[0] == Message(role="tool", content=broken, name="\udfff")
+    assert _contents(memory.snapshot())[1] == "next"
+    assert path.read_bytes().isascii()
+
+
+def test_jsonl_store_truncates_a_torn_last_line(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    store = JsonlLogStore(path)
+    store.memory("s").add(Message(role="user", content="kept"))
+    store.close()
+    with open(path, "ab") as handle:
+        handle.write(b'{"s":"s","q":1,"m":["user","cut')
+
+    reopened = JsonlLogStore(path)
+
+    assert reopened.recovered_bytes == len(b'{"s":"s","q":1,"m":["user","cut')
+    memory = reopened.memory("s")
+    assert _contents(memory.snapshot()) == ["kept"]
+    memory.add(Message(role="user", content="after"))
+    reopened.close()
+    assert _contents(JsonlLogStore(path).memory("s").snapshot()) == ["kept", "after"]
+
+
+def test_jsonl_compaction_applies_retention_and_drops_sessions(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    store = JsonlLogStore(path, retain_messages=2)
+    memory = store.memory("s")
+    for index in range(5):
+        memory.add(Message(role="user", content=f"m{index}"))
+        store.memory("gone").add(Message(role="user", content=f"g{index}"))
+    view = memory.snapshot()
+    store.drop_session("gone")
+
+    reclaimed = store.compact()
+
+    assert reclaimed > 0
+    assert len(view) == 5
+    assert _contents(memory.snapshot()) == ["m3", "m4"]
+    assert memory.version == 5
+    assert _contents(memory.messages_since(1)) == ["m3", "m4"]
+    memory.add(Message(role="user", content="m5"))
+    store.close()
+
+    reopened = JsonlLogStore(path)
+    assert reopened.session_ids() == ["s"]
+    assert _contents(reopened.memory("s").snapshot()) == ["m3", "m4", "m5"]
+    assert reopened.memory("s").version == 6
+    reopened.close()
+
+
+def test_jsonl_compaction_copies_without_blocking_appends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "log.jsonl"
+    store = JsonlLogStore(path, retain_messages=2)
+    memory = store.memory("s")
+    for index in range(4):
+        memory.add(Message(role="user", content=f"m{index}"))
+    real_mmap = mmap.mmap
+    appended: list[bool] = []
+
+    def _append_during_copy() -> None:
+        memory.add(Message(role="user", content="during"))
+        store.memory("new").add(Message(role="user", content="n0"))
+
+    def _mmap(fileno: int, length: int, **kwargs: Any) -> mmap.mmap:
+        if length and not appended:
+            # Only the copy maps a fixed length; it must not hold the store lock.
+            writer = threading.Thread(target=_append_during_copy)
+            writer.start()
+            writer.join(timeout=5)
+            appended.append(not writer.is_alive())
+        return real_mmap(fileno, length, **kwargs)
+
+    monkeypatch.setattr(mmap, "mmap", _mmap)
+    store.compact()
+    monkeypatch.undo()
+
+    assert appended == [True]
+    assert _contents(memory.snapshot()) == ["m2", "m3", "during"]
+    assert memory.version == 5
+    memory.add(Message(role="user", content="after"))
+    store.close()
+
+    reopened = JsonlLogStore(path)
+    assert _contents(reopened.memory("s").snapshot()) == ["m2", "m3", "during", "after"]
+    assert _contents(reopened.memory("new").snapshot()) == ["n0"]
+    reopened.close()
+
+
+def test_jsonl_memory_fork_copies_into_a_new_session(tmp_path: Path) -> None:
+    store = JsonlLogStore(tmp_path / "log.jsonl")
+    memory = store.memory("s")
+    memory.add(Message(role="system", content="sys"))
+    memory.add(Message(role="user", content="m0"))
+
+    forked = memory.fork("copy")
+    forked.add(Message(role="user", content="fork"))
+    memory.add(Message(role="user", content="parent"))
+
+    assert forked.store is store
+    assert _contents(forked.snapshot()) == ["sys", "m0", "fork"]
+    assert _contents(memory.snapshot()) == ["sys", "m0", "parent"]
+    assert memory.fork().session_id.startswith("s/")
+    with pytest.raises(ValueError, match="already has messages"):
+        memory.fork("copy")
+    store.close()
+
+
+def test_jsonl_background_compaction(tmp_path: Path) -> None:
+    store = JsonlLogStore(tmp_path / "log.jsonl", retain_messages=1)
+    memory = store.memory("s")
+    memory.add(Message(role="user", content="old"))
+    memory.add(Message(role="user", content="new"))
+
+    store.start_compaction(interval_s=0.01)
+    deadline = time.monotonic() + 5
+    while len(memory) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    store.close()
+
+    assert _contents(memory.snapshot()) == ["new"]
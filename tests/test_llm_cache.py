@@ -0,0 +1,217 @@
+import asyncio
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM, LLMStreamChunk
+from ai_agent_orchestrator.llm_cache import (
+    AsyncCachingLLM,
+    CachingLLM,
+    LLMResponseCache,
+    conversation_key,
+)
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import DecodedResponse, FinalOutput, decode_output
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+class CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate(self, conversation: Sequence[Message]) -> str:
+        self.calls += 1
+        return FinalOutput(
+            type="final", content=f"answer {self.calls}: {conversation[-1].content}"
+        ).model_dump_json()
+
+
+class CountingAsyncLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, conversation: Sequence[Message]) -> str:
+        self.calls += 1
+        return f"async {self.calls}"
+
+
+def _conversation(text: str = "Hi") -> list[Message]:
+    return [Message(role="system", content="sys"), Message(role="user", content=text)]
+
+
+def _collect(llm: CachingLLM, conversation: list[Message]) -> list[LLMStreamChunk]:
+    async def collect() -> list[LLMStreamChunk]:
+        return [chunk async for chunk in llm.stream(conversation)]
+
+    return asyncio.run(collect())
+
+
+def test_conversation_key_depends_on_messages_and_config() -> None:
+    base = conversation_key(_conversation(), {"model": "a"})
+
+    assert base == conversation_key(_conversation(), {"model": "a"})
+    assert base != conversation_key(_conversation("Other"), {"model": "a"})
+    assert base != conversation_key(_conversation(), {"model": "b"})
+    named = [Message(role="tool", content="x", name="t")]
+    assert conversation_key(named) != conversation_key([Message(role="tool", content="x")])
+
+
+def test_generate_hits_cache_for_identical_conversations() -> None:
+    inner = CountingLLM()
+    cache = LLMResponseCache()
+    llm = CachingLLM(inner, cache, model_config={"model": "m"})
+
+    first = llm.generate(_conversation())
+    second = llm.generate(_conversation())
+    llm.generate(_conversation("Other"))
+
+    assert first == second
+    assert inner.calls == 2
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_sqlite_store_survives_new_cache(tmp_path: Path) -> None:
+    path = tmp_path / "llm.sqlite"
+    cache = LLMResponseCache(path=path)
+    CachingLLM(CountingLLM(), cache).generate(_conversation())
+    cache.close()
+
+    inner = CountingLLM()
+    reopened = LLMResponseCache(path=path)
+    response = CachingLLM(inner, reopened).generate(_conversation())
+
+    assert "answer 1" in response
+    assert inner.calls == 0
+    assert reopened.stats.disk_hits == 1
+    reopened.close()
+
+
+def test_stream_replays_cached_response_as_chunks() -> None:
+    inner = CountingLLM()
+    llm = CachingLLM(inner, LLMResponseCache(), replay_chunk_size=8)
+    expected = llm.generate(_conversation())
+
+    chunks = _collect(llm, _conversation())
+
+    assert inner.calls == 1
+    assert "".join(chunk.content for chunk in chunks) == expected
+    assert len(chunks) > 2
+    assert [chunk.is_final for chunk in chunks] == [False] * (len(chunks) - 1) + [True]
+    assert chunks[-1].content == ""
+
+
+def test_generate_returns_plain_text_on_hits_and_misses() -> None:
+    class DecodingLLM:
+        def generate(self, conversation: Sequence[Message]) -> str:
+            text = FinalOutput(type="final", content="done").model_dump_json()
+            return DecodedResponse(text, decode_output(text))
+
+    llm = CachingLLM(DecodingLLM(), LLMResponseCache())
+
+    miss, hit = llm.generate(_conversation()), llm.generate(_conversation())
+
+    assert miss == hit
+    assert (type(miss), type(hit)) == (str, str)
+
+
+def test_stream_miss_passes_through_and_populates_cache() -> None:
+    output = FinalOutput(type="final", content="streamed").model_dump_json()
+    inner = FakeLLM([output], chunk_size=5)
+    llm = CachingLLM(inner, LLMResponseCache())
+
+    first = _collect(llm, _conversation())
+    second = _collect(llm, _conversation())
+
+    assert [chunk.content for chunk in first] == [
+        output[i : i + 5] for i in range(0, len(output), 5)
+    ]
+    assert "".join(chunk.content for chunk in second) == output
+    assert llm.generate(_conversation()) == output
+
+
+def test_agent_streaming_behaves_the_same_on_a_hit() -> None:
+    cache = LLMResponseCache()
+
+    def stream_once() -> str:
+        llm = CachingLLM(CountingLLM(), cache, replay_chunk_size=4)
+        agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+
+        async def collect() -> str:
+            return "".join(
+                [chunk.text async for chunk in agent.stream_async("Hi", stream_mode="incremental")]
+            )
+
+        return asyncio.run(collect())
+
+    assert stream_once() == stream_once() == "answer 1: Hi"
+    assert cache.stats.hits == 1
+
+
+def test_async_caching_llm_awaits_inner_generate_once() -> None:
+    inner = CountingAsyncLLM()
+    llm = AsyncCachingLLM(inner, LLMResponseCache())
+
+    async def run_twice() -> tuple[str, str]:
+        return await llm.generate(_conversation()), await llm.generate(_conversation())
+
+    assert asyncio.run(run_twice()) == ("async 1", "async 1")
+    assert inner.calls == 1
+
+
+def test_clients_of_one_type_with_different_models_do_not_share_keys() -> None:
+    class ModelLLM(CountingLLM):
+        def __init__(self, model: str, base_url: str) -> None:
+            super().__init__()
+            self.model = model
+            self.base_url = base_url
+
+    cache = LLMResponseCache()
+    keys = {
+        CachingLLM(ModelLLM(model, url), cache).cache_key(_conversation())
+        for model, url in [("a", "http://x"), ("b", "http://x"), ("a", "http://y")]
+    }
+
+    assert len(keys) == 3
+
+
+def test_async_caching_llm_keeps_sqlite_off_the_event_loop(tmp_path: Path) -> None:
+    class ThreadRecordingCache(LLMResponseCache):
+        threads: set[int] = set()
+
+        def get(self, key: str) -> str | None:
+            self.threads.add(threading.get_ident())
+            return super().get(key)
+
+        def put(self, key: str, response: str) -> None:
+            self.threads.add(threading.get_ident())
+            super().put(key, response)
+
+    cache = ThreadRecordingCache(path=tmp_path / "llm.sqlite")
+    llm = AsyncCachingLLM(CountingAsyncLLM(), cache)
+
+    async def run_twice() -> int:
+        await llm.generate(_conversation())
+        await llm.generate(_conversation())
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run_twice())
+
+    assert cache.stats.hits == 1
+    assert cache.threads and loop_thread not in cache.threads
+    cache.close()
+
+
+def test_memory_tier_is_bounded() -> None:
+    cache = LLMResponseCache(max_entries=1)
+    cache.put("a", "1")
+    cache.put("b", "2")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "2"
+    with pytest.raises(ValueError, match="max_entries"):
+        LLMResponseCache(max_entries=0)
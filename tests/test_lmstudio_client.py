@@ -7,6 +7,8 @@ import json
 import time
 from typing import Any, AsyncIterator, Protocol, cast
 
+import pytest
+
 from ai_agent_orchestrator.protocol.messages import Message
 from task_runner_app.llm import PROTOCOL_REMINDER, LMStudioClient
 
@@ -196,3 +198,92 @@ def test_lmstudio_client_stream_retries_on_protocol_violation() -> None:
     messages = retry_body["messages"]
     assert messages[-1]["role"] == "system"
     assert PROTOCOL_REMINDER in messages[-1]["content"]
+
+
+def test_messages_encoder_reuses_unchanged_prefix() -> None:
+    from task_runner_app.llm import MessagesEncoder
+
+    encoder = MessagesEncoder()
+    conversation = [Message(role="system", content="Sys"), Message(role="user", content="Hi")]
+
+    def expected(messages: list[Message]) -> list[dict[str, Any]]:
+        return [message.model_dump(exclude_none=True) for message in messages]
+
+    assert json.loads(encoder.encode(conversation)) == expected(conversation)
+
+    conversation.append(Message(role="tool", content='{"a": "é"}', name="echo"))
+    assert json.loads(encoder.encode(conversation)) == expected(conversation)
+    assert encoder.reused == 2
+
+    # A retry conversation diverges only at the end; the next step drops the reminder.
+    retry = conversation + [Message(role="system", content=PROTOCOL_REMINDER)]
+    assert json.loads(encoder.encode(retry)) == expected(retry)
+    assert encoder.reused == 3
+    conversation.append(Message(role="assistant", content="done"))
+    assert json.loads(encoder.encode(conversation)) == expected(conversation)
+    assert encoder.reused == 3
+
+    # Edits in place are detected, and only the edited message is re-encoded.
+    conversation[1].content = "Hello"
+    assert json.loads(encoder.encode(conversation)) == expected(conversation)
+    assert encoder.reused == 3
+
+
+def test_messages_encoder_reuses_work_across_interleaved_conversations() -> None:
+    from task_runner_app.llm import MessagesEncoder
+
+    encoder = MessagesEncoder()
+    first = [Message(role="user", content="a0")]
+    second = [Message(role="user", content="b0")]
+    encoder.encode(first)
+    encoder.encode(second)
+    for step in range(1, 3):
+        for tag, conversation in (("a", first), ("b", second)):
+            conversation.append(Message(role="assistant", content=f"{tag}{step}"))
+            encoder.encode(conversation)
+            assert encoder.reused == len(conversation) - 1
+
+    # Beyond `max_chars` the least recently used entries are dropped: reading `first`
+    # again keeps it cached while `second`'s opening message makes room for a new one.
+    encoder.max_chars = encoder.cached_chars
+    encoder.encode(first)
+    encoder.encode([Message(role="user", content="c0")])
+    assert len(encoder) == 6
+    assert encoder.cached_chars <= encoder.max_chars
+    assert json.loads(encoder.encode(first)) == [
+        message.model_dump(exclude_none=True) for message in first
+    ]
+    assert encoder.reused == 3
+    encoder.encode(second)
+    assert encoder.reused == 2
+
+
+def test_messages_encoder_bounds_the_cache_by_size() -> None:
+    from task_runner_app.llm import MessagesEncoder
+
+    encoder = MessagesEncoder(max_chars=1_000)
+    for index in range(20):
+        encoder.encode([Message(role="user", content=f"{index:03d}" * 20)])
+    assert 0 < encoder.cached_chars <= 1_000
+    assert len(encoder) < 20
+    with pytest.raises(ValueError):
+        MessagesEncoder(max_chars=0)
+
+
+def test_messages_encoder_encodes_a_shared_prefix_once() -> None:
+    from ai_agent_orchestrator.memory.base import SharedPrefix
+    from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+    from task_runner_app.llm import MessagesEncoder
+
+    prefix = SharedPrefix([Message(role="system", content="Shared sys")])
+    memories = [InMemoryMemory(prefix=prefix) for _ in range(2)]
+    for index, memory in enumerate(memories):
+        memory.add(Message(role="user", content=f"hi {index}"))
+
+    bodies = [json.loads(MessagesEncoder().encode(m.snapshot())) for m in memories]
+
+    assert bodies[1] == [
+        {"role": "system", "content": "Shared sys"},
+        {"role": "user", "content": "hi 1"},
+    ]
+    assert len(prefix._encoded) == 1
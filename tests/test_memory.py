@@ -0,0 +1,170 @@
+from typing import List
+
+import pytest
+
+from ai_agent_orchestrator.memory.base import (
+    ConversationView,
+    Memory,
+    PrefixedView,
+    SharedPrefix,
+)
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.memory.window import SlidingWindowMemory
+from ai_agent_orchestrator.protocol.messages import Message
+
+
+def _message(index: int) -> Message:
+    return Message(role="user", content=f"m{index}")
+
+
+def test_snapshot_is_a_stable_view() -> None:
+    memory = InMemoryMemory()
+    memory.add(_message(0))
+    memory.add(_message(1))
+
+    snapshot = memory.snapshot()
+    memory.add(_message(2))
+
+    assert isinstance(snapshot, ConversationView)
+    assert len(snapshot) == 2
+    assert snapshot == [_message(0), _message(1)]
+    assert snapshot[-1] == _message(1)
+    assert snapshot[1:] == [_message(1)]
+    assert snapshot[::-1] == (_message(1), _message(0))
+    with pytest.raises(IndexError):
+        snapshot[2]
+    assert len(memory) == 3
+
+
+def test_messages_since_returns_only_new_messages() -> None:
+    memory = InMemoryMemory()
+    memory.add(_message(0))
+    seen = memory.version
+
+    memory.add(_message(1))
+    memory.add(_message(2))
+
+    assert memory.version == seen + 2
+    assert list(memory.messages_since(seen)) == [_message(1), _message(2)]
+    assert list(memory.messages_since(memory.version)) == []
+    with pytest.raises(ValueError):
+        memory.messages_since(memory.version + 1)
+
+
+class ListMemory(Memory):
+    def __init__(self) -> None:
+        self.messages: List[Message] = []
+
+    def add(self, message: Message) -> None:
+        self.messages.append(message)
+
+    def get_conversation(self) -> List[Message]:
+        return list(self.messages)
+
+
+def test_fork_shares_the_prefix_and_diverges() -> None:
+    base = InMemoryMemory()
+    for index in range(3):
+        base.add(_message(index))
+
+    left, right = base.fork(), base.fork()
+    base.add(_message(9))
+    left.add(_message(3))
+    grandchild = left.fork()
+    grandchild.add(_message(4))
+
+    assert base.snapshot() == [_message(i) for i in (0, 1, 2, 9)]
+    assert left.snapshot() == [_message(i) for i in range(4)]
+    assert right.snapshot() == [_message(i) for i in range(3)]
+    view = grandchild.snapshot()
+    assert isinstance(view, PrefixedView)
+    assert view == [_message(i) for i in range(5)]
+    assert (view[2], view[3], view[-1]) == (_message(2), _message(3), _message(4))
+    assert view[1:4] == (_message(1), _message(2), _message(3))
+    assert view[4:] == [_message(4)]
+    assert (len(grandchild), grandchild.version) == (5, 5)
+    assert list(grandchild.messages_since(3)) == [_message(3), _message(4)]
+    # Forks reference the parent's messages instead of copying them.
+    assert left.snapshot()[0] is base.snapshot()[0]
+
+
+def test_replace_span_in_a_fork_leaves_the_parent_alone() -> None:
+    base = InMemoryMemory()
+    for index in range(3):
+        base.add(_message(index))
+    fork = base.fork()
+    fork.add(_message(3))
+
+    assert fork.replace_span(1, fork.snapshot()[1:3], [_message(7)]) is True
+
+    assert fork.get_conversation() == [_message(0), _message(7), _message(3)]
+    assert base.get_conversation() == [_message(0), _message(1), _message(2)]
+
+
+def test_shared_prefix_is_interned_and_stored_once() -> None:
+    prefix = SharedPrefix.system("You are helpful.")
+    assert SharedPrefix.system("You are helpful.") is prefix
+
+    first, second = InMemoryMemory(prefix=prefix), InMemoryMemory(prefix=prefix)
+    first.add(_message(0))
+
+    assert first.snapshot() == [Message(role="system", content="You are helpful."), _message(0)]
+    assert first.snapshot()[0] is second.snapshot()[0] is prefix[0]
+    assert (len(second), second.version) == (1, 1)
+    assert list(first.messages_since(0)) == list(first.snapshot())
+    assert isinstance(first.snapshot(), PrefixedView)
+    assert first.snapshot().shared_prefix is prefix
+
+
+def test_memory_defaults_work_for_minimal_implementations() -> None:
+    memory = ListMemory()
+    memory.add(_message(0))
+    memory.add(_message(1))
+
+    assert memory.snapshot() == (_message(0), _message(1))
+    assert (len(memory), memory.version) == (2, 2)
+    assert memory.messages_since(1) == (_message(1),)
+    with pytest.raises(NotImplementedError, match="ListMemory"):
+        memory.fork()
+
+
+def test_sliding_window_keeps_pinned_system_and_recent_messages() -> None:
+    evicted: list[list[str]] = []
+    memory = SlidingWindowMemory(
+        max_size=10, on_evict=lambda batch: evicted.append([msg.content for msg in batch])
+    )
+    memory.add(Message(role="system", content="sys"))
+    for content in ["aaa", "bb", "cccc", "dd"]:
+        memory.add(Message(role="user", content=content))
+
+    assert [msg.content for msg in memory.snapshot()] == ["sys", "cccc", "dd"]
+    assert memory.size == 9
+    assert evicted == [["aaa"], ["bb"]]
+    assert [msg.content for msg in memory.messages_since(2)] == ["cccc", "dd"]
+    assert [msg.content for msg in memory.messages_since(0)] == ["sys", "cccc", "dd"]
+    assert (len(memory), memory.version) == (3, 5)
+
+
+def test_sliding_window_fork_keeps_its_budget_and_diverges() -> None:
+    memory = SlidingWindowMemory(max_size=8)
+    memory.add(Message(role="system", content="sys"))
+    memory.add(Message(role="user", content="aaa"))
+
+    forked = memory.fork()
+    forked.add(Message(role="user", content="bbbb"))
+    memory.add(Message(role="user", content="cc"))
+
+    assert isinstance(forked, SlidingWindowMemory)
+    assert forked.max_size == 8
+    assert [msg.content for msg in forked.snapshot()] == ["sys", "bbbb"]
+    assert [msg.content for msg in memory.snapshot()] == ["sys", "aaa", "cc"]
+    assert (forked.version, forked.size) == (3, 7)
+
+
+def test_sliding_window_keeps_an_oversized_newest_message() -> None:
+    memory = SlidingWindowMemory(max_size=4, size_fn=lambda msg: len(msg.content.split()))
+    memory.add(Message(role="user", content="one two"))
+    memory.add(Message(role="assistant", content="a b c d e f"))
+
+    assert [msg.content for msg in memory.get_conversation()] == ["a b c d e f"]
+    assert memory.size == 6
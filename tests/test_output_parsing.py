@@ -3,7 +3,14 @@ from typing import Any, Callable, cast
 from pytest import MonkeyPatch
 
 from ai_agent_orchestrator.protocol import outputs
-from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput, parse_output
+from ai_agent_orchestrator.protocol.outputs import (
+    DecodedResponse,
+    FinalOutput,
+    ToolCallOutput,
+    ToolCallsOutput,
+    decode_output,
+    parse_output,
+)
 
 
 def test_parse_tool_call() -> None:
@@ -24,6 +31,30 @@ def test_parse_final() -> None:
     assert parsed.content == "ok"
 
 
+def test_parse_tool_calls() -> None:
+    raw = (
+        '{"type":"tool_calls","calls":['
+        '{"tool_name":"math.add","args":{"a":1,"b":2}},'
+        '{"tool_name":"echo","args":null}]}'
+    )
+    parsed = parse_output(raw)
+    assert isinstance(parsed, ToolCallsOutput)
+    assert [call.tool_name for call in parsed.calls] == ["math.add", "echo"]
+    assert parsed.calls[1].args == {}
+
+
+def test_invalid_tool_calls_fallback_to_final() -> None:
+    for raw in (
+        '{"type":"tool_calls","calls":[]}',
+        '{"type":"tool_calls","calls":[{"tool_name":""}]}',
+        '{"type":"tool_calls","calls":[{"tool_name":"echo","args":[1]}]}',
+        '{"type":"tool_calls","calls":"echo"}',
+    ):
+        parsed = parse_output(raw)
+        assert isinstance(parsed, FinalOutput)
+        assert parsed.content == raw
+
+
 def test_invalid_json_fallbacks_to_final() -> None:
     parsed = parse_output("not json")
     assert isinstance(parsed, FinalOutput)
@@ -80,3 +111,31 @@ def test_final_content_surrogate_fallback(monkeypatch: MonkeyPatch) -> None:
     parsed = parse_output(raw)
     assert isinstance(parsed, FinalOutput)
     assert parsed.content == '{"bad": "\\ud800"}'
+
+
+def test_decode_output_carries_classification() -> None:
+    decoded = decode_output(
+        '{"type": "tool_call", "tool_name": "math.add", "args": {"b": 2, "a": 1}}'
+    )
+    assert decoded.is_valid
+    assert decoded.parsed_type == "tool_call"
+    assert decoded.metadata == {"tool_name": "math.add", "args_keys": ["a", "b"]}
+
+    invalid = decode_output('{"type": "tool_call", "args": {}}')
+    assert not invalid.is_valid
+    assert invalid.parsed_type == "invalid"
+    assert invalid.metadata == {}
+    assert isinstance(invalid.output, FinalOutput)
+
+
+def test_decode_output_reuses_attached_decode(monkeypatch: MonkeyPatch) -> None:
+    raw = '{"type": "final", "content": "ok"}'
+    response = DecodedResponse(raw, decode_output(raw))
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("response was decoded twice")
+
+    monkeypatch.setattr(outputs, "from_json", fail)
+
+    assert response == raw
+    assert decode_output(response) is response.decoded
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent, AgentEventType
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import ListEventSink
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCall, ToolCallsOutput
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+from ai_agent_orchestrator.utils.errors import ToolExecutionError
+
+
+class SlowInput(ToolInput):
+    label: str
+    delay: float = 0.05
+
+
+class SlowTool(Tool[SlowInput]):
+    name = "slow"
+    description = "Sleeps, then returns its label."
+    input_model = SlowInput
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def run(self, validated_input: SlowInput) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(validated_input.delay)
+            if validated_input.label == "boom":
+                raise ValueError("boom")
+            return validated_input.label
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _calls_output(*labels: tuple[str, float]) -> str:
+    return ToolCallsOutput(
+        type="tool_calls",
+        calls=[
+            ToolCall(tool_name="slow", args={"label": label, "delay": delay})
+            for label, delay in labels
+        ],
+    ).model_dump_json()
+
+
+def _build_agent(
+    labels: list[tuple[str, float]], max_tool_concurrency: int = 4
+) -> tuple[Agent, SlowTool]:
+    llm = FakeLLM(
+        [_calls_output(*labels), FinalOutput(type="final", content="Done").model_dump_json()]
+    )
+    tool = SlowTool()
+    tools = ToolRegistry()
+    tools.register(tool)
+    agent = Agent(
+        llm=llm,
+        tools=tools,
+        memory=InMemoryMemory(),
+        max_tool_concurrency=max_tool_concurrency,
+    )
+    return agent, tool
+
+
+def test_run_async_executes_calls_concurrently_in_call_order() -> None:
+    agent, tool = _build_agent([("a", 0.15), ("b", 0.05), ("c", 0.1)])
+    sink = ListEventSink()
+
+    response = asyncio.run(agent.run_async("go", event_sink=sink))
+
+    assert response.content == "Done"
+    assert tool.peak == 3
+    tool_messages = [msg for msg in agent.memory.get_conversation() if msg.role == "tool"]
+    assert [msg.content for msg in tool_messages] == ["a", "b", "c"]
+    results = [event for event in response.events if event.type == AgentEventType.TOOL_RESULT]
+    assert [event.content for event in results] == ["a", "b", "c"]
+
+    step_started = next(
+        event for event in sink.events if event.name == "agent.step.started"
+    )
+    started = [event for event in sink.events if event.name == "agent.tool.started"]
+    finished = [event for event in sink.events if event.name == "agent.tool.finished"]
+    assert len(started) == len(finished) == 3
+    assert len({event.span_id for event in started}) == 3
+    assert {event.span_id for event in started} == {event.span_id for event in finished}
+    assert all(
+        event.parent_span_id == step_started.span_id for event in started + finished
+    )
+    parsed = next(event for event in sink.events if event.name == "agent.output.parsed")
+    assert parsed.data["parsed_type"] == "tool_calls"
+    assert parsed.data["tool_names"] == ["slow", "slow", "slow"]
+    step_finished = [event for event in sink.events if event.name == "agent.step.finished"]
+    assert step_finished[0].data == {"outcome": "tool_calls"}
+
+
+def test_max_tool_concurrency_bounds_parallelism() -> None:
+    agent, tool = _build_agent([(str(i), 0.03) for i in range(6)], max_tool_concurrency=2)
+
+    asyncio.run(agent.run_async("go"))
+
+    assert tool.peak == 2
+
+
+def test_stream_async_runs_parallel_calls() -> None:
+    agent, tool = _build_agent([("a", 0.05), ("b", 0.05)])
+
+    async def collect() -> str:
+        return "".join([chunk.text async for chunk in agent.stream_async("go")])
+
+    assert asyncio.run(collect()) == "Done"
+    assert tool.peak == 2
+
+
+def test_sync_run_executes_calls_sequentially() -> None:
+    agent, tool = _build_agent([("a", 0.01), ("b", 0.01)])
+
+    response = agent.run("go")
+
+    assert response.content == "Done"
+    assert tool.peak == 1
+    tool_messages = [msg for msg in agent.memory.get_conversation() if msg.role == "tool"]
+    assert [msg.content for msg in tool_messages] == ["a", "b"]
+
+
+def test_failed_call_raises_after_all_calls_finish() -> None:
+    agent, _ = _build_agent([("slow-ok", 0.1), ("boom", 0.01)])
+    sink = ListEventSink()
+
+    with pytest.raises(ToolExecutionError):
+        asyncio.run(agent.run_async("go", event_sink=sink))
+
+    finished = {
+        event.data["status"] for event in sink.events if event.name == "agent.tool.finished"
+    }
+    assert finished == {"ok", "error"}
+    assert not [msg for msg in agent.memory.get_conversation() if msg.role == "tool"]
+    assert sink.events[-1].name == "agent.run.failed"
+
+
+def test_max_tool_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_tool_concurrency"):
+        Agent(llm=FakeLLM(), tools=ToolRegistry(), memory=InMemoryMemory(), max_tool_concurrency=0)
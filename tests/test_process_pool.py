@@ -0,0 +1,132 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools import Tool, ToolInput, ToolProcessPool, ToolRegistry
+from ai_agent_orchestrator.utils.errors import ToolExecutionError, ToolTimeoutError
+
+
+class WorkInput(ToolInput):
+    seconds: float = 0.0
+    spin: bool = False
+    fail: bool = False
+
+
+class WorkTool(Tool[WorkInput]):
+    name = "work"
+    description = "Busy-waits or sleeps, then reports the worker pid."
+    input_model = WorkInput
+    run_in_process = True
+
+    def run(self, validated_input: WorkInput) -> str:
+        if validated_input.fail:
+            raise ValueError("boom")
+        if validated_input.spin:
+            while True:
+                pass
+        time.sleep(validated_input.seconds)
+        return str(os.getpid())
+
+
+def _registry(pool: ToolProcessPool, timeout_s: float | None = None) -> ToolRegistry:
+    tools = ToolRegistry(process_pool=pool)
+    tools.register(WorkTool(), timeout_s=timeout_s)
+    return tools
+
+
+def test_process_tools_run_in_recycled_workers() -> None:
+    with ToolProcessPool(max_workers=1, max_calls_per_worker=2, preload=[__name__]) as pool:
+        tools = _registry(pool)
+        pids = [tools.run("work", {}) for _ in range(3)]
+
+    assert str(os.getpid()) not in pids
+    assert pids[0] == pids[1] != pids[2]
+    assert pool.recycled == 1
+
+
+def test_overdue_worker_is_killed_and_replaced() -> None:
+    with ToolProcessPool(max_workers=1, preload=[__name__]) as pool:
+        tools = _registry(pool, timeout_s=0.3)
+        with pytest.raises(ToolTimeoutError):
+            tools.run("work", {"spin": True})
+        with pytest.raises(ToolExecutionError, match="boom"):
+            tools.run("work", {"fail": True})
+        assert tools.run("work", {}).isdigit()
+
+    assert pool.killed == 1
+
+
+def test_concurrent_async_calls_use_separate_workers() -> None:
+    with ToolProcessPool(max_workers=2, preload=[__name__]) as pool:
+        tools = _registry(pool)
+
+        async def run_pair() -> tuple[list[str], float]:
+            started = time.perf_counter()
+            pids = await asyncio.gather(
+                tools.run_async("work", {"seconds": 0.3}),
+                tools.run_async("work", {"seconds": 0.3}),
+            )
+            return list(pids), time.perf_counter() - started
+
+        pids, elapsed = asyncio.run(run_pair())
+
+    assert len(set(pids)) == 2
+    assert elapsed < 0.55
+
+
+class RefusingExecutor(ThreadPoolExecutor):
+    def submit(self, *args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("the default executor was used")
+
+
+def test_async_calls_wait_without_default_executor_threads() -> None:
+    with ToolProcessPool(max_workers=2, preload=[__name__]) as pool:
+
+        async def run_many() -> list[str]:
+            asyncio.get_running_loop().set_default_executor(RefusingExecutor())
+            return await asyncio.gather(
+                *(pool.run_async(WorkTool(), WorkInput(seconds=0.05)) for _ in range(8))
+            )
+
+        pids = asyncio.run(run_many())
+        with pytest.raises(ToolTimeoutError):
+            asyncio.run(pool.run_async(WorkTool(), WorkInput(spin=True), timeout_s=0.2))
+
+    assert len(set(pids)) == 2
+    assert pool.killed == 1
+
+
+def test_agent_timeout_kills_runaway_process_tool() -> None:
+    llm = FakeLLM(
+        [
+            ToolCallOutput(
+                type="tool_call", tool_name="work", args={"spin": True}
+            ).model_dump_json(),
+            FinalOutput(type="final", content="Done").model_dump_json(),
+        ]
+    )
+    with ToolProcessPool(max_workers=1, preload=[__name__]) as pool:
+        agent = Agent(llm=llm, tools=_registry(pool, timeout_s=0.3), memory=InMemoryMemory())
+        with pytest.raises(ToolTimeoutError):
+            asyncio.run(agent.run_async("go"))
+        deadline = time.monotonic() + 2.0
+        while pool.killed == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert pool.killed == 1
+
+
+def test_unpicklable_tools_are_rejected() -> None:
+    tool = WorkTool()
+    tool.callback = lambda: None  # type: ignore[attr-defined]
+    with ToolProcessPool(max_workers=1) as pool:
+        with pytest.raises(TypeError, match="picklable"):
+            pool.run(tool, WorkInput())
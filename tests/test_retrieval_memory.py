@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import Any, Sequence
+
+import pytest
+
+from ai_agent_orchestrator.protocol.messages import Message
+
+if importlib.util.find_spec("numpy") is None:
+    pytest.skip("numpy not installed; retrieval extra not enabled", allow_module_level=True)
+
+from ai_agent_orchestrator.memory.retrieval import (  # noqa: E402
+    HashedNgramEmbedder,
+    RetrievalMemory,
+)
+
+FACTS = [
+    "the database password lives in config.yaml",
+    "weather today is sunny and warm",
+    "the build uses hatchling for packaging",
+    "lunch options include pizza and salad",
+]
+
+
+def _memory(**kwargs: Any) -> RetrievalMemory:
+    memory = RetrievalMemory(**kwargs)
+    memory.add(Message(role="system", content="sys"))
+    for fact in FACTS:
+        memory.add(Message(role="tool", content=fact, name="notes"))
+    return memory
+
+
+def test_conversation_has_system_tail_and_relevant_older_messages() -> None:
+    memory = _memory(recent_messages=2, top_k=1)
+    memory.add(Message(role="user", content="Where is the database password?"))
+
+    conversation = memory.get_conversation()
+
+    assert [m.content for m in conversation] == [
+        "sys",
+        FACTS[0],
+        FACTS[3],
+        "Where is the database password?",
+    ]
+    assert len(memory) == 6
+    assert memory.messages_since(4) == (
+        Message(role="tool", content=FACTS[3], name="notes"),
+        Message(role="user", content="Where is the database password?"),
+    )
+
+
+def test_index_grows_incrementally_and_matches_a_fresh_index() -> None:
+    memory = _memory(recent_messages=1, top_k=2, embed_batch_size=2)
+    memory.add(Message(role="user", content="which tool builds the package?"))
+    memory.snapshot()
+    assert memory.indexed == 4
+
+    memory.add(Message(role="tool", content="packaging metadata lives in pyproject", name="n"))
+    memory.add(Message(role="tool", content="unrelated", name="n"))
+    incremental = memory.snapshot()
+    assert memory.indexed == 6
+
+    fresh = _memory(recent_messages=1, top_k=2)
+    for message in list(memory.messages_since(5)):
+        fresh.add(message)
+    assert fresh.snapshot() == incremental
+    assert FACTS[2] in [m.content for m in incremental]
+
+
+def test_search_many_scores_queries_together() -> None:
+    memory = _memory(recent_messages=0, top_k=1)
+
+    weather, build = memory.search_many(["sunny weather", "hatchling build"])
+
+    assert [m.content for m, _ in weather] == [FACTS[1]]
+    assert [m.content for m, _ in build] == [FACTS[2]]
+    assert memory.search("sunny weather") == weather
+    assert memory.search("", top_k=3) == []
+
+
+def test_custom_embedder_and_hashed_embedder_shape() -> None:
+    vectors = HashedNgramEmbedder(dim=32)(["hello world", ""])
+    assert vectors.shape == (2, 32)
+    assert abs(float((vectors[0] ** 2).sum()) - 1.0) < 1e-5
+    assert not vectors[1].any()
+
+    seen: list[Sequence[str]] = []
+
+    def embedder(texts: Sequence[str]) -> Any:
+        seen.append(texts)
+        return HashedNgramEmbedder(dim=16)(texts)
+
+    memory = _memory(embedder=embedder, recent_messages=0, top_k=1)
+    memory.add(Message(role="user", content="pizza"))
+    assert memory.snapshot()[1].content == FACTS[3]
+    assert seen
+
+
+def test_fork_keeps_settings_and_embeddings() -> None:
+    memory = _memory(recent_messages=1, top_k=1)
+    memory.add(Message(role="user", content="Where is the database password?"))
+    expected = memory.get_conversation()
+
+    forked = memory.fork()
+    forked.add(Message(role="tool", content="the password was rotated", name="notes"))
+    forked.add(Message(role="user", content="what is for lunch?"))
+
+    assert isinstance(forked, RetrievalMemory)
+    assert (forked.recent_messages, forked.top_k) == (1, 1)
+    assert forked.indexed == memory.indexed
+    assert memory.get_conversation() == expected
+    assert [m.content for m in forked.get_conversation()] == [
+        "sys",
+        FACTS[3],
+        "what is for lunch?",
+    ]
@@ -0,0 +1,240 @@
+import asyncio
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.base import SharedPrefix
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput
+from ai_agent_orchestrator.sessions import (
+    InMemorySessionStore,
+    JsonDirectorySessionStore,
+    SessionManager,
+)
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+def _manager(**kwargs: object) -> SessionManager:
+    agent = Agent(llm=FakeLLM(), tools=ToolRegistry(), memory=InMemoryMemory())
+    return SessionManager(agent, **kwargs)  # type: ignore[arg-type]
+
+
+def _contents(manager: SessionManager, session_id: str) -> list[str]:
+    return [msg.content for msg in manager.memory(session_id).get_conversation()]
+
+
+def test_sessions_keep_separate_conversations() -> None:
+    manager = _manager(initial_messages=[Message(role="system", content="sys")])
+
+    manager.run("a", "hello")
+    manager.run("b", "bye")
+    response = manager.run("a", "again")
+
+    assert response.content == "Echo: again"
+    assert _contents(manager, "a") == ["sys", "hello", "Echo: hello", "again", "Echo: again"]
+    assert _contents(manager, "b") == ["sys", "bye", "Echo: bye"]
+
+
+def test_lru_session_is_evicted_and_rehydrated() -> None:
+    store = InMemorySessionStore()
+    manager = _manager(store=store, max_sessions=2)
+
+    manager.run("a", "1")
+    manager.run("b", "2")
+    manager.run("a", "3")
+    manager.run("c", "4")
+
+    assert "b" not in manager
+    assert "b" in store
+    assert len(manager) == 2
+    assert manager.evictions == 1
+
+    manager.run("b", "5")
+
+    assert manager.rehydrations == 1
+    assert _contents(manager, "b") == ["2", "Echo: 2", "5", "Echo: 5"]
+    assert "a" not in manager
+    assert "c" in manager
+
+
+def test_shared_prefix_from_the_factory_is_not_duplicated_on_rehydrate() -> None:
+    prefix = SharedPrefix.system("sys")
+    manager = _manager(memory_factory=lambda: InMemoryMemory(prefix=prefix), max_sessions=1)
+
+    manager.run("a", "1")
+    manager.run("b", "2")
+    manager.run("a", "3")
+
+    assert manager.rehydrations == 1
+    assert _contents(manager, "a") == ["sys", "1", "Echo: 1", "3", "Echo: 3"]
+    assert manager.memory("a").snapshot()[0] is prefix[0]
+
+
+def test_byte_budget_evicts_cold_sessions() -> None:
+    manager = _manager(max_bytes=60)
+
+    manager.run("a", "x" * 20)
+    manager.run("b", "y" * 20)
+
+    assert "a" not in manager
+    assert "b" in manager
+    assert manager.resident_bytes <= 60
+
+
+def test_directory_store_survives_new_manager(tmp_path: Path) -> None:
+    store = JsonDirectorySessionStore(tmp_path / "sessions")
+    manager = _manager(store=store)
+    manager.run("user/1", "hello")
+    manager.flush()
+
+    restored = _manager(store=JsonDirectorySessionStore(tmp_path / "sessions"))
+
+    assert _contents(restored, "user/1") == ["hello", "Echo: hello"]
+    assert restored.rehydrations == 1
+
+
+class SlowEchoLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, conversation: Sequence[Message]) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return FinalOutput(
+            type="final", content=f"{len(conversation)}:{conversation[-1].content}"
+        ).model_dump_json()
+
+
+def test_run_async_shares_llm_and_serializes_turns_per_session() -> None:
+    llm = SlowEchoLLM()
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+    manager = SessionManager(agent, max_sessions=1)
+
+    async def run_all() -> None:
+        await asyncio.gather(
+            *(manager.run_async(f"s{i % 3}", f"m{i}") for i in range(9))
+        )
+
+    asyncio.run(run_all())
+
+    assert llm.calls == 9
+    assert len(manager) == 1
+    for index in range(3):
+        contents = _contents(manager, f"s{index}")
+        assert len(contents) == 6
+        assert [contents[i][0] for i in (1, 3, 5)] == ["1", "3", "5"]
+
+
+class SleepyEchoLLM:
+    def generate(self, conversation: Sequence[Message]) -> str:
+        time.sleep(0.02)
+        return FinalOutput(type="final", content=conversation[-1].content).model_dump_json()
+
+
+class ThreadRecordingStore(InMemorySessionStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set[int] = set()
+
+    def load(self, session_id: str) -> list[Message] | None:
+        self.threads.add(threading.get_ident())
+        return super().load(session_id)
+
+    def save(self, session_id: str, messages: Sequence[Message]) -> None:
+        self.threads.add(threading.get_ident())
+        super().save(session_id, messages)
+
+
+def test_memory_does_not_evict_the_session_it_returns() -> None:
+    manager = _manager(max_sessions=1)
+    manager.run("a", "1")
+
+    memory = manager.memory("b")
+
+    assert "a" in manager and "b" in manager
+    manager.run("b", "2")
+    assert "a" not in manager
+    assert [message.content for message in memory.get_conversation()] == ["2", "Echo: 2"]
+
+
+def test_sync_and_async_turns_of_a_session_do_not_interleave() -> None:
+    agent = Agent(llm=SleepyEchoLLM(), tools=ToolRegistry(), memory=InMemoryMemory())
+    manager = SessionManager(agent)
+
+    async def run_both() -> None:
+        sync_turn = asyncio.create_task(asyncio.to_thread(manager.run, "s", "sync"))
+        await manager.run_async("s", "async")
+        await sync_turn
+
+    asyncio.run(run_both())
+
+    roles = [message.role for message in manager.memory("s").get_conversation()]
+    assert roles == ["user", "assistant", "user", "assistant"]
+
+
+def test_a_session_can_be_used_from_several_event_loops() -> None:
+    llm = SlowEchoLLM()
+    manager = SessionManager(Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory()))
+    errors: list[BaseException] = []
+
+    def run_on_own_loop(index: int) -> None:
+        async def run_turns() -> None:
+            await asyncio.gather(*(manager.run_async("s", f"{index}{turn}") for turn in range(2)))
+
+        try:
+            asyncio.run(run_turns())
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=run_on_own_loop, args=(i,), daemon=True) for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert errors == []
+    roles = [message.role for message in manager.memory("s").get_conversation()]
+    assert roles == ["user", "assistant"] * 6
+
+
+def test_run_async_keeps_store_io_off_the_event_loop() -> None:
+    store = ThreadRecordingStore()
+    manager = _manager(store=store, max_sessions=1)
+
+    async def run_all() -> int:
+        for session_id in ("a", "b", "a"):
+            await manager.run_async(session_id, "hi")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run_all())
+
+    assert manager.evictions == 2 and manager.rehydrations == 1
+    assert store.threads and loop_thread not in store.threads
+
+
+def test_delete_removes_session_from_store() -> None:
+    store = InMemorySessionStore()
+    manager = _manager(store=store, max_sessions=1)
+    manager.run("a", "1")
+    manager.run("b", "2")
+
+    manager.delete("a")
+
+    assert "a" not in store
+    assert _contents(manager, "a") == []
+
+
+def test_invalid_budgets_are_rejected() -> None:
+    with pytest.raises(ValueError, match="max_sessions"):
+        _manager(max_sessions=0)
+    with pytest.raises(ValueError, match="max_bytes"):
+        _manager(max_bytes=0)
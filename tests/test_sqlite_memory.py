@@ -0,0 +1,148 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.sqlite import SQLiteMemoryStore
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+def _contents(messages: object) -> list[str]:
+    return [message.content for message in messages]  # type: ignore[attr-defined]
+
+
+def test_sqlite_memory_survives_reopen_and_loads_only_the_tail(tmp_path: Path) -> None:
+    path = tmp_path / "memory.db"
+    store = SQLiteMemoryStore(path)
+    memory = store.memory("s1")
+    memory.add(Message(role="system", content="sys"))
+    for index in range(10):
+        memory.add(Message(role="user", content=f"m{index}"))
+    store.memory("s2").add(Message(role="user", content="other"))
+    store.close()
+
+    reopened = SQLiteMemoryStore(path)
+    memory = reopened.memory("s1", tail_messages=3)
+
+    assert _contents(memory.snapshot()) == ["sys", "m7", "m8", "m9"]
+    assert (len(memory), memory.version) == (4, 11)
+    assert len(memory) == len(memory.snapshot())
+    assert _contents(memory.messages_since(9)) == ["m8", "m9"]
+    assert _contents(memory.messages_since(2)) == [f"m{index}" for index in range(1, 10)]
+    assert _contents(memory.history(0, 3)) == ["sys", "m0", "m1"]
+    memory.add(Message(role="assistant", content="next"))
+    assert _contents(memory.snapshot()) == ["sys", "m8", "m9", "next"]
+    assert sorted(reopened.session_ids()) == ["s1", "s2"]
+    reopened.close()
+
+
+def test_sqlite_memory_fork_copies_the_whole_session(tmp_path: Path) -> None:
+    store = SQLiteMemoryStore(tmp_path / "memory.db")
+    memory = store.memory("s", tail_messages=2, batch_size=8)
+    memory.add(Message(role="system", content="sys"))
+    for index in range(4):
+        memory.add(Message(role="user", content=f"m{index}"))
+
+    forked = memory.fork("copy")
+    forked.add(Message(role="user", content="fork"))
+    memory.add(Message(role="user", content="parent"))
+
+    assert (forked.session_id, forked.batch_size) == ("copy", 8)
+    assert _contents(forked.snapshot()) == ["sys", "m3", "fork"]
+    assert _contents(forked.history()) == ["sys", "m0", "m1", "m2", "m3", "fork"]
+    assert _contents(memory.snapshot()) == ["sys", "m3", "parent"]
+    assert memory.fork().session_id.startswith("s/")
+    with pytest.raises(ValueError, match="already has messages"):
+        memory.fork("copy")
+    store.close()
+
+
+def test_sqlite_memory_group_commits_writes(tmp_path: Path) -> None:
+    store = SQLiteMemoryStore(tmp_path / "memory.db")
+    first = store.memory("a", batch_size=100)
+    second = store.memory("b", batch_size=2)
+
+    for index in range(5):
+        first.add(Message(role="user", content=f"a{index}"))
+    second.add(Message(role="user", content="b0"))
+    assert store.commits == 0
+    second.add(Message(role="user", content="b1"))
+    assert store.commits == 1
+
+    second.add(Message(role="user", content="b2"))
+    store.flush()
+    assert store.commits == 2
+    assert _contents(first.history()) == [f"a{index}" for index in range(5)]
+    assert _contents(second.history()) == ["b0", "b1", "b2"]
+    store.close()
+
+
+def test_a_session_is_opened_once(tmp_path: Path) -> None:
+    store = SQLiteMemoryStore(tmp_path / "memory.db")
+    memory = store.memory("s")
+    memory.add(Message(role="user", content="m0"))
+
+    again = store.memory("s", tail_messages=5)
+    again.add(Message(role="user", content="m1"))
+    store.flush()
+
+    assert again is memory
+    assert _contents(memory.history()) == ["m0", "m1"]
+    store.close()
+
+
+def test_failed_commit_keeps_only_the_failing_sessions_messages(tmp_path: Path) -> None:
+    path = tmp_path / "memory.db"
+    store = SQLiteMemoryStore(path)
+    first = store.memory("a", batch_size=100)
+    second = store.memory("b", batch_size=100)
+    first.add(Message(role="user", content="a0"))
+    second.add(Message(role="user", content="b0"))
+    # Another writer takes b's first row, so the group commit fails on its primary key.
+    other = sqlite3.connect(str(path))
+    with other:
+        other.execute("INSERT INTO messages VALUES ('b', 0, 'user', 'taken', NULL)")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.flush()
+
+    # Session a is committed on its own; b's message stays buffered.
+    assert store.commits == 1
+    assert _contents(first.history()) == ["a0"]
+    with other:
+        other.execute("DELETE FROM messages WHERE session_id = 'b'")
+    other.close()
+    store.flush()
+    assert _contents(first.history()) == ["a0"]
+    assert _contents(second.history()) == ["b0"]
+    store.close()
+
+
+def test_synchronous_must_be_a_known_level(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        SQLiteMemoryStore(tmp_path / "memory.db", synchronous="NORMAL; DROP TABLE messages")
+
+
+def test_agent_commits_once_per_step(tmp_path: Path) -> None:
+    store = SQLiteMemoryStore(tmp_path / "memory.db")
+    memory = store.memory("session")
+    llm = FakeLLM(
+        [
+            '{"type":"tool_call","tool_name":"echo","args":{"message":"hi"}}',
+            '{"type":"final","content":"done"}',
+        ]
+    )
+    from ai_agent_orchestrator.tools.builtin.echo_tool import EchoTool
+
+    tools = ToolRegistry()
+    tools.register(EchoTool())
+
+    Agent(llm=llm, tools=tools, memory=memory).run("go")
+
+    # Step 1 commits the user message, step 2 the tool exchange, then the final answer.
+    assert store.commits == 3
+    assert _contents(store.memory("session").history())[-1] == "done"
+    store.close()
@@ -0,0 +1,195 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Sequence
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import LLMStreamChunk
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.streaming import FinalContentDecoder, StreamChunk
+from ai_agent_orchestrator.tools.builtin.echo_tool import EchoTool
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+class ScriptedStreamingLLM:
+    """Streams scripted responses and records how many chunks were pulled."""
+
+    def __init__(self, responses: list[list[str]]) -> None:
+        self._responses = responses
+        self.pulled = 0
+
+    def generate(self, conversation: Sequence[Message]) -> str:
+        return "".join(self._responses.pop(0))
+
+    async def stream(
+        self, conversation: Sequence[Message]
+    ) -> AsyncIterator[LLMStreamChunk]:
+        for chunk in self._responses.pop(0):
+            self.pulled += 1
+            yield LLMStreamChunk(content=chunk)
+        yield LLMStreamChunk(content="", is_final=True)
+
+
+def _feed_all(raw: str, size: int) -> tuple[str, FinalContentDecoder]:
+    decoder = FinalContentDecoder()
+    parts = [decoder.feed(raw[i : i + size]) for i in range(0, len(raw), size)]
+    return "".join(parts), decoder
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_decoder_matches_json_decoding_for_any_split(size: int) -> None:
+    content = 'Line "one"\n\ttab \\ slash / é 😀 end'
+    raw = json.dumps({"type": "final", "content": content})
+
+    decoded, decoder = _feed_all(raw, size)
+
+    assert decoded == content
+    assert decoder.done is True
+
+
+def test_decoder_allows_whitespace_between_tokens() -> None:
+    decoded, decoder = _feed_all('  { "type" : "final" ,\n "content" : "hi"}', 2)
+
+    assert decoded == "hi"
+    assert decoder.done is True
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"type":"tool_call","tool_name":"echo","args":{}}',
+        '{"content":"hi","type":"final"}',
+        "plain text answer",
+    ],
+)
+def test_decoder_stays_silent_without_final_prefix(raw: str) -> None:
+    decoded, decoder = _feed_all(raw, 3)
+
+    assert decoded == ""
+    assert decoder.failed is True
+
+
+def test_incremental_stream_yields_before_provider_finishes() -> None:
+    raw = FinalOutput(type="final", content="Hello world").model_dump_json()
+    llm = ScriptedStreamingLLM([[raw[:30], raw[30:35], raw[35:]]])
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+
+    async def collect() -> list[tuple[str, bool, int]]:
+        seen: list[tuple[str, bool, int]] = []
+        async for chunk in agent.stream_async("Hi", stream_mode="incremental"):
+            seen.append((chunk.text, chunk.is_final, llm.pulled))
+        return seen
+
+    seen = asyncio.run(collect())
+
+    assert "".join(text for text, _, _ in seen) == "Hello world"
+    assert [is_final for _, is_final, _ in seen].count(True) == 1
+    assert seen[-1][1] is True
+    assert seen[0][2] < 3
+    assert agent.memory.get_conversation()[-1].content == "Hello world"
+
+
+def test_incremental_stream_buffers_tool_calls() -> None:
+    tool_call = ToolCallOutput(
+        type="tool_call", tool_name="echo", args={"message": "ping"}
+    ).model_dump_json()
+    final = FinalOutput(type="final", content="Done").model_dump_json()
+    llm = ScriptedStreamingLLM([[tool_call[:10], tool_call[10:]], [final[:20], final[20:]]])
+    tools = ToolRegistry()
+    tools.register(EchoTool())
+    agent = Agent(llm=llm, tools=tools, memory=InMemoryMemory())
+
+    async def collect() -> list[str]:
+        return [
+            chunk.text
+            async for chunk in agent.stream_async("Hi", stream_mode="incremental")
+        ]
+
+    texts = asyncio.run(collect())
+
+    assert "".join(texts) == "Done"
+    assert all("tool_call" not in text for text in texts)
+    tool_messages = [msg for msg in agent.memory.get_conversation() if msg.role == "tool"]
+    assert [msg.content for msg in tool_messages] == ["ping"]
+
+
+def test_incremental_stream_plain_text_falls_back_to_buffered() -> None:
+    llm = ScriptedStreamingLLM([["olá", " mundo"]])
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+
+    async def collect() -> str:
+        text = ""
+        async for chunk in agent.stream_async("Oi", stream_mode="incremental"):
+            text += chunk.text
+        return text
+
+    assert asyncio.run(collect()) == "olá mundo"
+
+
+def test_stream_mode_is_validated() -> None:
+    agent = Agent(llm=ScriptedStreamingLLM([]), tools=ToolRegistry(), memory=InMemoryMemory())
+
+    async def consume() -> None:
+        async for _ in agent.stream_async("Hi", stream_mode="eager"):  # type: ignore[arg-type]
+            pass
+
+    with pytest.raises(ValueError, match="stream_mode"):
+        asyncio.run(consume())
+
+
+def _replay(chunks: list[StreamChunk]) -> str:
+    """What a consumer honoring `reset` ends up showing."""
+    shown = ""
+    for chunk in chunks:
+        shown = chunk.text if chunk.reset else shown + chunk.text
+    return shown
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"type":"final","content":"Hello"} trailing garbage',
+        '{"type":"final","content":"Hel',
+    ],
+)
+def test_incremental_stream_corrects_content_that_fails_to_parse(raw: str) -> None:
+    llm = ScriptedStreamingLLM([[raw[:20], raw[20:]]])
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+
+    async def collect() -> list[StreamChunk]:
+        return [chunk async for chunk in agent.stream_async("Hi", stream_mode="incremental")]
+
+    chunks = asyncio.run(collect())
+
+    assert any(chunk.text and not chunk.reset for chunk in chunks[:-1])
+    assert chunks[-1].reset is True and chunks[-1].is_final is True
+    stored = agent.memory.get_conversation()[-1].content
+    assert stored == raw
+    assert _replay(chunks) == stored
+
+
+def test_incremental_stream_retracts_a_final_prefix_that_parses_as_a_tool_call() -> None:
+    raw = (
+        '{"type":"final","content":"Hi","type":"tool_call",'
+        '"tool_name":"echo","args":{"message":"ping"}}'
+    )
+    final = FinalOutput(type="final", content="Done").model_dump_json()
+    llm = ScriptedStreamingLLM([[raw[:30], raw[30:]], [final]])
+    tools = ToolRegistry()
+    tools.register(EchoTool())
+    agent = Agent(llm=llm, tools=tools, memory=InMemoryMemory())
+
+    async def collect() -> list[StreamChunk]:
+        return [chunk async for chunk in agent.stream_async("Hi", stream_mode="incremental")]
+
+    chunks = asyncio.run(collect())
+
+    first_step = [chunk for chunk in chunks if chunk.step == 1]
+    assert first_step[0].text == "Hi"
+    assert first_step[-1] == StreamChunk(text="", step=1, reset=True)
+    assert _replay(first_step) == ""
+    assert _replay([chunk for chunk in chunks if chunk.step == 2]) == "Done"
+    assert [m.content for m in agent.memory.get_conversation() if m.role == "tool"] == ["ping"]
@@ -30,10 +30,10 @@ def test_files_tools_allow_within_root(tmp_path: Path) -> None:
     entries = json.loads(list_tool.run(list_tool.validate({"path": str(workspace)})))
     assert "sample.txt" in entries
 
-    results = json.loads(
-        search_tool.run(search_tool.validate({"path": str(sample), "query": "world"}))
-    )
-    assert results == [{"line": 2, "text": "world"}]
+    results = search_tool.run(search_tool.validate({"path": str(sample), "query": "world"}))
+    assert results == "line,text\n2,world"
+    missing = search_tool.run(search_tool.validate({"path": str(sample), "query": "nope"}))
+    assert missing == "No matches."
 
 
 def test_files_tools_reject_outside_root(tmp_path: Path) -> None:
@@ -93,3 +93,7 @@ def test_tasks_alias_matches_list_output(tmp_path: Path) -> None:
     alias_output = registry.run("tasks", {})
 
     assert alias_output == list_output
+    # Savings are measured against the indented JSON the tool used to return.
+    tasks = json.loads(tasks_path.read_text(encoding="utf-8"))
+    execution = registry.execute("tasks.list", {})
+    assert execution.raw_chars == len(json.dumps(tasks, ensure_ascii=False, indent=2))
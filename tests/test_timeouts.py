@@ -0,0 +1,171 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM, LLMStreamChunk
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import ListEventSink
+from ai_agent_orchestrator.protocol.messages import Message
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+from ai_agent_orchestrator.utils.errors import AgentTimeoutError, ToolTimeoutError
+
+
+class SleepInput(ToolInput):
+    delay: float
+
+
+class SleepTool(Tool[SleepInput]):
+    name = "sleep"
+    description = "Sleeps for the given delay."
+    input_model = SleepInput
+    timeout_s = 0.05
+
+    def run(self, validated_input: SleepInput) -> str:
+        time.sleep(validated_input.delay)
+        return "awake"
+
+
+class HangingLLM:
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def generate(self, conversation: Sequence[Message]) -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "unreachable"
+
+
+class StallingStreamLLM:
+    """Streams the start of a final answer, then stalls until cancelled."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def generate(self, conversation: Sequence[Message]) -> str:
+        raise AssertionError("stream_async should use stream()")
+
+    async def stream(self, conversation: Sequence[Message]) -> AsyncIterator[LLMStreamChunk]:
+        try:
+            yield LLMStreamChunk(content='{"type": "final", "content": "partial')
+            await asyncio.sleep(10)
+            yield LLMStreamChunk(content='"}', is_final=True)
+        finally:
+            self.closed = True
+
+
+def _sleep_call(delay: float) -> str:
+    return ToolCallOutput(
+        type="tool_call", tool_name="sleep", args={"delay": delay}
+    ).model_dump_json()
+
+
+def _final(content: str) -> str:
+    return FinalOutput(type="final", content=content).model_dump_json()
+
+
+def _tools(timeout_s: float | None = None) -> ToolRegistry:
+    tools = ToolRegistry()
+    tools.register(SleepTool(), timeout_s=timeout_s)
+    return tools
+
+
+def test_run_timeout_cancels_in_flight_model_call() -> None:
+    llm = HangingLLM()
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory(), run_timeout_s=0.05)
+    sink = ListEventSink()
+
+    started = time.perf_counter()
+    with pytest.raises(AgentTimeoutError) as excinfo:
+        asyncio.run(agent.run_async("Hi", event_sink=sink))
+
+    assert time.perf_counter() - started < 1.0
+    assert isinstance(excinfo.value, TimeoutError)
+    assert llm.cancelled
+    assert sink.events[-1].name == "agent.run.failed"
+    assert sink.events[-1].data == {"error_type": "AgentTimeoutError", "status": "timeout"}
+
+
+def test_tool_timeout_fails_run_with_timeout_status() -> None:
+    llm = FakeLLM([_sleep_call(0.5), _final("Done")])
+    agent = Agent(llm=llm, tools=_tools(), memory=InMemoryMemory())
+    sink = ListEventSink()
+
+    with pytest.raises(ToolTimeoutError, match="sleep"):
+        asyncio.run(agent.run_async("Hi", event_sink=sink))
+
+    finished = [event for event in sink.events if event.name == "agent.tool.finished"]
+    assert finished[-1].data["status"] == "timeout"
+    assert finished[-1].data["error_type"] == "ToolTimeoutError"
+    assert sink.events[-1].data["status"] == "timeout"
+
+
+def test_registry_timeout_overrides_tool_default() -> None:
+    tools = _tools(timeout_s=1.0)
+    llm = FakeLLM([_sleep_call(0.1), _final("Done")])
+    agent = Agent(llm=llm, tools=tools, memory=InMemoryMemory())
+
+    response = asyncio.run(agent.run_async("Hi"))
+
+    assert response.content == "Done"
+    assert tools.timeout_for("sleep") == 1.0
+    assert tools.timeout_for("missing") is None
+    with pytest.raises(ValueError, match="timeout_s"):
+        tools.register(SleepTool(), timeout_s=0)
+
+
+def test_run_deadline_interrupts_waiting_on_a_tool() -> None:
+    llm = FakeLLM([_sleep_call(0.3), _final("Done")])
+    agent = Agent(
+        llm=llm, tools=_tools(timeout_s=5.0), memory=InMemoryMemory(), run_timeout_s=0.05
+    )
+    sink = ListEventSink()
+
+    with pytest.raises(AgentTimeoutError):
+        asyncio.run(agent.run_async("Hi", event_sink=sink))
+
+    finished = [event for event in sink.events if event.name == "agent.tool.finished"]
+    assert finished[-1].data["status"] == "timeout"
+    assert finished[-1].data["error_type"] == "AgentTimeoutError"
+
+
+def test_stream_timeout_closes_provider_stream() -> None:
+    llm = StallingStreamLLM()
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory(), run_timeout_s=0.05)
+    received: list[str] = []
+
+    async def consume() -> None:
+        async for chunk in agent.stream_async("Hi", stream_mode="incremental"):
+            received.append(chunk.text)
+
+    with pytest.raises(AgentTimeoutError):
+        asyncio.run(consume())
+
+    assert received == ["partial"]
+    assert llm.closed
+
+
+def test_abandoned_stream_closes_provider_stream() -> None:
+    llm = StallingStreamLLM()
+    agent = Agent(llm=llm, tools=ToolRegistry(), memory=InMemoryMemory())
+
+    async def first_chunk() -> str:
+        stream = agent.stream_async("Hi", stream_mode="incremental")
+        chunk = await anext(stream)
+        await stream.aclose()
+        return chunk.text
+
+    assert asyncio.run(first_chunk()) == "partial"
+    assert llm.closed
+
+
+def test_run_timeout_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="run_timeout_s"):
+        Agent(llm=FakeLLM(), tools=ToolRegistry(), memory=InMemoryMemory(), run_timeout_s=0)
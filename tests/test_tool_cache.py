@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import ListEventSink
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.cache import ToolResultCache
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+from ai_agent_orchestrator.utils.errors import ToolExecutionError
+from task_runner_app.tools import build_tool_registry
+
+
+class LookupInput(ToolInput):
+    key: str
+    limit: int = 10
+
+
+class LookupTool(Tool[LookupInput]):
+    name = "lookup"
+    description = "Counts executions."
+    input_model = LookupInput
+    cacheable = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def run(self, validated_input: LookupInput) -> str:
+        self.calls += 1
+        if validated_input.key == "fail":
+            raise ValueError("nope")
+        return f"{validated_input.key}:{self.calls}"
+
+    def cache_tags(self, validated_input: LookupInput) -> Iterable[str]:
+        return [f"key:{validated_input.key}"]
+
+
+class TouchTool(Tool[LookupInput]):
+    name = "touch"
+    description = "Invalidates a key."
+    input_model = LookupInput
+
+    def run(self, validated_input: LookupInput) -> str:
+        return "touched"
+
+    def invalidates(self, validated_input: LookupInput) -> Iterable[str]:
+        return [f"key:{validated_input.key}"]
+
+
+class FakeMonotonic:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _registry(cache: ToolResultCache) -> tuple[ToolRegistry, LookupTool]:
+    registry = ToolRegistry(cache=cache)
+    tool = LookupTool()
+    registry.register(tool)
+    registry.register(TouchTool())
+    return registry, tool
+
+
+def test_cacheable_tool_runs_once_for_equivalent_args() -> None:
+    cache = ToolResultCache()
+    registry, tool = _registry(cache)
+
+    first = registry.execute("lookup", {"key": "a"})
+    second = registry.execute("lookup", {"limit": 10, "key": "a"})
+
+    assert first.content == second.content == "a:1"
+    assert (first.cached, second.cached) == (False, True)
+    assert tool.calls == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeMonotonic()
+    cache = ToolResultCache(ttl_s=10, clock=clock)
+    registry, tool = _registry(cache)
+
+    registry.run("lookup", {"key": "a"})
+    clock.now = 11
+    assert registry.run("lookup", {"key": "a"}) == "a:2"
+    assert cache.stats.expirations == 1
+
+
+def test_lru_eviction_bounds_entries() -> None:
+    cache = ToolResultCache(max_entries=2)
+    registry, tool = _registry(cache)
+
+    registry.run("lookup", {"key": "a"})
+    registry.run("lookup", {"key": "b"})
+    registry.run("lookup", {"key": "a"})
+    registry.run("lookup", {"key": "c"})
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert registry.execute("lookup", {"key": "a"}).cached is True
+    assert registry.execute("lookup", {"key": "b"}).cached is False
+
+
+def test_invalidation_by_tag_and_tool_name() -> None:
+    cache = ToolResultCache()
+    registry, tool = _registry(cache)
+    registry.run("lookup", {"key": "a"})
+    registry.run("lookup", {"key": "b"})
+
+    registry.run("touch", {"key": "a"})
+
+    assert registry.execute("lookup", {"key": "a"}).cached is False
+    assert registry.execute("lookup", {"key": "b"}).cached is True
+    assert registry.invalidate_cache(tool_name="lookup") == 2
+    assert len(cache) == 0
+
+
+def test_results_computed_across_an_invalidation_are_not_stored() -> None:
+    cache = ToolResultCache()
+    since = cache.sequence
+
+    cache.invalidate(tags=["path:/a"])
+    cache.put("read a", "old", "lookup", ["path:/a"], since=since)
+    cache.put("read b", "fresh", "lookup", ["path:/b"], since=since)
+
+    assert cache.get("read a") is None
+    assert cache.get("read b") == "fresh"
+    since = cache.sequence
+    cache.clear()
+    cache.put("read b", "fresh", "lookup", ["path:/b"], since=since)
+    assert cache.get("read b") is None
+
+
+def test_errors_are_not_cached_and_uncached_registry_always_runs() -> None:
+    cache = ToolResultCache()
+    registry, tool = _registry(cache)
+
+    for _ in range(2):
+        with pytest.raises(ToolExecutionError):
+            registry.run("lookup", {"key": "fail"})
+    assert tool.calls == 2
+
+    plain = ToolRegistry()
+    plain_tool = LookupTool()
+    plain.register(plain_tool)
+    plain.run("lookup", {"key": "a"})
+    plain.run("lookup", {"key": "a"})
+    assert plain_tool.calls == 2
+
+
+def test_tool_finished_event_reports_cache_hits() -> None:
+    call = ToolCallOutput(type="tool_call", tool_name="lookup", args={"key": "a"})
+    llm = FakeLLM(
+        [
+            call.model_dump_json(),
+            call.model_dump_json(),
+            FinalOutput(type="final", content="ok").model_dump_json(),
+        ]
+    )
+    registry, tool = _registry(ToolResultCache())
+    sink = ListEventSink()
+
+    Agent(llm=llm, tools=registry, memory=InMemoryMemory()).run("go", event_sink=sink)
+
+    cached = [
+        event.data["cached"] for event in sink.events if event.name == "agent.tool.finished"
+    ]
+    assert cached == [False, True]
+    assert tool.calls == 1
+
+
+def test_task_runner_writes_invalidate_cached_reads(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    registry = build_tool_registry(tmp_path, workspace, cache=ToolResultCache())
+    target = str(workspace / "notes" / "a.txt")
+
+    registry.run("files.write_text", {"path": target, "content": "one"})
+    assert registry.run("files.read_text", {"path": target}) == "one"
+    assert json.loads(registry.run("files.list_dir", {"path": str(workspace)})) == ["notes"]
+
+    registry.run("files.write_text", {"path": str(workspace / "b.txt"), "content": "x"})
+    registry.run("files.write_text", {"path": target, "content": "two"})
+
+    assert registry.run("files.read_text", {"path": target}) == "two"
+    assert json.loads(registry.run("files.list_dir", {"path": str(workspace)})) == [
+        "b.txt",
+        "notes",
+    ]
+
+    assert registry.run("tasks.list", {}) == "No tasks."
+    registry.run("tasks.add", {"title": "Ship"})
+    assert registry.run("tasks", {}) == "title,notes,priority\nShip,,normal"
+    assert registry.run("tasks.list", {}) == "title,notes,priority\nShip,,normal"
+
+
+def test_task_tags_match_file_tags_through_a_symlink(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    (workspace / "data").mkdir(parents=True)
+    stored = workspace / "data" / "tasks.json"
+    stored.write_text("[]")
+    (workspace / "tasks.json").symlink_to(stored)
+    registry = build_tool_registry(tmp_path, workspace, cache=ToolResultCache())
+
+    assert registry.run("tasks.list", {}) == "No tasks."
+    tasks = json.dumps([{"title": "Ship", "notes": "", "priority": "normal"}])
+    registry.run("files.write_text", {"path": str(stored), "content": tasks})
+
+    assert registry.run("tasks.list", {}) == "title,notes,priority\nShip,,normal"
@@ -0,0 +1,88 @@
+import json
+import pickle
+
+import pytest
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import AgentEvent
+from ai_agent_orchestrator.tools.base import Tool, ToolInput
+from ai_agent_orchestrator.tools.encoding import (
+    EncodedOutput,
+    compact_json,
+    records_table,
+    truncate,
+)
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+def test_compact_json_reports_plain_json_size() -> None:
+    encoded = compact_json({"names": ["é", "b"]})
+
+    assert encoded == '{"names":["é","b"]}'
+    assert encoded.raw_chars == len('{"names": ["é", "b"]}')
+
+
+def test_records_table_renders_csv_rows() -> None:
+    records = [{"line": 1, "text": "a, b"}, {"line": 2, "text": None, "tags": ["x"]}]
+
+    encoded = records_table(records)
+
+    assert encoded == 'line,text,tags\n1,"a, b",\n2,,"[""x""]"'
+    assert records_table(records, columns=["text"]) == 'text\n"a, b"\n""'
+    assert records_table([]) == ""
+    indented = json.dumps(records, ensure_ascii=False, indent=2)
+    assert records_table(records, raw_indent=2).raw_chars == len(indented)
+    copied = pickle.loads(pickle.dumps(encoded))
+    assert isinstance(copied, EncodedOutput)
+    assert copied.raw_chars == encoded.raw_chars
+
+
+@pytest.mark.parametrize("budget", [0, 10, 40, 99])
+def test_truncate_keeps_head_and_tail_within_budget(budget: int) -> None:
+    text = "".join(str(i % 10) for i in range(100))
+
+    truncated = truncate(text, budget)
+
+    assert len(truncated) <= budget
+    if budget >= 40:
+        assert "chars omitted" in truncated
+        assert truncated.startswith("0123")
+        assert truncated.endswith("789")
+    assert truncate(text, 100) == text
+
+
+class ListInput(ToolInput):
+    count: int
+
+
+class ListTool(Tool[ListInput]):
+    name = "list"
+    description = "Lists numbered records."
+    input_model = ListInput
+    output_char_budget = 60
+
+    def run(self, validated_input: ListInput) -> str:
+        return records_table([{"n": i, "label": f"item-{i}"} for i in range(validated_input.count)])
+
+
+def test_agent_reports_raw_and_encoded_sizes() -> None:
+    registry = ToolRegistry()
+    registry.register(ListTool())
+    llm = FakeLLM(
+        [
+            '{"type":"tool_call","tool_name":"list","args":{"count":20}}',
+            '{"type":"final","content":"done"}',
+        ]
+    )
+    memory = InMemoryMemory()
+    events: list[AgentEvent] = []
+
+    Agent(llm=llm, tools=registry, memory=memory).run("go", event_sink=events.append)
+
+    finished = next(event for event in events if event.name == "agent.tool.finished")
+    tool_message = next(msg for msg in memory.get_conversation() if msg.role == "tool")
+    assert finished.data["output_chars"] == len(tool_message.content) <= 60
+    assert finished.data["raw_chars"] > 500
+    assert tool_message.content.startswith("n,label\n0,item-0")
@@ -1,6 +1,8 @@
+from typing import Any
+
 import pytest
 
-from ai_agent_orchestrator.tools.builtin.echo_tool import EchoTool
+from ai_agent_orchestrator.tools.builtin.echo_tool import EchoInput, EchoTool
 from ai_agent_orchestrator.tools.builtin.math_tool import MathAddTool
 from ai_agent_orchestrator.tools.registry import ToolRegistry
 from ai_agent_orchestrator.utils.errors import ToolExecutionError, ToolNotFoundError
@@ -37,3 +39,75 @@ def test_registry_iter_tools_preserves_order() -> None:
     tool_names = [tool.name for tool in registry.iter_tools()]
 
     assert tool_names == ["echo", "math.add"]
+
+
+class StrictEchoTool(EchoTool):
+    def validate(self, args: dict[str, Any]) -> EchoInput:
+        if "message" not in args:
+            raise ValueError("message is required")
+        return super().validate({"message": str(args["message"]).upper()})
+
+
+def test_registry_honours_custom_validate_hooks() -> None:
+    registry = ToolRegistry()
+    registry.register(StrictEchoTool())
+
+    assert registry.run("echo", {"message": "hi"}) == "HI"
+    with pytest.raises(ToolExecutionError, match="message is required"):
+        registry.run("echo", {})
+
+
+def test_registry_resolves_aliases_to_the_same_tool() -> None:
+    registry = ToolRegistry()
+    registry.register(EchoTool(), timeout_s=2.0, aliases=["say"])
+
+    assert registry.run("say", {"message": "hi"}) == "hi"
+    assert registry.get("say") is registry.get("echo")
+    assert registry.timeout_for("say") == 2.0
+    assert len(registry) == 1
+    with pytest.raises(ValueError, match="clashes"):
+        registry.register(MathAddTool(), aliases=["echo"])
+
+
+class AliasNamedTool(MathAddTool):
+    name = "add"
+
+
+def test_registry_rejects_aliases_owned_by_another_tool() -> None:
+    registry = ToolRegistry()
+    registry.register(EchoTool(), aliases=["say", "add"])
+
+    with pytest.raises(ValueError, match="already registered for 'echo'"):
+        registry.register(MathAddTool(), aliases=["say"])
+    with pytest.raises(ValueError, match="clashes with an alias of 'echo'"):
+        registry.register(AliasNamedTool())
+    assert registry.get("say").name == "echo"
+    assert registry.get("add").name == "echo"
+    assert len(registry) == 1
+
+    # Registering the same tool again replaces its aliases.
+    registry.register(EchoTool(), aliases=["say"])
+    assert registry.get("say").name == "echo"
+    with pytest.raises(ToolNotFoundError):
+        registry.get("add")
+
+
+def test_frozen_registry_precompiles_catalog_and_dispatch() -> None:
+    registry = ToolRegistry()
+    registry.register(EchoTool(), aliases=["say"])
+    registry.register(MathAddTool(), max_concurrency=2)
+
+    frozen = registry.freeze()
+    registry.register(StrictEchoTool())
+
+    assert len(frozen) == 2
+    assert frozen.run("say", {"message": "hi"}) == "hi"
+    assert frozen.freeze() is frozen
+    echo, add = frozen.catalog
+    assert (echo.name, echo.aliases, echo.is_async) == ("echo", ("say",), True)
+    assert echo.input_schema["required"] == ["message"]
+    assert (add.name, add.max_concurrency, add.cacheable) == ("math.add", 2, False)
+    with pytest.raises(TypeError, match="immutable"):
+        frozen.register(EchoTool())
+    with pytest.raises(ToolNotFoundError):
+        frozen.get("missing")
@@ -0,0 +1,85 @@
+import asyncio
+
+from ai_agent_orchestrator.agent import Agent
+from ai_agent_orchestrator.llm import FakeLLM
+from ai_agent_orchestrator.memory.in_memory import InMemoryMemory
+from ai_agent_orchestrator.observability.events import ListEventSink
+from ai_agent_orchestrator.observability.tracing import NULL_TRACER, RunTracer, create_tracer
+from ai_agent_orchestrator.protocol.outputs import FinalOutput, ToolCallOutput
+from ai_agent_orchestrator.tools.builtin.math_tool import MathAddTool
+from ai_agent_orchestrator.tools.registry import ToolRegistry
+
+
+class CountingCalls:
+    def __init__(self) -> None:
+        self.clock_calls = 0
+        self.id_calls = 0
+
+    def clock(self) -> int:
+        self.clock_calls += 1
+        return 0
+
+    def new_id(self) -> str:
+        self.id_calls += 1
+        return "id"
+
+
+def _agent() -> Agent:
+    tool_call = ToolCallOutput(
+        type="tool_call", tool_name="math.add", args={"a": 1, "b": 2}
+    ).model_dump_json()
+    final = FinalOutput(type="final", content="3").model_dump_json()
+    tools = ToolRegistry()
+    tools.register(MathAddTool())
+    return Agent(llm=FakeLLM([tool_call, final]), tools=tools, memory=InMemoryMemory())
+
+
+def test_create_tracer_without_sink_returns_null_tracer() -> None:
+    counts = CountingCalls()
+
+    tracer = create_tracer(None, counts.clock, counts.new_id, counts.new_id)
+
+    assert tracer is NULL_TRACER
+    assert tracer.enabled is False
+    assert tracer.new_span() == ""
+    tracer.emit("agent.run.started", 0, "", None, {"max_steps": 1})
+    assert counts.clock_calls == 0
+    assert counts.id_calls == 0
+
+
+def test_run_tracer_stamps_events() -> None:
+    sink = ListEventSink()
+    counts = CountingCalls()
+
+    tracer = create_tracer(sink, counts.clock, lambda: "run_1", counts.new_id)
+    tracer.emit("agent.step.started", 2, tracer.new_span(), "parent")
+
+    assert isinstance(tracer, RunTracer)
+    event = sink.events[0]
+    assert (event.run_id, event.step, event.span_id, event.parent_span_id) == (
+        "run_1",
+        2,
+        "id",
+        "parent",
+    )
+    assert event.data == {}
+
+
+def test_agent_without_sink_skips_clock_and_id_factories() -> None:
+    counts = CountingCalls()
+
+    response = _agent().run(
+        "add", clock=counts.clock, run_id_factory=counts.new_id, span_id_factory=counts.new_id
+    )
+    async_response = asyncio.run(
+        _agent().run_async(
+            "add",
+            clock=counts.clock,
+            run_id_factory=counts.new_id,
+            span_id_factory=counts.new_id,
+        )
+    )
+
+    assert response.content == async_response.content == "3"
+    assert counts.clock_calls == 0
+    assert counts.id_calls == 0